@@ -1,13 +1,19 @@
 import streamlit as st
 import os
 import json
-import pandas as pd
+import time
+import html
+import numpy as np
 from parsers.resume_parser import ResumeParser
 from parsers.jd_parser import JDParser
 from extractors.keyword_extractor import KeywordExtractor
 from matcher.scorer import Scorer
-from utils.llm_client import LLMClient
-from utils.email_client import EmailClient
+from matcher.results import ResultTable
+from pipeline.batch import extract_parallel
+from pipeline.cache import ParseCache, content_hash, parser_fingerprint
+from pipeline.isolation import SAFE_START_METHOD
+from pipeline.metrics import Metrics
+from pipeline.taxonomy import load_taxonomy
 
 # Page Config
 st.set_page_config(page_title="Resume Screener Pro", page_icon="📄", layout="wide")
@@ -47,20 +53,66 @@ st.markdown("""
 
 # Load Configuration
 @st.cache_data
-def load_data():
+def load_config():
     with open('data/config.json', 'r') as f:
-        config = json.load(f)
-    with open('data/skills_taxonomy.json', 'r') as f:
-        skills = json.load(f)
-    return config, skills
+        return json.load(f)
 
-config, skills_taxonomy = load_data()
+config = load_config()
 
 # Initialize Components
-resume_parser = ResumeParser()
-jd_parser = JDParser()
-keyword_extractor = KeywordExtractor(skills_taxonomy)
-scorer = Scorer(config['weights'])
+# Held across reruns and sessions; loading the compiled taxonomy and opening the cache happen once per process.
+@st.cache_resource
+def load_components():
+    taxonomy = load_taxonomy('data/skills_taxonomy.json', config.get('taxonomy', {}).get('artifact_path'))
+    return (
+        taxonomy.skills_taxonomy,
+        ResumeParser(**config.get('parsing', {})),
+        JDParser(),
+        KeywordExtractor(taxonomy.skills_taxonomy, taxonomy.matcher),
+        Scorer(config['weights']),
+        ParseCache(
+            config['cache']['path'],
+            taxonomy.fingerprint,
+            config['cache']['max_size_mb'] * 1024 * 1024,
+            parser_fingerprint(config.get('parsing'))
+        )
+    )
+
+# Stage timings of everything this server process has screened, sent or generated
+@st.cache_resource
+def get_metrics():
+    return Metrics()
+
+metrics = get_metrics()
+
+# The LLM and email clients (and openai/firebase_admin with them) are only
+# imported once a key or credentials file is actually provided
+@st.cache_resource
+def get_llm_client(api_key):
+    from utils.llm_client import LLMClient
+    from utils.llm_cache import ResponseCache
+
+    llm_config = config.get('llm', {})
+    cache = None
+    if llm_config.get('cache_path'):
+        cache = ResponseCache(llm_config['cache_path'], llm_config.get('cache_ttl_hours', 168) * 3600)
+    return LLMClient(
+        api_key,
+        base_url=llm_config.get('base_url', "https://openrouter.ai/api/v1"),
+        model=llm_config.get('model', "google/gemini-flash-1.5"),
+        cache=cache,
+        max_concurrency=llm_config.get('max_concurrency', 4),
+        max_retries=llm_config.get('max_retries', 3),
+        metrics=metrics
+    )
+
+@st.cache_resource
+def get_email_client(cred_path):
+    from utils.email_client import EmailClient
+
+    return EmailClient(cred_path, metrics=metrics)
+
+skills_taxonomy, resume_parser, jd_parser, keyword_extractor, scorer, parse_cache = load_components()
 
 # Sidebar Inputs
 with st.sidebar:
@@ -90,14 +142,54 @@ with st.sidebar:
     process_btn = st.button("Start Screening", type="primary", use_container_width=True)
 
 # Initialize Optional Clients
-llm_client = LLMClient(openrouter_key) if openrouter_key else None
+llm_client = get_llm_client(openrouter_key) if openrouter_key else None
 email_client = None
 if firebase_cred_path and os.path.exists(firebase_cred_path):
     try:
-        email_client = EmailClient(firebase_cred_path)
+        email_client = get_email_client(firebase_cred_path)
     except Exception as e:
         st.sidebar.error(f"Firebase Init Error: {e}")
 
+# Session State
+# Results survive reruns triggered by other widgets (e.g. the per-candidate buttons).
+# They live in a columnar `ResultTable` for the current JD fingerprint, with one
+# row per upload fingerprint, so only uploads that were not screened yet against
+# the current JD get processed. Resume text is not kept in the session; it is
+# read back from the parse cache by content hash when needed.
+if "screening" not in st.session_state:
+    st.session_state.screening = {"active": False, "jd_fp": None, "table": None, "rows": {}}
+if "questions" not in st.session_state:
+    st.session_state.questions = {}
+screening = st.session_state.screening
+
+def upload_fingerprint(uploaded_file):
+    return f"{uploaded_file.name}:{content_hash(uploaded_file.getbuffer())}"
+
+def load_resume_text(key):
+    return parse_cache.get(key)[0]
+
+def skill_chips(skills, css_class):
+    """All of a candidate's chips as one HTML block (one element, not one per skill)."""
+    return " ".join(f'<span class="{css_class}">{html.escape(s)}</span>' for s in skills)
+
+def screen_uploads(new_uploads, on_progress):
+    """
+    Parses the uploads in isolated worker processes with the per-file time and
+    memory budgets from config, so one pathological document cannot hang the app.
+    Yields `(fingerprint, result)`; results carry the resume's skills, and
+    files over budget come back as skipped.
+    """
+    # Views of the upload buffers; the pool writes them to the workers without copying
+    sources = [(f.name, memoryview(f.getbuffer())) for _, f in new_uploads]
+    workers = min(len(sources), os.cpu_count() or 1)
+    for done, (index, res) in enumerate(extract_parallel(
+            sources, skills_taxonomy, workers, cache=parse_cache,
+            parser_options=config.get('parsing'), limits=config.get('limits'),
+            matcher=keyword_extractor.matcher, start_method=SAFE_START_METHOD)):
+        on_progress(done + 1)
+        fp, _ = new_uploads[index]
+        yield fp, res
+
 st.title("📄 AI Resume Insights")
 st.markdown("---")
 
@@ -107,121 +199,210 @@ if process_btn:
     elif not uploaded_files:
         st.error("⚠️ Please upload at least one résumé.")
     else:
+        screening["active"] = True
+
+if screening["active"] and jd_text and uploaded_files:
+    jd_data = jd_parser.parse(jd_text)
+    compiled_jd = scorer.compile_jd(jd_data, keyword_extractor)
+
+    jd_fp = content_hash(jd_text.encode("utf-8"))
+    if jd_fp != screening["jd_fp"]:
+        screening["jd_fp"] = jd_fp
+        screening["table"] = ResultTable(compiled_jd, load_resume_text)
+        screening["rows"] = {}
+        st.session_state.questions = {}
+
+    # Drop rows for removed uploads, then screen only the new ones
+    current = {upload_fingerprint(f): f for f in uploaded_files}
+    rows = screening["rows"]
+    if any(fp not in current for fp in rows):
+        kept = [fp for fp in rows if fp in current]
+        screening["table"] = screening["table"].take([rows[fp] for fp in kept])
+        screening["rows"] = rows = {fp: i for i, fp in enumerate(kept)}
+    table = screening["table"]
+    new_uploads = [(fp, f) for fp, f in current.items() if fp not in rows]
+
+    # Display JD Stats
+    col1, col2 = st.columns(2)
+    col1.metric("Required Skills", compiled_jd.required_total)
+    col2.metric("Preferred Skills", compiled_jd.preferred_total)
+    st.divider()
+
+    if new_uploads:
         with st.spinner("Analyzing candidates..."):
-            # ... (Parsing JD & Resumes - same as before)
-            jd_data = jd_parser.parse(jd_text)
+            # Process Loop
+            progress_bar = st.progress(0)
             
-            # Display JD Stats
-            col1, col2 = st.columns(2)
-            col1.metric("Required Skills", len(jd_data['required_skills']))
-            col2.metric("Preferred Skills", len(jd_data['preferred_skills']))
-            st.divider()
+            on_progress = lambda done: progress_bar.progress(done / len(new_uploads))
+            for fp, res in screen_uploads(new_uploads, on_progress):
+                if "error" in res:
+                    st.error(f"Error processing {res['name']}: {res['error']}")
+                elif "skipped" in res:
+                    st.warning(f"Skipped {res['name']}: {res['skipped']}")
+                else:
+                    resume_skills = set(res['skills'])
+                    rows[fp] = len(table)
+                    start = time.perf_counter()
+                    score_data = scorer.score(resume_skills, compiled_jd, res['experience_years'])
+                    timings = res['timings']
+                    timings['score'] = time.perf_counter() - start
+                    metrics.record_file(res['name'], timings)
+                    table.append(current[fp].name, resume_skills, score_data,
+                                 text_key=fp.rpartition(":")[2],
+                                 experience_years=res['experience_years'], email=res['email'])
+
+    # Sort Results (in upload order first, so ties keep the upload order)
+    upload_order = [rows[fp] for fp in current if fp in rows]
+    ranked = table.take(upload_order)
+    order = ranked.order()
+
+    # Interview questions and invites for the whole shortlist at once
+    if len(ranked):
+        q1, q2, q3 = st.columns([1, 2, 2])
+        shortlist_size = q1.number_input("Shortlist size", min_value=1, max_value=len(ranked),
+                                         value=min(5, len(ranked)))
+        q2.write("")
+        q3.write("")
+        if q2.button(f"Generate Interview Questions for Top {shortlist_size}"):
+            if llm_client:
+                shortlist = [(ranked.names[i], ranked.row(i)['details']['missing_required'])
+                             for i in order[:shortlist_size]]
+                with st.spinner("Generating questions..."):
+                    st.session_state.questions.update(
+                        llm_client.generate_interview_questions_bulk(shortlist, jd_text)
+                    )
+            else:
+                st.warning("Please enter OpenRouter API Key in sidebar.")
+        if q3.button(f"Send Interview Invites to Top {shortlist_size}"):
+            if email_client:
+                shortlist = [(ranked.names[i], ranked.emails[i]) for i in order[:shortlist_size]]
+                no_email = [name for name, email in shortlist if not email]
+                if no_email:
+                    st.warning(f"No email address found in: {', '.join(no_email)}")
+                with st.spinner("Queueing invites..."):
+                    reports = email_client.send_invites([c for c in shortlist if c[1]], "Senior Developer")
+                queued = sum(r['status'] == "queued" for r in reports)
+                already = sum(r['status'] == "already_queued" for r in reports)
+                st.success(f"{queued} invites queued, {already} already queued.")
+                for r in reports:
+                    if r['status'] == "failed":
+                        st.error(f"Failed to queue invite for {r['name']}: {r['error']}")
+            else:
+                st.warning("Firebase credentials not configured.")
+
+    # Summary of every candidate: one dataframe element however large the pool
+    page_ranks = []
+    if len(ranked):
+        st.write("### 📋 All Candidates")
+        f1, f2 = st.columns([2, 1])
+        name_filter = f1.text_input("Filter by name", "").strip().lower()
+        min_score = f2.slider("Minimum score", 0, 100, 0)
+        keep = ranked.column("total_score")[order] >= min_score
+        if name_filter:
+            keep &= np.array([name_filter in ranked.names[i].lower() for i in order], dtype=bool)
+        # Ranks are positions in the full ranking, so they stay put while filtering
+        ranks = np.flatnonzero(keep)
+        order = order[keep]
+        summary = ranked.to_dataframe().iloc[order]
+        summary.insert(0, "rank", ranks + 1)
+        st.dataframe(summary.round(1), hide_index=True)
 
-            results = []
+        # Detailed views only for the visible page
+        p1, p2, p3 = st.columns([1, 1, 2])
+        page_size = p1.selectbox("Candidates per page", [10, 25, 50, 100])
+        pages = max(1, -(-len(order) // page_size))
+        page = p2.number_input("Page", min_value=1, max_value=pages, value=1)
+        page_start = (page - 1) * page_size
+        p3.caption(f"Showing {min(page_start + 1, len(order))}–{min(page_start + page_size, len(order))} "
+                   f"of {len(order)} candidates")
+        page_ranks = ranks[page_start:page_start + page_size]
+        order = order[page_start:page_start + page_size]
+
+    # Display Detailed Results; per-candidate details are only built here
+    for rank, i in zip(page_ranks, order):
+        data = ranked.row(i)
+        score = data['total_score']
+        name = ranked.names[i]
+        years = ranked.experience_years(i)
+        candidate_email = ranked.emails[i]
+        
+        with st.expander(f"**{name}** - Score: {score}/100", expanded=(rank == 0)):
             
-            # Process Loop
-            if not os.path.exists("temp"):
-                os.makedirs("temp")
+            # Top Level Metrics
+            m1, m2, m3, m4 = st.columns(4)
+            m1.metric("Match Score", f"{score}%")
+            m2.metric("Required", f"{data['breakdown']['required']}%")
+            m3.metric("Preferred", f"{data['breakdown']['preferred']}%")
+            m4.metric("Experience", f"{data['breakdown']['experience']}",
+                      f"{years:g} yrs" if years is not None else "not stated", delta_color="off")
             
-            progress_bar = st.progress(0)
+            st.write("### 🔍 Skill Gap Analysis")
             
-            for i, uploaded_file in enumerate(uploaded_files):
-                temp_path = os.path.join("temp", uploaded_file.name)
-                with open(temp_path, "wb") as f:
-                    f.write(uploaded_file.getbuffer())
-                
-                try:
-                    resume_text = resume_parser.parse(temp_path)
-                    resume_skills = keyword_extractor.extract_skills(resume_text)
-                    result = scorer.score(resume_skills, jd_data)
+            c1, c2 = st.columns(2)
+            with c1:
+                st.write("**✅ Matched Skills**")
+                if data['details']['matched_required']:
+                    st.markdown(skill_chips(data['details']['matched_required'], "skill-chip-matched"),
+                                unsafe_allow_html=True)
+                else:
+                    st.caption("No required skills matched.")
                     
-                    results.append({
-                        "name": uploaded_file.name,
-                        "data": result,
-                        "text": resume_text # Store text for LLM
-                    })
+            with c2:
+                st.write("**❌ Missing Critical Skills**")
+                if data['details']['missing_required']:
+                    st.markdown(skill_chips(data['details']['missing_required'], "skill-chip-missing"),
+                                unsafe_allow_html=True)
+                else:
+                    st.caption("All required skills present! 🎉")
                     
-                except Exception as e:
-                    st.error(f"Error processing {uploaded_file.name}: {e}")
-                finally:
-                    if os.path.exists(temp_path):
-                        os.remove(temp_path)
-                
-                progress_bar.progress((i + 1) / len(uploaded_files))
+            st.write("---")
             
-            # Sort Results
-            results.sort(key=lambda x: x['data']['total_score'], reverse=True)
+            # AI & Automation Section
+            st.write("### 🤖 AI & Automation")
             
-            # Display Detailed Results
-            for res in results:
-                data = res['data']
-                score = data['total_score']
-                name = res['name']
-                
-                with st.expander(f"**{name}** - Score: {score}/100", expanded=(res == results[0])):
-                    
-                    # Top Level Metrics
-                    m1, m2, m3, m4 = st.columns(4)
-                    m1.metric("Match Score", f"{score}%")
-                    m2.metric("Required", f"{data['breakdown']['required']}%")
-                    m3.metric("Preferred", f"{data['breakdown']['preferred']}%")
-                    m4.metric("Experience", f"{data['breakdown']['experience']}")
-                    
-                    st.write("### 🔍 Skill Gap Analysis")
-                    
-                    c1, c2 = st.columns(2)
-                    with c1:
-                        st.write("**✅ Matched Skills**")
-                        if data['details']['matched_required']:
-                            for s in data['details']['matched_required']:
-                                st.markdown(f'<span class="skill-chip-matched">{s}</span>', unsafe_allow_html=True)
-                        else:
-                            st.caption("No required skills matched.")
-                            
-                    with c2:
-                        st.write("**❌ Missing Critical Skills**")
-                        if data['details']['missing_required']:
-                            for s in data['details']['missing_required']:
-                                st.markdown(f'<span class="skill-chip-missing">{s}</span>', unsafe_allow_html=True)
+            a1, a2 = st.columns(2)
+            
+            with a1:
+                if st.button(f"Generate Interview Questions for {name}", key=f"btn_q_{name}"):
+                    if llm_client:
+                        with st.spinner("Generating questions..."):
+                            st.session_state.questions[name] = llm_client.generate_interview_questions(
+                                data['details']['missing_required'], 
+                                jd_text
+                            )
+                    else:
+                        st.warning("Please enter OpenRouter API Key in sidebar.")
+                if name in st.session_state.questions:
+                    st.info(st.session_state.questions[name])
+                        
+            with a2:
+                if st.button(f"Send Interview Invite to {name}", key=f"btn_e_{name}"):
+                    if email_client and not candidate_email:
+                        st.warning("No email address found in this résumé.")
+                    elif email_client:
+                        success, msg = email_client.send_invite(name, candidate_email, "Senior Developer")
+                        if success:
+                            st.success(msg)
                         else:
-                            st.caption("All required skills present! 🎉")
-                            
-                    st.write("---")
-                    
-                    # AI & Automation Section
-                    st.write("### 🤖 AI & Automation")
-                    
-                    a1, a2 = st.columns(2)
-                    
-                    with a1:
-                        if st.button(f"Generate Interview Questions for {name}", key=f"btn_q_{name}"):
-                            if llm_client:
-                                with st.spinner("Generating questions..."):
-                                    questions = llm_client.generate_interview_questions(
-                                        name, 
-                                        data['details']['missing_required'], 
-                                        jd_text
-                                    )
-                                    st.info(questions)
-                            else:
-                                st.warning("Please enter OpenRouter API Key in sidebar.")
-                                
-                    with a2:
-                        if st.button(f"Send Interview Invite to {name}", key=f"btn_e_{name}"):
-                            if email_client:
-                                # Mock email for demo if not extracted from resume
-                                candidate_email = "candidate@example.com" 
-                                success, msg = email_client.send_invite(name, candidate_email, "Senior Developer")
-                                if success:
-                                    st.success(msg)
-                                else:
-                                    st.error(msg)
-                            else:
-                                st.warning("Firebase credentials not configured.")
-
-                    if data['details']['missing_required']:
-                        st.warning(f"To increase score, candidate needs: **{', '.join(data['details']['missing_required'])}**.")
+                            st.error(msg)
+                    else:
+                        st.warning("Firebase credentials not configured.")
+
+            if data['details']['missing_required']:
+                st.warning(f"To increase score, candidate needs: **{', '.join(data['details']['missing_required'])}**.")
+
+    if metrics.samples:
+        with st.expander("⏱️ Performance"):
+            import pandas as pd
 
+            summary = pd.DataFrame(metrics.summary()).T
+            summary[["total", "mean", "p50", "p90", "p99", "max"]] *= 1000
+            st.dataframe(summary.rename(columns=lambda c: c if c == "count" else f"{c} (ms)").round(1))
+            outliers = metrics.outliers()
+            if outliers:
+                st.write("**Slowest files**")
+                for o in outliers:
+                    st.caption(f"{o['name']}: {o['seconds'] * 1000:.0f} ms ({o['x_median']:.1f}× median)")
             
 else:
     st.markdown("""
@@ -0,0 +1,92 @@
+"""
+DOCX text extraction: streaming parser vs. python-docx.
+
+Builds synthetic DOCX files of increasing size (paragraphs, a table and a
+large embedded image) and compares the streaming `ResumeParser._extract_docx`
+with the previous python-docx implementation on time and peak memory.
+Peak memory includes the extracted text itself, which grows with the
+paragraph count; the streaming parser's own working set does not.
+
+Usage:
+    python benchmarks/bench_docx_extraction.py
+"""
+import io
+import os
+import random
+import struct
+import sys
+import time
+import tracemalloc
+import zlib
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from docx import Document
+
+from parsers.resume_parser import ResumeParser
+
+PARAGRAPH_COUNTS = [100, 1000, 10000]
+IMAGE_SIDE = 1024
+
+
+def noise_png(side: int, rng: random.Random) -> bytes:
+    """An incompressible grayscale PNG, to stand in for embedded photos/logos."""
+    raw = b"".join(b"\x00" + rng.randbytes(side) for _ in range(side))
+
+    def chunk(kind, data):
+        return struct.pack(">I", len(data)) + kind + data + struct.pack(">I", zlib.crc32(kind + data))
+
+    header = struct.pack(">IIBBBBB", side, side, 8, 0, 0, 0, 0)
+    return b"\x89PNG\r\n\x1a\n" + chunk(b"IHDR", header) + chunk(b"IDAT", zlib.compress(raw)) + chunk(b"IEND", b"")
+
+
+def synthetic_docx(paragraphs: int, image: bytes, rng: random.Random) -> bytes:
+    words = ["python", "docker", "led", "team", "delivered", "sql", "kubernetes", "the", "and", "platform"]
+    doc = Document()
+    doc.sections[0].header.paragraphs[0].text = "Jane Doe - jane@example.com"
+    doc.add_picture(io.BytesIO(image))
+    for _ in range(paragraphs):
+        doc.add_paragraph(" ".join(rng.choice(words) for _ in range(20)))
+    table = doc.add_table(rows=10, cols=3)
+    for row in table.rows:
+        for cell in row.cells:
+            cell.text = rng.choice(words)
+    out = io.BytesIO()
+    doc.save(out)
+    return out.getvalue()
+
+
+def python_docx_extract(data: bytes) -> str:
+    doc = Document(io.BytesIO(data))
+    return "\n".join(para.text for para in doc.paragraphs).strip()
+
+
+def measure(fn, data: bytes):
+    tracemalloc.start()
+    start = time.perf_counter()
+    text = fn(data)
+    elapsed = (time.perf_counter() - start) * 1000
+    peak = tracemalloc.get_traced_memory()[1] / (1024 * 1024)
+    tracemalloc.stop()
+    return elapsed, peak, len(text)
+
+
+def main():
+    rng = random.Random(42)
+    image = noise_png(IMAGE_SIDE, rng)
+    parser = ResumeParser()
+
+    print(f"{'paragraphs':>10} | {'size (MB)':>9} | {'python-docx ms / MB peak':>24} | {'streaming ms / MB peak':>22} | chars (old/new)")
+    print("-" * 100)
+    for count in PARAGRAPH_COUNTS:
+        data = synthetic_docx(count, image, rng)
+        old_ms, old_peak, old_chars = measure(python_docx_extract, data)
+        new_ms, new_peak, new_chars = measure(lambda d: parser.parse(d, "resume.docx"), data)
+        print(
+            f"{count:>10} | {len(data) / (1024 * 1024):>9.2f} | "
+            f"{old_ms:>12.1f} / {old_peak:>9.1f} | {new_ms:>11.1f} / {new_peak:>8.1f} | {old_chars}/{new_chars}"
+        )
+
+
+if __name__ == "__main__":
+    main()
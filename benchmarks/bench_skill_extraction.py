@@ -0,0 +1,100 @@
+"""
+Per-resume skill extraction latency as the taxonomy grows.
+
+Compares the compiled `KeywordExtractor` against the previous approach of
+running one `\\b...\\b` regex per variation. The legacy path is skipped for
+the largest taxonomies because it gets too slow to be worth waiting for.
+The profile column is the fused pass (`extract_profile`: skills plus years
+of experience, email and phone) on the same resumes.
+
+Usage:
+    python benchmarks/bench_skill_extraction.py
+"""
+import os
+import random
+import re
+import string
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from extractors.keyword_extractor import KeywordExtractor
+
+SIZES = [10, 100, 1000, 10000, 50000]
+LEGACY_MAX_SIZE = 1000
+RESUMES = 20
+
+
+def synthetic_taxonomy(variation_count: int, rng: random.Random) -> dict:
+    taxonomy = {"Synthetic": {}}
+    for i in range(variation_count):
+        word = "".join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(3, 10)))
+        taxonomy["Synthetic"].setdefault(f"Skill{i // 3}", []).append(f"{word}{i}")
+    # Keep a few real-looking variations with punctuation in the mix
+    taxonomy["Synthetic"]["C++"] = ["c++", "cpp"]
+    taxonomy["Synthetic"]["React"] = ["react", "react.js"]
+    return taxonomy
+
+
+def synthetic_resume(taxonomy: dict, rng: random.Random, words: int = 600) -> str:
+    variations = [v for vs in taxonomy["Synthetic"].values() for v in vs]
+    filler = ["experience", "team", "project", "delivered", "systems", "with", "and", "the"]
+    tokens = []
+    for _ in range(words):
+        tokens.append(rng.choice(variations) if rng.random() < 0.05 else rng.choice(filler))
+    # Contact line and a few dated roles, as found at the top of most resumes
+    header = [
+        "jane.doe@example.com | +1 (555) 010-2030",
+        "Senior Engineer, Acme Corp  Mar 2021 - Present",
+        "Engineer, Initech  06/2017 - 02/2021",
+        "Developer, Globex  2015 - 2017 (5+ years with distributed systems)",
+    ]
+    return "\n".join(header) + "\n" + " ".join(tokens)
+
+
+def legacy_extract(taxonomy: dict, text: str) -> set:
+    text_lower = text.lower()
+    found = set()
+    for skills_dict in taxonomy.values():
+        for skill_name, variations in skills_dict.items():
+            for variation in variations:
+                if re.search(r"\b" + re.escape(variation.lower()) + r"\b", text_lower):
+                    found.add(skill_name)
+                    break
+    return found
+
+
+def time_per_resume(fn, resumes) -> float:
+    start = time.perf_counter()
+    for text in resumes:
+        fn(text)
+    return (time.perf_counter() - start) / len(resumes) * 1000
+
+
+def main():
+    rng = random.Random(42)
+    print(f"{'variations':>10} | {'build (ms)':>10} | {'compiled (ms/resume)':>20} | "
+          f"{'profile (ms/resume)':>19} | {'legacy (ms/resume)':>18}")
+    print("-" * 90)
+    for size in SIZES:
+        taxonomy = synthetic_taxonomy(size, rng)
+        resumes = [synthetic_resume(taxonomy, rng) for _ in range(RESUMES)]
+
+        start = time.perf_counter()
+        extractor = KeywordExtractor(taxonomy)
+        build_ms = (time.perf_counter() - start) * 1000
+
+        compiled_ms = time_per_resume(extractor.extract_skills, resumes)
+        profile_ms = time_per_resume(extractor.extract_profile, resumes)
+        if size <= LEGACY_MAX_SIZE:
+            legacy_ms = f"{time_per_resume(lambda t: legacy_extract(taxonomy, t), resumes):18.3f}"
+        else:
+            legacy_ms = f"{'skipped':>18}"
+
+        print(f"{extractor.matcher.variation_count:>10} | {build_ms:>10.1f} | {compiled_ms:>20.3f} | "
+              f"{profile_ms:>19.3f} | {legacy_ms}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+"""
+Cold-start cost: import time and time-to-first-score.
+
+Every measurement runs in a fresh interpreter (median of several runs):
+  - importing `main` and the optional heavy backends it no longer imports eagerly,
+  - time-to-first-score: imports, config, taxonomy, parsing and scoring one
+    resume, with the compiled taxonomy artifact missing (cold) and present (warm),
+  - loading a synthetic large taxonomy from JSON vs. from its artifact.
+
+Usage:
+    python benchmarks/bench_startup.py [runs] [taxonomy_skills]
+"""
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+HEAVY_MODULES = ["PyPDF2", "docx", "openai", "firebase_admin", "pandas"]
+
+RESUME = """Jane Doe
+jane.doe@example.com | +1 (555) 010-2030
+Senior Backend Engineer, Acme Corp (Jan 2018 - Present)
+Built data pipelines in Python and SQL, deployed with Docker and Kubernetes on AWS.
+"""
+
+JD = "Required Skills:\n- Python\n- SQL\n\nPreferred Skills:\n- Docker\n- AWS\n"
+
+FIRST_SCORE = """
+import time
+start = time.perf_counter()
+import json, sys
+from parsers.resume_parser import ResumeParser
+from parsers.jd_parser import JDParser
+from extractors.keyword_extractor import KeywordExtractor
+from matcher.scorer import Scorer
+from pipeline.batch import screen_file
+from pipeline.taxonomy import load_taxonomy
+imported = time.perf_counter()
+with open('data/config.json') as f:
+    config = json.load(f)
+taxonomy = load_taxonomy(sys.argv[1], sys.argv[2] or None)
+loaded = time.perf_counter()
+extractor = KeywordExtractor(taxonomy.skills_taxonomy, taxonomy.matcher)
+scorer = Scorer(config['weights'])
+jd = scorer.compile_jd(JDParser().parse(sys.argv[3]), extractor)
+result = screen_file(sys.argv[4], ResumeParser(**config.get('parsing', {})), extractor, scorer, jd)
+done = time.perf_counter()
+print(json.dumps({"imports": imported - start, "taxonomy": loaded - imported,
+                  "first_score": done - start, "score": result["score"]}))
+"""
+
+LOAD_TAXONOMY = """
+import json, sys, time
+from pipeline.taxonomy import load_taxonomy
+start = time.perf_counter()
+load_taxonomy(sys.argv[1], sys.argv[2] or None)
+print(json.dumps({"load": time.perf_counter() - start}))
+"""
+
+
+def run_python(code, *args):
+    output = subprocess.run([sys.executable, "-c", code, *args], cwd=ROOT, check=True,
+                            capture_output=True, text=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def median_ms(samples, key):
+    return statistics.median(s[key] for s in samples) * 1000
+
+
+def import_time(module, runs):
+    code = ("import json, sys, time\nstart = time.perf_counter()\n"
+            f"import {module}\n"
+            "print(json.dumps({'t': time.perf_counter() - start, "
+            f"'heavy': [m for m in {HEAVY_MODULES!r} if m in sys.modules]}}))")
+    samples = [run_python(code) for _ in range(runs)]
+    return median_ms(samples, "t"), samples[-1]["heavy"]
+
+
+def synthetic_taxonomy(skills):
+    """`skills` made-up skills over 20 categories, with four variations each."""
+    return {
+        f"category_{c}": {
+            f"Skill {i}": [f"skill {i}", f"skill-{i}", f"skl{i}", f"skill_{i}.js"]
+            for i in range(c, skills, 20)
+        }
+        for c in range(20)
+    }
+
+
+def main():
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    taxonomy_skills = int(sys.argv[2]) if len(sys.argv) > 2 else 20000
+
+    print(f"Imports (fresh interpreter, median of {runs}):")
+    total, heavy = import_time("main", runs)
+    print(f"  {'main':<16} {total:8.1f} ms   heavy modules loaded: {', '.join(heavy) or 'none'}")
+    for module in HEAVY_MODULES:
+        try:
+            ms, _ = import_time(module, runs)
+            print(f"  {module:<16} {ms:8.1f} ms   (only paid when first needed)")
+        except subprocess.CalledProcessError:
+            print(f"  {module:<16}   not installed")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        resume_path = os.path.join(tmp, "resume.txt")
+        with open(resume_path, "w") as f:
+            f.write(RESUME)
+        artifact = os.path.join(tmp, "skills_taxonomy.pickle")
+        taxonomy_json = os.path.join(ROOT, "data", "skills_taxonomy.json")
+
+        print(f"\nTime to first score (median of {runs}):")
+        for label, artifact_path, reset in [("no artifact", "", False), ("cold artifact", artifact, True),
+                                            ("warm artifact", artifact, False)]:
+            samples = []
+            for _ in range(runs):
+                if reset and os.path.exists(artifact):
+                    os.remove(artifact)
+                samples.append(run_python(FIRST_SCORE, taxonomy_json, artifact_path, JD, resume_path))
+            print(f"  {label:<14} {median_ms(samples, 'first_score'):8.1f} ms "
+                  f"(imports {median_ms(samples, 'imports'):.1f} ms, taxonomy {median_ms(samples, 'taxonomy'):.1f} ms)")
+
+        large_json = os.path.join(tmp, "large_taxonomy.json")
+        with open(large_json, "w") as f:
+            json.dump(synthetic_taxonomy(taxonomy_skills), f)
+        large_artifact = os.path.join(tmp, "large_taxonomy.pickle")
+        run_python(LOAD_TAXONOMY, large_json, large_artifact)  # builds the artifact
+        compiled = median_ms([run_python(LOAD_TAXONOMY, large_json, "") for _ in range(runs)], "load")
+        loaded = median_ms([run_python(LOAD_TAXONOMY, large_json, large_artifact) for _ in range(runs)], "load")
+        print(f"\nTaxonomy with {taxonomy_skills:,} skills ({taxonomy_skills * 4:,} variations):")
+        print(f"  compile from JSON   {compiled:8.1f} ms")
+        print(f"  load artifact       {loaded:8.1f} ms  ({compiled / loaded:.1f}x faster, "
+              f"{os.path.getsize(large_artifact) / 1024 / 1024:.1f} MB)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,273 @@
+"""
+Benchmark suite: per-stage and end-to-end throughput, latency percentiles and
+peak memory over a synthetic corpus, with baseline comparison.
+
+The corpus comes from `benchmarks/corpus.py` and is generated once per scale
+and seed (under `.cache/bench_corpus/` by default). Stages:
+
+  jd_parse      JDParser.parse + Scorer.compile_jd, per JD
+  parse_<fmt>   ResumeParser.parse, per resume and format
+  extract       KeywordExtractor.extract_profile, per resume text
+  score         Scorer.score, per resume
+  score_batch   Scorer.score_batch over the whole pool, per call
+  end_to_end    screen_parallel / screen_file over every file, uncached
+
+Per-resume stages run on an evenly spread `--sample` of the corpus; the
+end-to-end stage and `score_batch` always cover the full scale. Peak memory
+is measured with tracemalloc in a separate pass, so it does not slow down
+the timed runs; end-to-end memory is peak RSS including worker processes.
+
+Results are printed and written as JSON with `--output`. Pass a previous
+results file as `--baseline` to compare against it: the run fails (exit
+code 1) when a stage's throughput drops, or its p90 latency or peak memory
+grows, by more than `--threshold`.
+
+Usage:
+    python benchmarks/bench_suite.py --scale 1k [--formats txt,docx,pdf] [--workers 4]
+        [--sample 1000] [--taxonomy-skills N] [--output results.json]
+        [--baseline baseline.json] [--threshold 0.2]
+"""
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import numpy as np
+
+from benchmarks.corpus import generate_corpus, load_taxonomy
+from extractors.keyword_extractor import KeywordExtractor
+from matcher.scorer import Scorer
+from parsers.jd_parser import JDParser
+from parsers.resume_parser import ResumeParser
+from pipeline.batch import screen_file, screen_parallel
+from pipeline.metrics import Metrics
+
+SCALES = {"1k": 1_000, "10k": 10_000, "100k": 100_000}
+# Compared against the baseline: (field, True when higher is better)
+COMPARED = [("throughput_per_s", True), ("p90_ms", False), ("peak_mb", False)]
+# Peak memory below this is allocator noise, not worth failing a run over
+MIN_COMPARED_MB = 1.0
+
+
+def peak_memory_mb(fn, items) -> float:
+    tracemalloc.start()
+    for item in items:
+        fn(item)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak / (1024 * 1024)
+
+
+def timed(metrics: Metrics, stage: str, fn, items):
+    results = []
+    for item in items:
+        start = time.perf_counter()
+        results.append(fn(item))
+        metrics.record(stage, time.perf_counter() - start)
+    return results
+
+
+def peak_rss_mb() -> float:
+    if resource is None:
+        return float("nan")
+    # ru_maxrss is in KB on Linux; children covers the worker processes
+    own = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    children = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss
+    return max(own, children) / 1024
+
+
+def run(args) -> dict:
+    count = SCALES.get(args.scale) or int(args.scale)
+    formats = args.formats.split(",")
+    corpus_dir = args.corpus_dir or os.path.join(ROOT, ".cache", "bench_corpus",
+                                                 f"{count}-{'-'.join(formats)}-{args.taxonomy_skills or 0}-{args.seed}")
+    start = time.perf_counter()
+    manifest = generate_corpus(corpus_dir, count, formats, args.words, args.density, args.taxonomy_skills,
+                               seed=args.seed)
+    print(f"Corpus: {count:,} resumes, {manifest['bytes'] / 1024 / 1024:.1f} MB in {corpus_dir} "
+          f"(ready in {time.perf_counter() - start:.1f} s)")
+
+    with open(os.path.join(ROOT, "data", "config.json")) as f:
+        config = json.load(f)
+    taxonomy = load_taxonomy(args.taxonomy_skills, args.seed)
+    resume_parser = ResumeParser(**config.get("parsing", {}))
+    jd_parser = JDParser()
+    extractor = KeywordExtractor(taxonomy)
+    scorer = Scorer(config["weights"])
+
+    resume_dir = os.path.join(corpus_dir, "resumes")
+    jd_dir = os.path.join(corpus_dir, "jds")
+    files = sorted(os.path.join(resume_dir, name) for name in os.listdir(resume_dir))
+    jd_texts = []
+    for name in sorted(os.listdir(jd_dir)):
+        with open(os.path.join(jd_dir, name)) as f:
+            jd_texts.append(f.read())
+
+    metrics = Metrics()
+    peaks = {}
+    items = {}
+
+    # JDs are few; cycle through them for enough samples
+    jd_samples = (jd_texts * (200 // len(jd_texts) + 1))[:200]
+    compile_jd = lambda text: scorer.compile_jd(jd_parser.parse(text), extractor)
+    jds = timed(metrics, "jd_parse", compile_jd, jd_samples)
+    peaks["jd_parse"] = peak_memory_mb(compile_jd, jd_texts)
+    jd = jds[0]
+
+    step = max(1, len(files) // args.sample)
+    sample = files[::step][:args.sample]
+    texts = []
+    for fmt in formats:
+        paths = [path for path in sample if path.endswith("." + fmt)]
+        texts += timed(metrics, f"parse_{fmt}", resume_parser.parse, paths)
+        peaks[f"parse_{fmt}"] = peak_memory_mb(resume_parser.parse, paths[:200])
+        items[f"parse_{fmt}"] = len(paths)
+
+    profiles = timed(metrics, "extract", extractor.extract_profile, texts)
+    peaks["extract"] = peak_memory_mb(extractor.extract_profile, texts[:200])
+
+    score = lambda profile: scorer.score(profile["skills"], jd, profile["experience_years"])
+    timed(metrics, "score", score, profiles)
+    peaks["score"] = peak_memory_mb(score, profiles[:200])
+
+    # The sampled profiles repeated up to the full scale
+    pool = [profiles[i % len(profiles)] for i in range(count)]
+    skill_matrix = extractor.skill_matrix(p["skills"] for p in pool)
+    years = np.array([p["experience_years"] for p in pool], dtype=np.float64)
+    score_batch = lambda _: scorer.score_batch(skill_matrix, jd, top_k=100, experience_years=years)
+    timed(metrics, "score_batch", score_batch, range(5))
+    peaks["score_batch"] = peak_memory_mb(score_batch, range(1))
+    items["score_batch"] = count * 5
+
+    start = time.perf_counter()
+    end_to_end = []
+    if args.workers > 1:
+        for _, result in screen_parallel(files, taxonomy, config["weights"], jd_parser.parse(jd_texts[0]),
+                                         args.workers, parser_options=config.get("parsing")):
+            end_to_end.append(sum(result.get("timings", {}).values()))
+    else:
+        for path in files:
+            result = screen_file(path, resume_parser, extractor, scorer, jd)
+            end_to_end.append(sum(result["timings"].values()))
+    wall = time.perf_counter() - start
+    for seconds in end_to_end:
+        metrics.record("end_to_end", seconds)
+    peaks["end_to_end"] = peak_rss_mb()
+
+    stages = {}
+    summaries = metrics.summary()
+    for stage in metrics.samples:  # in the order they ran
+        summary = summaries[stage]
+        # Per-file latencies of parallel workers overlap; throughput uses wall-clock time
+        seconds = wall if stage == "end_to_end" else summary["total"]
+        n = items.get(stage, summary["count"])
+        stages[stage] = {
+            "items": n,
+            "seconds": round(seconds, 4),
+            "throughput_per_s": round(n / seconds, 2) if seconds else None,
+            "p50_ms": round(summary["p50"] * 1000, 4),
+            "p90_ms": round(summary["p90"] * 1000, 4),
+            "p99_ms": round(summary["p99"] * 1000, 4),
+            "max_ms": round(summary["max"] * 1000, 4),
+            "peak_mb": round(peaks[stage], 2),
+        }
+    return {
+        "meta": {
+            "scale": count,
+            "formats": formats,
+            "sample": len(sample),
+            "workers": args.workers,
+            "words": args.words,
+            "density": args.density,
+            "taxonomy_skills": args.taxonomy_skills or len(extractor.matcher.skills),
+            "seed": args.seed,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpus": os.cpu_count(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        },
+        "stages": stages,
+    }
+
+
+def print_results(results: dict):
+    print(f"\n{'stage':<12} {'items':>8} {'items/s':>11} {'p50 ms':>9} {'p90 ms':>9} {'p99 ms':>9} {'peak MB':>8}")
+    for stage, s in results["stages"].items():
+        print(f"{stage:<12} {s['items']:>8} {s['throughput_per_s']:>11.1f} {s['p50_ms']:>9.3f} "
+              f"{s['p90_ms']:>9.3f} {s['p99_ms']:>9.3f} {s['peak_mb']:>8.1f}")
+
+
+def compare(results: dict, baseline: dict, threshold: float) -> list:
+    """Prints the change per compared field and returns the regressions beyond `threshold`."""
+    for key in ("scale", "formats", "workers", "taxonomy_skills"):
+        if results["meta"].get(key) != baseline["meta"].get(key):
+            print(f"Warning: baseline {key} is {baseline['meta'].get(key)}, this run {results['meta'].get(key)}")
+    regressions = []
+    print(f"\nAgainst baseline from {baseline['meta'].get('timestamp')} (threshold {threshold:.0%}):")
+    for stage, current in results["stages"].items():
+        previous = baseline["stages"].get(stage)
+        if previous is None:
+            continue
+        changes = []
+        for field, higher_is_better in COMPARED:
+            old, new = previous.get(field), current.get(field)
+            if not old or new is None or (field == "peak_mb" and max(old, new) < MIN_COMPARED_MB):
+                continue
+            change = new / old - 1
+            worse = -change if higher_is_better else change
+            flag = ""
+            if worse > threshold:
+                flag = " REGRESSION"
+                regressions.append((stage, field, old, new))
+            changes.append(f"{field} {change:+.1%}{flag}")
+        print(f"  {stage:<12} {', '.join(changes)}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Resume screening benchmark suite")
+    parser.add_argument("--scale", default="1k", help="1k, 10k, 100k or a resume count")
+    parser.add_argument("--formats", default="txt,docx,pdf")
+    parser.add_argument("--sample", type=int, default=1000, help="Resumes timed per stage")
+    parser.add_argument("--workers", type=int, default=1, help="Processes for the end-to-end stage")
+    parser.add_argument("--words", type=int, default=400)
+    parser.add_argument("--density", type=float, default=0.03, help="Fraction of resume words that are skills")
+    parser.add_argument("--taxonomy-skills", type=int, help="Use a synthetic taxonomy with this many skills")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--corpus-dir", help="Where the corpus is generated (reused when it matches)")
+    parser.add_argument("--output", help="Write results as JSON to this file (e.g. to save a baseline)")
+    parser.add_argument("--baseline", help="Results JSON to compare against")
+    parser.add_argument("--threshold", type=float, default=0.2, help="Allowed relative regression")
+    args = parser.parse_args()
+
+    results = run(args)
+    print_results(results)
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+        print(f"\nResults written to {args.output}")
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} regression(s) beyond {args.threshold:.0%}:")
+            for stage, field, old, new in regressions:
+                print(f"  {stage} {field}: {old} -> {new}")
+            sys.exit(1)
+        print("\nNo regressions.")
+
+
+if __name__ == "__main__":
+    main()
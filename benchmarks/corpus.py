@@ -0,0 +1,242 @@
+"""
+Synthetic, reproducible resume/JD corpora for benchmarks.
+
+Everything is generated offline from a seed, with no dependencies beyond the
+standard library: TXT resumes, DOCX files written as minimal OOXML packages
+and PDFs written as plain text-only PDF files. Skills are drawn from a
+taxonomy, either `data/skills_taxonomy.json` or a large synthetic one.
+
+Usage:
+    python benchmarks/corpus.py OUT_DIR [count] [--formats txt,docx,pdf] [--words 400]
+                                [--density 0.03] [--taxonomy-skills N] [--seed 42]
+"""
+import argparse
+import hashlib
+import io
+import json
+import os
+import random
+import string
+import zipfile
+from typing import Dict, List, Optional
+from xml.sax.saxutils import escape
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+FILLER = ["designed", "built", "led", "delivered", "maintained", "migrated", "the", "and", "with", "for",
+          "services", "platform", "team", "customers", "latency", "pipeline", "reporting", "reliability",
+          "internal", "tooling", "features", "reduced", "improved", "across", "production", "data"]
+FIRST_NAMES = ["Jane", "John", "Priya", "Wei", "Amara", "Lucas", "Sofia", "Omar", "Hana", "Mateo"]
+LAST_NAMES = ["Doe", "Smith", "Patel", "Chen", "Okafor", "Silva", "Rossi", "Haddad", "Sato", "Garcia"]
+COMPANIES = ["Acme Corp", "Initech", "Globex", "Umbrella", "Hooli", "Stark Industries", "Wayne Enterprises"]
+MONTHS = ["Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"]
+
+
+def load_taxonomy(skills: Optional[int] = None, seed: int = 42) -> Dict:
+    """The repo's taxonomy, or a synthetic one with `skills` skills when given."""
+    if skills:
+        return synthetic_taxonomy(skills, random.Random(seed))
+    with open(os.path.join(ROOT, "data", "skills_taxonomy.json")) as f:
+        return json.load(f)
+
+
+def synthetic_taxonomy(skills: int, rng: random.Random, categories: int = 20) -> Dict:
+    """`skills` made-up skills, three variations each, some with punctuation (".js", "++")."""
+    taxonomy = {f"Category {c}": {} for c in range(categories)}
+    for i in range(skills):
+        word = "".join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(3, 9)))
+        suffix = rng.choice(["", "", ".js", "++", "db"])
+        taxonomy[f"Category {i % categories}"][f"{word.title()}{i}"] = [
+            f"{word}{i}{suffix}", f"{word}-{i}", f"{word} {i}"
+        ]
+    return taxonomy
+
+
+def _variations(taxonomy: Dict) -> List[str]:
+    return [v for skills in taxonomy.values() for variations in skills.values() for v in variations]
+
+
+def _skill_names(taxonomy: Dict) -> List[str]:
+    return [skill for skills in taxonomy.values() for skill in skills]
+
+
+def resume_text(rng: random.Random, variations: List[str], words: int = 400, density: float = 0.03) -> str:
+    """
+    A resume of about `words` words, where a `density` fraction of the body
+    words are skill variations, with the contact line, dated roles and
+    education section most real resumes have.
+    """
+    first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+    lines = [
+        f"{first} {last}",
+        f"{first.lower()}.{last.lower()}{rng.randint(1, 999)}@example.com | +1 (555) {rng.randint(100, 999)}-{rng.randint(1000, 9999)}",
+        "",
+        "EXPERIENCE",
+    ]
+    year = 2025
+    roles = rng.randint(1, 4)
+    per_role = max(1, words // roles)
+    for role in range(roles):
+        start = year - rng.randint(1, 4)
+        end = "Present" if role == 0 else f"{rng.choice(MONTHS)} {year}"
+        lines.append(f"Engineer, {rng.choice(COMPANIES)}  {rng.choice(MONTHS)} {start} - {end}")
+        sentence = []
+        for _ in range(per_role):
+            sentence.append(rng.choice(variations) if rng.random() < density else rng.choice(FILLER))
+            if len(sentence) == 16:
+                lines.append("- " + " ".join(sentence))
+                sentence = []
+        if sentence:
+            lines.append("- " + " ".join(sentence))
+        year = start
+    lines += ["", "SKILLS", ", ".join(rng.sample(variations, min(len(variations), 8))),
+              "", "EDUCATION", f"B.Sc. Computer Science, State University  {year - 4} - {year}"]
+    return "\n".join(lines)
+
+
+def jd_text(rng: random.Random, skill_names: List[str], required: int = 5, preferred: int = 4) -> str:
+    picked = rng.sample(skill_names, min(len(skill_names), required + preferred))
+    lines = ["Job Title: Software Engineer", "", "Required Skills:"]
+    lines += [f"- {skill}" for skill in picked[:required]]
+    lines += ["", "Preferred Skills:"]
+    lines += [f"- {skill}" for skill in picked[required:]]
+    lines += ["", f"Experience: {rng.randint(1, 8)}+ years of professional software development"]
+    return "\n".join(lines)
+
+
+def docx_bytes(text: str) -> bytes:
+    """A minimal valid DOCX package with one paragraph per line."""
+    paragraphs = "".join(
+        f'<w:p><w:r><w:t xml:space="preserve">{escape(line)}</w:t></w:r></w:p>' for line in text.split("\n")
+    )
+    document = (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">'
+        f"<w:body>{paragraphs}</w:body></w:document>"
+    )
+    content_types = (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+        '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+        '<Default Extension="xml" ContentType="application/xml"/>'
+        '<Override PartName="/word/document.xml" '
+        'ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml"/>'
+        "</Types>"
+    )
+    rels = (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+        '<Relationship Id="rId1" Target="word/document.xml" '
+        'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument"/>'
+        "</Relationships>"
+    )
+    out = io.BytesIO()
+    with zipfile.ZipFile(out, "w", zipfile.ZIP_DEFLATED) as zf:
+        zf.writestr("[Content_Types].xml", content_types)
+        zf.writestr("_rels/.rels", rels)
+        zf.writestr("word/document.xml", document)
+    return out.getvalue()
+
+
+def pdf_bytes(text: str, lines_per_page: int = 50) -> bytes:
+    """A text-only PDF (Helvetica, one text line per line of `text`) with a correct xref table."""
+    lines = [line.encode("latin-1", "replace").replace(b"\\", b"\\\\").replace(b"(", b"\\(").replace(b")", b"\\)")
+             for line in text.split("\n")]
+    pages = [lines[i:i + lines_per_page] for i in range(0, len(lines), lines_per_page)] or [[]]
+
+    # Objects: 1 catalog, 2 page tree, 3 font, then a (page, content) pair per page
+    objects = [b"<< /Type /Catalog /Pages 2 0 R >>", None,
+               b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica /Encoding /WinAnsiEncoding >>"]
+    kids = []
+    for page_lines in pages:
+        stream = b"BT /F1 10 Tf 12 TL 50 780 Td " + b" T* ".join(b"(" + line + b") Tj" for line in page_lines) + b" ET"
+        page_id, content_id = len(objects) + 1, len(objects) + 2
+        kids.append(f"{page_id} 0 R".encode())
+        objects.append(b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+                       b"/Resources << /Font << /F1 3 0 R >> >> /Contents " + f"{content_id} 0 R".encode() + b" >>")
+        objects.append(f"<< /Length {len(stream)} >>\nstream\n".encode() + stream + b"\nendstream")
+    objects[1] = b"<< /Type /Pages /Kids [" + b" ".join(kids) + f"] /Count {len(kids)} >>".encode()
+
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(out))
+        out += f"{number} 0 obj\n".encode() + body + b"\nendobj\n"
+    xref = len(out)
+    out += f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n".encode()
+    out += b"".join(f"{offset:010d} 00000 n \n".encode() for offset in offsets)
+    out += f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\nstartxref\n{xref}\n%%EOF\n".encode()
+    return bytes(out)
+
+
+WRITERS = {
+    "txt": lambda text: text.encode("utf-8"),
+    "docx": docx_bytes,
+    "pdf": pdf_bytes,
+}
+
+
+def generate_corpus(out_dir: str, count: int, formats=("txt", "docx", "pdf"), words: int = 400,
+                    density: float = 0.03, taxonomy_skills: Optional[int] = None, jds: int = 10,
+                    seed: int = 42) -> Dict:
+    """
+    Writes `count` resumes (formats in rotation) to `out_dir/resumes`, `jds`
+    JDs to `out_dir/jds` (and a synthetic taxonomy to
+    `out_dir/skills_taxonomy.json`) and returns the corpus manifest. The same arguments always produce the same
+    files; an existing corpus with a matching manifest is reused as-is.
+    """
+    params = {"count": count, "formats": list(formats), "words": words, "density": density,
+              "taxonomy_skills": taxonomy_skills, "jds": jds, "seed": seed}
+    manifest_path = os.path.join(out_dir, "manifest.json")
+    if os.path.exists(manifest_path):
+        with open(manifest_path) as f:
+            manifest = json.load(f)
+        if manifest.get("params") == params:
+            return manifest
+
+    rng = random.Random(seed)
+    taxonomy = load_taxonomy(taxonomy_skills, seed)
+    variations, skill_names = _variations(taxonomy), _skill_names(taxonomy)
+    resume_dir, jd_dir = os.path.join(out_dir, "resumes"), os.path.join(out_dir, "jds")
+    os.makedirs(resume_dir, exist_ok=True)
+    os.makedirs(jd_dir, exist_ok=True)
+
+    total_bytes = 0
+    for i in range(count):
+        fmt = formats[i % len(formats)]
+        data = WRITERS[fmt](resume_text(rng, variations, words, density))
+        total_bytes += len(data)
+        with open(os.path.join(resume_dir, f"resume_{i:06d}.{fmt}"), "wb") as f:
+            f.write(data)
+    for j in range(jds):
+        with open(os.path.join(jd_dir, f"jd_{j:03d}.txt"), "w") as f:
+            f.write(jd_text(rng, skill_names))
+    if taxonomy_skills:
+        with open(os.path.join(out_dir, "skills_taxonomy.json"), "w") as f:
+            json.dump(taxonomy, f)
+
+    taxonomy_hash = hashlib.sha256(json.dumps(taxonomy, sort_keys=True).encode()).hexdigest()
+    manifest = {"params": params, "bytes": total_bytes, "taxonomy_sha256": taxonomy_hash}
+    with open(manifest_path, "w") as f:
+        json.dump(manifest, f, indent=2)
+    return manifest
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate a synthetic resume/JD corpus")
+    parser.add_argument("out_dir")
+    parser.add_argument("count", type=int, nargs="?", default=1000)
+    parser.add_argument("--formats", default="txt,docx,pdf")
+    parser.add_argument("--words", type=int, default=400)
+    parser.add_argument("--density", type=float, default=0.03)
+    parser.add_argument("--taxonomy-skills", type=int)
+    parser.add_argument("--jds", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+    manifest = generate_corpus(args.out_dir, args.count, args.formats.split(","), args.words, args.density,
+                               args.taxonomy_skills, args.jds, args.seed)
+    print(f"{args.count} resumes ({manifest['bytes'] / 1024 / 1024:.1f} MB) and {args.jds} JDs in {args.out_dir}")
+
+
+if __name__ == "__main__":
+    main()
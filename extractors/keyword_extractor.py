@@ -1,34 +1,77 @@
-import re
-from typing import Set, Dict
+from typing import Set, Dict, Iterable, Optional
+
+import numpy as np
+
+from extractors.skill_matcher import SkillMatcher
+from extractors.resume_facts import ResumeFacts, extract_facts
 
 class KeywordExtractor:
-    def __init__(self, skills_taxonomy: Dict[str, Dict[str, list]]):
+    def __init__(self, skills_taxonomy: Dict[str, Dict[str, list]], matcher: Optional[SkillMatcher] = None):
         self.skills_taxonomy = skills_taxonomy
+        # Compile every variation into one automaton up front, so extraction
+        # is a single scan of the text regardless of the taxonomy size.
+        # A matcher already compiled from this taxonomy (see `pipeline.taxonomy`) is used as-is.
+        self.matcher = matcher or SkillMatcher(skills_taxonomy)
 
     def extract_skills(self, text: str) -> Set[str]:
-        text_lower = text.lower()
-        found_skills = set()
-
-        for category, skills_dict in self.skills_taxonomy.items():
-            for skill_name, variations in skills_dict.items():
-                for variation in variations:
-                    # Prevent "Java" matching "JavaScript"
-                    # Use \b for word boundaries. 
-                    # Escape variation in case it contains special regex chars (like C++)
-                    pattern = r"\b" + re.escape(variation.lower()) + r"\b"
-                    if re.search(pattern, text_lower):
-                        found_skills.add(skill_name)
-                        # Once a skill is found via one variation, we don't need to check other variations for the same skill
-                        break 
-
-        return found_skills
+        # Variations only match as whole words, so "Java" does not match "JavaScript",
+        # while "C++" and "React.js" still match next to punctuation.
+        return self.matcher.find(text)
+
+    def extract_skills_stream(self, chunks: Iterable[str]) -> Set[str]:
+        """
+        Same result as `extract_skills("\\n".join(chunks))`, consuming the chunks
+        (e.g. PDF pages from `ResumeParser.iter_text`) one at a time.
+        No variation contains a newline and a newline is never a word character,
+        so nothing can match across a chunk boundary and each chunk is scanned on its own.
+        """
+        found_ids = set()
+        for chunk in chunks:
+            found_ids |= self.matcher.find_ids(chunk.lower())
+        return {self.matcher.skills[i] for i in found_ids}
+
+    def extract_profile_stream(self, chunks: Iterable[str]) -> Dict:
+        """
+        Skills, years of experience and contact details in one pass over the chunks:
+        each chunk is lower-cased once, then scanned by the skill automaton and by
+        the single combined pattern of `ResumeFacts`.
+        Returns `{"skills", "experience_years", "email", "phone"}`.
+        """
+        found_ids = set()
+        facts = ResumeFacts()
+        for chunk in chunks:
+            chunk_lower = chunk.lower()
+            found_ids |= self.matcher.find_ids(chunk_lower)
+            facts.feed(chunk_lower)
+        profile = facts.result()
+        profile["skills"] = {self.matcher.skills[i] for i in found_ids}
+        return profile
+
+    def extract_profile(self, text: str) -> Dict:
+        return self.extract_profile_stream([text])
+
+    def skill_matrix(self, skill_sets: Iterable[Set[str]]) -> np.ndarray:
+        """
+        Builds a candidates x skills boolean matrix (columns are taxonomy skill IDs)
+        from `extract_skills` results, for `Scorer.score_batch`.
+        """
+        skill_index = self.matcher.skill_index
+        rows = []
+        cols = []
+        count = 0
+        for row, skills in enumerate(skill_sets):
+            count += 1
+            for skill in skills:
+                col = skill_index.get(skill)
+                if col is not None:
+                    rows.append(row)
+                    cols.append(col)
+        matrix = np.zeros((count, len(self.matcher.skills)), dtype=bool)
+        matrix[rows, cols] = True
+        return matrix
     
     def extract_experience(self, text: str) -> str:
-        # Basic extraction for example purposes - looking for common patterns
-        # In a real system, this would be more complex NLP
-        # Patterns like: "3 years experience", "5+ years", "10 years of"
-        pattern = r"(\d+\+?)\s*(?:years?|yrs?)"
-        match = re.search(pattern, text.lower())
-        if match:
-            return match.group(1)
-        return "0"
+        # Years of experience from date ranges ("Jan 2018 - Present") and
+        # phrases like "5+ years"; see `ResumeFacts`
+        years = extract_facts(text)["experience_years"]
+        return f"{years:g}" if years is not None else "0"
@@ -0,0 +1,180 @@
+import datetime
+import re
+from typing import Dict, Iterable, List, Optional, Tuple
+
+_MONTH = (r"jan(?:uary)?|feb(?:ruary)?|mar(?:ch)?|apr(?:il)?|may|june?|july?|aug(?:ust)?"
+          r"|sep(?:t(?:ember)?)?|oct(?:ober)?|nov(?:ember)?|dec(?:ember)?")
+_MONTH_NUMBERS = {name: i + 1 for i, name in enumerate(
+    ["jan", "feb", "mar", "apr", "may", "jun", "jul", "aug", "sep", "oct", "nov", "dec"]
+)}
+
+
+# "mar 2019", "march, 2019", "03/2019", "3-2019" or just "2019"; a start month
+# written as a word is looked up in front of the match (see `_start_month`)
+_END_DATE = (rf"(?:(?P<end_month>{_MONTH})\.?,?[ \t]*|(?P<end_num>0?[1-9]|1[0-2])[/.-])?"
+             rf"(?P<end_year>(?:19|20)\d{{2}})")
+_MONTH_BEFORE_RE = re.compile(rf"(?<![a-z])({_MONTH})\.?,?[ \t]*$")
+_EMAIL_RE = re.compile(r"(?<![\w.+-])[\w.+-]+@[\w-]+(?:\.[\w-]+)*\.[a-z]{2,}")
+
+# Date ranges, "N years" phrases and phone numbers are alternatives of one pattern
+# that can only start at a digit, "+" or "(": the leading lookahead lets the regex
+# engine skip straight to those characters, so a chunk is scanned once, in C, for
+# all of them. Emails are only looked for around "@". Applied to lower-cased text;
+# nothing spans a newline, so chunks can be scanned independently.
+_RANGE = (r"(?<![\w/.-])(?:(?P<start_num>0?[1-9]|1[0-2])[/.-])?(?P<start_year>(?:19|20)\d{2})"
+          rf"[ \t]*(?:-|–|—|to|till|until)[ \t]*(?:(?P<now>present|current|now|today|date)|{_END_DATE})(?![\w/])")
+# A phone number's separators may not end a sentence (". ") or lead into a date
+# range, so "tel: 555-123-4567. 2019 - 2021" leaves the range to the date branch
+_PHONE_SEPARATOR = (r"(?:\.(?![ \t])|[ \t()-])"
+                    r"(?![ \t().-]*(?:19|20)\d{2}[ \t]*(?:-|–|—|to)[ \t]*(?:(?:19|20)\d{2}|present|current|now))")
+_FACTS_RE = re.compile(
+    r"(?=[\d+(])(?:"
+    + _RANGE +
+    r"|(?<![\d.])(?P<years>\d{1,2}(?:\.\d+)?)(?:[ \t]*(?:-|–|to)[ \t]*\d{1,2})?[ \t]*\+?[ \t]*(?:years?|yrs?)\b"
+    rf"|(?<![\w+])(?P<phone>\+?\(?\d(?:\d|{_PHONE_SEPARATOR}){{8,}}\d)(?!\w)"
+    r")"
+)
+# Date ranges alone, to re-scan text a rejected phone candidate consumed
+_RANGE_RE = re.compile(_RANGE)
+# "5 years", "5+ yrs", "3-5 years" (the lower bound counts)
+_YEARS_RE = re.compile(r"(?<![\d.])(\d{1,2}(?:\.\d+)?)(?:[ \t]*(?:-|–|to)[ \t]*\d{1,2})?[ \t]*\+?[ \t]*(?:years?|yrs?)\b")
+# Date ranges on lines mentioning these are studies, not work experience
+_EDUCATION_WORDS = (
+    "universit", "college", "school", "institute", "academy", "bachelor", "master", "degree",
+    "diploma", "phd", "ph.d", "gpa", "education", "b.sc", "bsc", "b.tech", "btech", "m.sc",
+    "msc", "m.tech", "mtech", "mba",
+)
+# Ignore ranges and claims longer than a working life (typos, phone fragments)
+_MAX_MONTHS = 50 * 12
+
+
+class ResumeFacts:
+    """
+    Collects contact details and experience while a resume is scanned chunk by chunk.
+
+    Experience is the larger of the explicit claims ("5+ years", "7 yrs") and
+    the total length of the date ranges found ("Jan 2018 - Present"),
+    where overlapping ranges (parallel roles) are only counted once.
+    """
+
+    def __init__(self, today: Optional[datetime.date] = None):
+        today = today or datetime.date.today()
+        self._now = today.year * 12 + today.month - 1
+        self.email: Optional[str] = None
+        self.phone: Optional[str] = None
+        self._ranges: List[Tuple[int, int]] = []
+        self._claimed: Optional[float] = None
+
+    def feed(self, text_lower: str):
+        if self.email is None:
+            self.email = self._find_email(text_lower)
+        pos = 0
+        while True:
+            match = _FACTS_RE.search(text_lower, pos)
+            if match is None:
+                break
+            pos = match.end()
+            if match.group("start_year"):
+                self._add_range(match, text_lower)
+            elif match.group("years"):
+                years = float(match.group("years"))
+                if years * 12 <= _MAX_MONTHS and (self._claimed is None or years > self._claimed):
+                    self._claimed = years
+            elif match.group("phone"):
+                phone = match.group("phone").strip()
+                if 10 <= sum(ch.isdigit() for ch in phone) <= 15:
+                    if self.phone is None:
+                        self.phone = phone
+                else:
+                    # Not a phone number, so it may have swallowed a date range
+                    pos = self._rescan_ranges(text_lower, match)
+
+    def _rescan_ranges(self, text_lower: str, rejected: re.Match) -> int:
+        pos = rejected.end()
+        for match in _RANGE_RE.finditer(text_lower, rejected.start()):
+            if match.start() >= rejected.end():
+                break
+            self._add_range(match, text_lower)
+            pos = max(pos, match.end())
+        return pos
+
+    def _add_range(self, match: re.Match, text_lower: str):
+        line_start = text_lower.rfind("\n", 0, match.start()) + 1
+        line_end = text_lower.find("\n", match.end())
+        line = text_lower[line_start:line_end if line_end != -1 else len(text_lower)]
+        if any(word in line for word in _EDUCATION_WORDS):
+            return
+        start = self._month_index(match, "start", self._start_month(match, text_lower))
+        end = self._now if match.group("now") else self._month_index(match, "end")
+        if start < end <= self._now + 12 and end - start <= _MAX_MONTHS:
+            self._ranges.append((start, end))
+
+    @staticmethod
+    def _find_email(text_lower: str) -> Optional[str]:
+        at = text_lower.find("@")
+        while at != -1:
+            match = _EMAIL_RE.search(text_lower, max(0, at - 64), at + 256)
+            if match and match.start() < at < match.end():
+                return match.group()
+            at = text_lower.find("@", at + 1)
+        return None
+
+    @staticmethod
+    def _start_month(match: re.Match, text_lower: str) -> Optional[str]:
+        if match.group("start_num"):
+            return None
+        before = _MONTH_BEFORE_RE.search(text_lower, max(0, match.start() - 12), match.start())
+        return before.group(1) if before else None
+
+    @staticmethod
+    def _month_index(match: re.Match, tag: str, month_name: Optional[str] = None) -> int:
+        month = 0
+        month_name = month_name or match.groupdict().get(f"{tag}_month")
+        if month_name:
+            month = _MONTH_NUMBERS[month_name[:3]] - 1
+        elif match.group(f"{tag}_num"):
+            month = int(match.group(f"{tag}_num")) - 1
+        return int(match.group(f"{tag}_year")) * 12 + month
+
+    def experience_years(self) -> Optional[float]:
+        """Years of experience, or None when the resume states nothing about it."""
+        months = 0
+        current_start = current_end = None
+        for start, end in sorted(self._ranges):
+            if current_end is None or start > current_end:
+                if current_end is not None:
+                    months += current_end - current_start
+                current_start, current_end = start, end
+            else:
+                current_end = max(current_end, end)
+        if current_end is not None:
+            months += current_end - current_start
+
+        if not self._ranges and self._claimed is None:
+            return None
+        return round(max(months / 12, self._claimed or 0.0), 1)
+
+    def result(self) -> Dict:
+        return {"experience_years": self.experience_years(), "email": self.email, "phone": self.phone}
+
+
+def extract_facts(text: str, today: Optional[datetime.date] = None) -> Dict:
+    """
+    `{"experience_years", "email", "phone"}` for a whole text (values may be None).
+
+    >>> extract_facts("Tel: 555-123-4567. 2019 - 2021 Engineer", datetime.date(2024, 1, 1))
+    {'experience_years': 2.0, 'email': None, 'phone': '555-123-4567'}
+    >>> extract_facts("GPA 3.8. 2010 - 2014", datetime.date(2024, 1, 1))
+    {'experience_years': None, 'email': None, 'phone': None}
+    >>> extract_facts("Engineer 2019 - 2021 +1 (555) 010-2030", datetime.date(2024, 1, 1))
+    {'experience_years': 2.0, 'email': None, 'phone': '+1 (555) 010-2030'}
+    """
+    facts = ResumeFacts(today)
+    facts.feed(text.lower())
+    return facts.result()
+
+
+def required_years(lines: Iterable[str]) -> Optional[float]:
+    """Minimum years asked for by a JD's experience lines ("3+ years ..."), or None."""
+    years = [float(match) for line in lines for match in _YEARS_RE.findall(line.lower())]
+    return max(years) if years else None
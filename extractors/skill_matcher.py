@@ -0,0 +1,162 @@
+from collections import deque
+from typing import Dict, Iterator, List, Set, Tuple
+
+
+def _is_word_char(ch: str) -> bool:
+    # Mirrors what `\w` means for str patterns in `re`
+    return ch.isalnum() or ch == "_"
+
+
+class SkillMatcher:
+    """
+    Aho-Corasick automaton over every variation in the skills taxonomy.
+
+    The taxonomy is compiled once; `find` then scans the text a single time,
+    so the cost per resume depends on the text length and not on how many
+    skills/variations the taxonomy holds.
+
+    A variation only counts when it is not embedded in a larger word: if it
+    starts (ends) with a word character, the character before (after) it must
+    not be one. Edges that are punctuation need no boundary, so unlike `\\b`
+    this works for variations such as "c++", ".net" or "react.js".
+    """
+
+    def __init__(self, skills_taxonomy: Dict[str, Dict[str, list]]):
+        # Canonical skill names; the index in this list is the skill ID
+        self.skills: List[str] = []
+        self.skill_index: Dict[str, int] = {}
+        self.categories: Dict[str, str] = {}
+        self.variation_count = 0
+
+        # Trie / automaton tables
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        # Per node, for every variation ending here:
+        # (variation length, skill ID, check left boundary, check right boundary)
+        self._out: List[Tuple[Tuple[int, int, bool, bool], ...]] = [()]
+
+        pending: List[list] = [[]]
+        for category, skills_dict in skills_taxonomy.items():
+            for skill_name, variations in skills_dict.items():
+                skill_id = self.skill_index.get(skill_name)
+                if skill_id is None:
+                    skill_id = len(self.skills)
+                    self.skills.append(skill_name)
+                    self.skill_index[skill_name] = skill_id
+                    self.categories[skill_name] = category
+                for variation in variations:
+                    self._add(variation.lower().strip(), skill_id, pending)
+
+        self._out = [tuple(outputs) for outputs in pending]
+        self._build_failure_links()
+
+    def _add(self, variation: str, skill_id: int, pending: List[list]):
+        if not variation:
+            return
+        node = 0
+        for ch in variation:
+            nxt = self._goto[node].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[node][ch] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                pending.append([])
+            node = nxt
+        entry = (
+            len(variation),
+            skill_id,
+            _is_word_char(variation[0]),
+            _is_word_char(variation[-1]),
+        )
+        if entry not in pending[node]:
+            pending[node].append(entry)
+            self.variation_count += 1
+
+    def _build_failure_links(self):
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for ch, child in self._goto[node].items():
+                queue.append(child)
+                fallback = self._fail[node]
+                while fallback and ch not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(ch, 0)
+                self._fail[child] = target if target != child else 0
+                # Inherit the outputs of the longest proper suffix
+                if self._out[self._fail[child]]:
+                    self._out[child] = self._out[child] + self._out[self._fail[child]]
+
+    def _matches(self, text_lower: str) -> Iterator[Tuple[int, int, int]]:
+        # (start, length, skill ID) of every whole-word occurrence, overlapping ones included
+        goto = self._goto
+        fail = self._fail
+        out = self._out
+        last = len(text_lower) - 1
+        node = 0
+
+        for i, ch in enumerate(text_lower):
+            while node and ch not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(ch, 0)
+            if not out[node]:
+                continue
+            right_is_word = i < last and _is_word_char(text_lower[i + 1])
+            for length, skill_id, check_left, check_right in out[node]:
+                if check_right and right_is_word:
+                    continue
+                start = i - length + 1
+                if check_left and start > 0 and _is_word_char(text_lower[start - 1]):
+                    continue
+                yield start, length, skill_id
+
+    def find_ids(self, text_lower: str) -> Set[int]:
+        """Returns the IDs of all skills found in already lower-cased text."""
+        # The scan of `_matches`, inlined: this is the per-resume hot path
+        goto = self._goto
+        fail = self._fail
+        out = self._out
+        found = set()
+        last = len(text_lower) - 1
+        node = 0
+
+        for i, ch in enumerate(text_lower):
+            while node and ch not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(ch, 0)
+            if not out[node]:
+                continue
+            right_is_word = i < last and _is_word_char(text_lower[i + 1])
+            for length, skill_id, check_left, check_right in out[node]:
+                if check_right and right_is_word:
+                    continue
+                start = i - length + 1
+                if check_left and start > 0 and _is_word_char(text_lower[start - 1]):
+                    continue
+                found.add(skill_id)
+
+        return found
+
+    def find_ids_longest(self, text_lower: str) -> Set[int]:
+        """
+        Like `find_ids`, but only leftmost-longest, non-overlapping matches
+        count: a variation inside a longer match ("js" in "react.js") is
+        ignored. Skills sharing the chosen variation are all returned.
+        """
+        found = set()
+        end = 0
+        chosen = None
+        for start, neg_length, skill_id in sorted((start, -length, skill_id)
+                                                  for start, length, skill_id in self._matches(text_lower)):
+            if (start, neg_length) == chosen:
+                found.add(skill_id)
+            elif start >= end:
+                chosen = (start, neg_length)
+                end = start - neg_length
+                found.add(skill_id)
+        return found
+
+    def find(self, text: str) -> Set[str]:
+        """Returns the canonical names of all skills found in `text`."""
+        return {self.skills[i] for i in self.find_ids(text.lower())}
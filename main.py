@@ -1,33 +1,109 @@
 import os
 import json
 import argparse
+import time
+import numpy as np
 from pathlib import Path
 from parsers.resume_parser import ResumeParser
 from parsers.jd_parser import JDParser
 from extractors.keyword_extractor import KeywordExtractor
 from matcher.scorer import Scorer
+from pipeline.batch import screen_file, screen_parallel, extract_resume, extract_parallel
+from pipeline.output import ResultWriter, TopK, load_completed, recorded_run
+from pipeline.cache import ParseCache, parser_fingerprint
+from pipeline.store import CandidateStore, jd_family, jd_key, score_month
+from pipeline.sources import iter_resume_sources
+from pipeline.dedup import DuplicateIndex, MinHasher
+from pipeline.metrics import Metrics, profiling
+from pipeline.taxonomy import load_taxonomy
 
 def main():
     parser = argparse.ArgumentParser(description="Résumé Screening System CLI")
     parser.add_argument("--jd", type=str, help="Path to Job Description file (txt)", default="input/jd.txt")
-    parser.add_argument("--input", type=str, help="Directory containing resumes", default="input")
+    parser.add_argument("--input", type=str, help="Directory (searched recursively) or zip/tar archive of resumes",
+                        default="input")
+    parser.add_argument("--workers", type=int, help="Number of worker processes (1 = serial)", default=1)
+    parser.add_argument("--no-cache", action="store_true", help="Disable the parsed resume cache")
+    parser.add_argument("--jd-dir", type=str, help="Directory of JD files (txt) to screen against all at once")
+    parser.add_argument("--top-k", type=int, help="Candidates to list per JD (default: all, 10 with --jd-dir)")
+    parser.add_argument("--store", type=str, help="SQLite candidate store; re-runs only parse new or changed files")
+    parser.add_argument("--output", type=str,
+                        help="Stream one record per file to this .jsonl/.csv file; re-running resumes from it")
+    parser.add_argument("--timeout", type=float, help="Per-file parsing timeout in seconds (0 = none)")
+    parser.add_argument("--max-memory-mb", type=int, help="Per-file worker memory budget in MB (0 = none)")
+    parser.add_argument("--dedup", action="store_true",
+                        help="Rank near-duplicate resumes once, listing the copies under the first one")
+    parser.add_argument("--stats", action="store_true",
+                        help="Print per-stage timings (parse/extract/score) and the slowest files at the end")
+    parser.add_argument("--metrics", type=str,
+                        help="Write per-stage timings to this .json file, or a Prometheus textfile for .prom")
+    parser.add_argument("--profile", type=str,
+                        help="Run under cProfile and dump the stats to this file (main process only)")
+    parser.add_argument("--trace-memory", action="store_true",
+                        help="Trace allocations with tracemalloc and print the peak and top sites")
     args = parser.parse_args()
+    if args.top_k is not None and args.top_k < 1:
+        parser.error("--top-k must be at least 1")
 
+    args.metrics_recorder = Metrics() if args.stats or args.metrics else None
+    with profiling(args.profile, args.trace_memory):
+        run(args)
+    if args.metrics_recorder is not None:
+        if args.stats:
+            print("\n" + "="*60)
+            print("STAGE TIMINGS")
+            print("="*60)
+            print(args.metrics_recorder.format_summary())
+        if args.metrics:
+            args.metrics_recorder.write(args.metrics)
+            print(f"Metrics written to {args.metrics}.")
+
+def run(args):
     # Load Config
     try:
         with open('data/config.json', 'r') as f:
             config = json.load(f)
-        with open('data/skills_taxonomy.json', 'r') as f:
-            skills_taxonomy = json.load(f)
+        # Compiled once, then loaded from the artifact until the JSON changes
+        taxonomy = load_taxonomy('data/skills_taxonomy.json', config.get('taxonomy', {}).get('artifact_path'))
     except FileNotFoundError as e:
         print(f"Error loading configuration: {e}")
         return
 
+    # Per-file budgets: when set, files are parsed in isolated workers that get killed on overrun
+    limits = dict(config.get('limits', {}))
+    if args.timeout is not None:
+        limits['timeout_seconds'] = args.timeout
+    if args.max_memory_mb is not None:
+        limits['max_memory_mb'] = args.max_memory_mb
+    args.limits = limits
+    args.isolated = bool(limits.get('timeout_seconds') or limits.get('max_memory_mb'))
+    if args.isolated and args.workers <= 1 and (args.profile or args.trace_memory):
+        # The profilers only see this process, so a single-worker profiling run parses here
+        print("Profiling: parsing in this process; per-file timeout and memory limits are not applied.")
+        args.isolated = False
+    args.minhasher = make_minhasher(config) if args.dedup else None
+
     # Initialize Components
-    resume_parser = ResumeParser()
+    resume_parser = ResumeParser(**config.get('parsing', {}))
     jd_parser = JDParser()
-    keyword_extractor = KeywordExtractor(skills_taxonomy)
+    skills_taxonomy = taxonomy.skills_taxonomy
+    args.taxonomy_fp = taxonomy.fingerprint
+    keyword_extractor = KeywordExtractor(skills_taxonomy, taxonomy.matcher)
     scorer = Scorer(config['weights'])
+    cache = None
+    if not args.no_cache and 'cache' in config:
+        cache = ParseCache(
+            config['cache']['path'],
+            args.taxonomy_fp,
+            config['cache']['max_size_mb'] * 1024 * 1024,
+            parser_fingerprint(config.get('parsing'))
+        )
+
+    if args.jd_dir:
+        if args.top_k is None:
+            args.top_k = 10
+        screen_multi_jd(args, config, skills_taxonomy, resume_parser, jd_parser, keyword_extractor, scorer, cache)
+        return
 
     # Read JD
     jd_path = Path(args.jd)
@@ -45,48 +121,351 @@ def main():
         jd_text = f.read()
 
     jd_data = jd_parser.parse(jd_text)
+    compiled_jd = scorer.compile_jd(jd_data, keyword_extractor)
     print("Job Description Parsed.")
-    print(f"Required: {jd_data['required_skills']}")
-    print(f"Preferred: {jd_data['preferred_skills']}")
+    print(f"Required: {compiled_jd.required_skills()}")
+    print(f"Preferred: {compiled_jd.preferred_skills()}")
     print("-" * 50)
 
     # Process Resumes
     input_dir = Path(args.input)
     if not input_dir.exists():
-        print(f"Input directory {input_dir} not found.")
+        print(f"Input {input_dir} not found.")
+        return
+
+    if args.store:
+        screen_with_store(args, input_dir, jd_path, jd_text, compiled_jd, config, skills_taxonomy,
+                          resume_parser, keyword_extractor, scorer, cache)
         return
 
-    results = []
     print(f"Scanning {input_dir} for resumes...")
-    
-    files = list(input_dir.glob("*.pdf")) + list(input_dir.glob("*.docx")) + list(input_dir.glob("*.txt"))
-    # Exclude the jd file itself if it's in the same dir and matches extension
-    files = [f for f in files if f.resolve() != jd_path.resolve()]
-
-    for file_path in files:
-        print(f"Processing {file_path.name}...")
-        try:
-            resume_text = resume_parser.parse(file_path)
-            resume_skills = keyword_extractor.extract_skills(resume_text)
-            score_data = scorer.score(resume_skills, jd_data)
-            score = score_data['total_score']
-            
-            results.append({
-                "name": file_path.name,
-                "score": score,
-                "matched": list(resume_skills)
-            })
-        except Exception as e:
-            print(f"Error processing {file_path.name}: {e}")
-
-    # Sort and Display
-    results.sort(key=lambda x: x['score'], reverse=True)
-    
+
+    # Results stream out as they are produced: each record goes to --output right away
+    # and only the top-K is kept in memory for the final ranking.
+    top_k = args.top_k
+    writer = None
+    completed = {}
+    if args.output:
+        # Records from a run against another JD, weights or taxonomy must not be ranked with these
+        run_key = jd_key(jd_text, config['weights'], args.taxonomy_fp, score_month(compiled_jd))
+        previous_run = recorded_run(args.output)
+        if previous_run is not None and previous_run != run_key:
+            print(f"{args.output} holds results for a different JD, weights or taxonomy; "
+                  f"pass a new --output path or delete it to start over.")
+            return
+        writer = ResultWriter(args.output, run_key)
+        completed = load_completed(args.output)
+        if top_k is None:
+            top_k = 100
+    ranking = TopK(top_k)
+    skipped = []
+    # Names of near-duplicates, per input position of the resume they duplicate
+    groups = {}
+    orphans = []
+    for source, record in completed.items():
+        if record['status'] == "ok":
+            record['duplicates'] = groups.setdefault(record['index'], [])
+            ranking.push(record['index'], record)
+        elif record['status'].startswith("skipped: "):
+            skipped.append({"name": record['name'], "skipped": record['status'][len("skipped: "):]})
+        elif record['status'].startswith("duplicate: "):
+            original = completed.get(record['status'][len("duplicate: "):])
+            # A representative replaced later in its run points on to the final one
+            seen = set()
+            while original and original['status'].startswith("duplicate: ") and original['source'] not in seen:
+                seen.add(original['source'])
+                original = completed.get(original['status'][len("duplicate: "):])
+            if original and original['status'] == "ok":
+                groups.setdefault(original['index'], []).append(record['name'])
+            else:
+                # Its representative has no final record (e.g. cut off by a crash): screen it again
+                orphans.append(source)
+    for source in orphans:
+        del completed[source]
+    if completed:
+        print(f"Resuming: {len(completed)} files already recorded in {args.output}.")
+
+    # Position of each in-flight file in the full input stream, so tie-breaks
+    # (and the indices written out) are the same whether or not a run was resumed
+    positions = {}
+
+    def pending():
+        # Streamed: archives are read sequentially once while parsing fans out to the workers.
+        # Exclude the jd file itself if it's in the input folder
+        submitted = 0
+        for position, item in enumerate(iter_resume_sources(input_dir, exclude=[jd_path])):
+            key = source_key(item)
+            if key not in completed:
+                positions[submitted] = (position, key)
+                submitted += 1
+                yield item
+
+    # Near-duplicate clusters of this run (resumed records have no signature to compare)
+    duplicates = make_duplicate_index(config) if args.dedup else None
+    dedup_keys = {}
+    dedup_names = {}
+    # An earlier input arriving later can still take over a cluster, so with --dedup this
+    # run's representatives are held here and only ranked once the run is over
+    held = {}
+
+    def group_duplicate(position, key, result, signature):
+        dedup_keys[position] = key
+        dedup_names[position] = result['name']
+        representative, replaced = duplicates.add(position, signature)
+        group = groups.setdefault(representative, [])
+        # An earlier input joined the cluster: it now stands for the files it replaced
+        for old in replaced:
+            old_result = held.pop(old)
+            group.append(dedup_names[old])
+            group.extend(groups.pop(old, []))
+            # Its "ok" record is already written; the later record wins on resume
+            if writer:
+                writer.write(old, dedup_keys[old], dict(old_result, duplicate=dedup_keys[representative]))
+        if representative != position:
+            group.append(result['name'])
+            return dict(result, duplicate=dedup_keys[representative])
+        return result
+
+    def handle(i, result):
+        position, key = positions.pop(i)
+        record_timings(args, result)
+        signature = result.pop("signature", None)
+        if signature is not None:
+            result = group_duplicate(position, key, result, signature)
+        if writer:
+            writer.write(position, key, result)
+        if "error" in result:
+            print(f"Error processing {result['name']}: {result['error']}")
+        elif "skipped" in result:
+            print(f"Skipped {result['name']}: {result['skipped']}")
+            skipped.append(result)
+        elif "duplicate" in result:
+            print(f"{result['name']} is a near-duplicate of {result['duplicate']}")
+        else:
+            result['duplicates'] = groups.setdefault(position, [])
+            if signature is not None:
+                held[position] = result
+            else:
+                ranking.push(position, result)
+
+    if args.workers > 1 or args.isolated:
+        print(f"Processing with {args.workers} workers...")
+        for index, result in screen_parallel(pending(), skills_taxonomy, config['weights'], jd_data, args.workers,
+                                             cache=cache, parser_options=config.get('parsing'),
+                                             limits=args.limits, minhasher=args.minhasher,
+                                             matcher=keyword_extractor.matcher):
+            if "score" in result:
+                print(f"Processed {result['name']}")
+            handle(index, result)
+    else:
+        for index, item in enumerate(pending()):
+            source, name = source_and_name(item)
+            name = name or source.name
+            print(f"Processing {name}...")
+            try:
+                handle(index, screen_file(source, resume_parser, keyword_extractor, scorer, compiled_jd, cache, name,
+                                          args.minhasher))
+            except Exception as e:
+                handle(index, {"name": name, "error": str(e)})
+
+    for position, result in held.items():
+        ranking.push(position, result)
+    if writer:
+        writer.close()
+    print_results(ranking.ranked(), skipped)
+
+def source_key(item):
+    """Identifies an input across runs: the path, or the archive member name."""
+    return item[0] if isinstance(item, tuple) else str(item)
+
+def source_and_name(item):
+    """Splits an item from `iter_resume_sources` into the source to parse and its name (None for paths)."""
+    if isinstance(item, tuple):
+        return item[1], item[0]
+    return item, None
+
+def record_timings(args, result):
+    """Moves a result's per-stage `"timings"` into the run's metrics, if they are being collected."""
+    timings = result.pop("timings", None)
+    if timings is not None and args.metrics_recorder is not None:
+        args.metrics_recorder.record_file(result['name'], timings)
+
+def make_minhasher(config):
+    dedup = config.get('dedup', {})
+    return MinHasher(dedup.get('num_perm', 128), dedup.get('shingle_size', 5))
+
+def make_duplicate_index(config):
+    dedup = config.get('dedup', {})
+    return DuplicateIndex(dedup.get('num_perm', 128), dedup.get('bands', 16), dedup.get('threshold', 0.8))
+
+def print_results(results, skipped=()):
     print("\n" + "="*60)
     print("SCREENING RESULTS")
     print("="*60)
     for i, res in enumerate(results):
         print(f"Rank #{i+1}: {res['name']} | Score: {res['score']:.2f}/100 | Matched: {', '.join(res['matched'])}")
+        if res.get('duplicates'):
+            print(f"    Near-duplicates: {', '.join(res['duplicates'])}")
+    for res in skipped:
+        print(f"{res['name']} | skipped: {res['skipped']}")
+
+def screen_with_store(args, input_dir, jd_path, jd_text, compiled_jd, config, skills_taxonomy,
+                      resume_parser, keyword_extractor, scorer, cache):
+    """
+    Incremental screening: syncs the candidate store with the input folder (parsing only
+    new or changed files), scores candidates not yet scored for this JD and ranks from the store.
+    """
+    taxonomy_fp = args.taxonomy_fp
+    store = CandidateStore(args.store, taxonomy_fp, parser_fingerprint(config.get('parsing')))
+
+    def extract(paths):
+        if (args.workers > 1 and len(paths) > 1) or (args.isolated and paths):
+            for index, result in extract_parallel(paths, skills_taxonomy, args.workers, cache=cache,
+                                                  include_text=True, parser_options=config.get('parsing'),
+                                                  limits=args.limits, matcher=keyword_extractor.matcher):
+                record_timings(args, result)
+                if "error" in result:
+                    yield paths[index], None, result['error']
+                elif "skipped" in result:
+                    yield paths[index], None, f"skipped: {result['skipped']}"
+                else:
+                    yield paths[index], result['text'], set(result['skills'])
+        else:
+            for path in paths:
+                print(f"Processing {Path(path).name}...")
+                try:
+                    timings = {}
+                    resume_text, resume_skills, _ = extract_resume(path, resume_parser, keyword_extractor, cache,
+                                                                   timings=timings)
+                    record_timings(args, {"name": Path(path).name, "timings": timings})
+                    yield path, resume_text, resume_skills
+                except Exception as e:
+                    yield path, None, str(e)
+
+    if not input_dir.is_dir():
+        print("--store needs a directory as --input; candidates are tracked by file path and mtime.")
+        return
+    # Archives have no per-member path/mtime to track, so only loose files are stored
+    files = iter_resume_sources(input_dir, exclude=[jd_path], archives=False)
+    stats = store.sync(files, extract, keyword_extractor)
+    for name, error in stats['errors']:
+        print(f"Error processing {name}: {error}")
+    print(f"Store: {stats['added']} added, {stats['updated']} updated, "
+          f"{stats['unchanged']} unchanged, {stats['removed']} removed.")
+
+    key = jd_key(jd_text, config['weights'], taxonomy_fp, score_month(compiled_jd))
+    start = time.perf_counter()
+    scored = store.score(key, compiled_jd, scorer, jd_family(jd_text))
+    if args.metrics_recorder is not None:
+        args.metrics_recorder.record("score", time.perf_counter() - start)
+    print(f"Scored {scored} candidates for this JD.")
+    print_results(store.ranking(key, args.top_k))
+    store.close()
+
+def screen_multi_jd(args, config, skills_taxonomy, resume_parser, jd_parser, keyword_extractor, scorer, cache):
+    """
+    Extracts every resume once and scores the whole pool against every JD in `--jd-dir`
+    as a single matrix operation.
+    """
+    jd_dir = Path(args.jd_dir)
+    input_dir = Path(args.input)
+    if not jd_dir.exists() or not input_dir.exists():
+        print(f"Directory {jd_dir if not jd_dir.exists() else input_dir} not found.")
+        return
+
+    jd_paths = sorted(jd_dir.glob("*.txt"))
+    jd_names = [p.name for p in jd_paths]
+    jds = []
+    for jd_path in jd_paths:
+        with open(jd_path, "r", encoding="utf-8") as f:
+            jds.append(scorer.compile_jd(jd_parser.parse(f.read()), keyword_extractor))
+    print(f"Parsed {len(jds)} job descriptions from {jd_dir}.")
+    if not jds:
+        return
+
+    files = iter_resume_sources(input_dir, exclude=jd_paths)
+
+    extracted = []
+    if args.workers > 1 or args.isolated:
+        print(f"Extracting with {args.workers} workers...")
+        for index, result in extract_parallel(files, skills_taxonomy, args.workers, cache=cache,
+                                              parser_options=config.get('parsing'), limits=args.limits,
+                                              minhasher=args.minhasher, matcher=keyword_extractor.matcher):
+            record_timings(args, result)
+            if "error" in result:
+                print(f"Error processing {result['name']}: {result['error']}")
+                continue
+            if "skipped" in result:
+                print(f"Skipped {result['name']}: {result['skipped']}")
+                continue
+            extracted.append((index, result))
+    else:
+        for index, item in enumerate(files):
+            source, name = source_and_name(item)
+            name = name or source.name
+            print(f"Processing {name}...")
+            try:
+                timings = {}
+                resume_text, resume_skills, facts = extract_resume(source, resume_parser, keyword_extractor,
+                                                                   cache, name, timings)
+                result = {"name": name, "skills": sorted(resume_skills), **facts, "timings": timings}
+                if args.minhasher is not None:
+                    result["signature"] = args.minhasher.signature(resume_text)
+                record_timings(args, result)
+                extracted.append((index, result))
+            except Exception as e:
+                print(f"Error processing {name}: {e}")
+    # Keep input order so ties rank the same way as single-JD runs
+    extracted = [result for _, result in sorted(extracted, key=lambda item: item[0])]
+    if args.dedup:
+        extracted = drop_duplicates(extracted, make_duplicate_index(config))
+
+    skill_matrix = keyword_extractor.skill_matrix(r['skills'] for r in extracted)
+    experience_years = np.array([r['experience_years'] for r in extracted], dtype=np.float64)
+    start = time.perf_counter()
+    scored = scorer.score_many(skill_matrix, jds, top_k=args.top_k, experience_years=experience_years)
+    if args.metrics_recorder is not None:
+        # One matrix operation for the whole pool, recorded as a single sample
+        args.metrics_recorder.record("score", time.perf_counter() - start)
+    totals = scored['total_score']
+
+    print("\n" + "="*60)
+    print("RESULTS PER JOB DESCRIPTION")
+    print("="*60)
+    for j, jd_name in enumerate(jd_names):
+        print(f"\n{jd_name}")
+        for rank, i in enumerate(scored['top_indices'][j]):
+            print(f"  Rank #{rank+1}: {extracted[i]['name']} | Score: {totals[i, j]:.2f}/100")
+
+    print("\n" + "="*60)
+    print("BEST FITTING JOBS PER CANDIDATE")
+    print("="*60)
+    for i, res in enumerate(extracted):
+        fits = ", ".join(f"{jd_names[j]} ({totals[i, j]:.2f})" for j in scored['best_jds'][i])
+        print(f"{res['name']}: {fits}")
+        if res.get('duplicates'):
+            print(f"    Near-duplicates: {', '.join(res['duplicates'])}")
+
+def drop_duplicates(extracted, duplicates):
+    """
+    Keeps the first resume of every near-duplicate cluster, listing the others
+    under its `"duplicates"`, so each cluster is scored once.
+    """
+    signed = set()
+    for i, res in enumerate(extracted):
+        signature = res.pop("signature")
+        if signature is not None:
+            duplicates.add(i, signature)
+            signed.add(i)
+    kept = {}
+    for i, res in enumerate(extracted):
+        representative = duplicates.find(i) if i in signed else i
+        if representative == i:
+            kept[i] = dict(res, duplicates=[])
+        else:
+            kept[representative]['duplicates'].append(res['name'])
+    print(f"Near-duplicates: {len(extracted) - len(kept)} of {len(extracted)} resumes grouped.")
+    return list(kept.values())
 
 if __name__ == "__main__":
     main()
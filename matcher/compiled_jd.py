@@ -0,0 +1,80 @@
+from typing import Dict, Iterable, List, Tuple
+
+from extractors.skill_matcher import SkillMatcher
+from extractors.resume_facts import required_years
+
+
+class CompiledJD:
+    """
+    A parsed JD resolved against the skills taxonomy once per batch.
+
+    Every JD line is run through the same matcher used for resumes, so
+    synonyms resolve to canonical skills ("Postgres" -> "SQL"); only its
+    longest, non-overlapping matches count as asked-for skills. Skills are
+    kept as bitmasks over taxonomy skill IDs, which turns per-resume scoring
+    into a few bitwise operations. Lines that mention no known skill are kept
+    as unresolved requirements: they count towards the total but can never
+    be matched, just like before. `min_years` is the experience the JD's
+    experience section asks for ("3+ years ..."), None when it names none.
+    """
+
+    def __init__(self, jd_data: Dict[str, List[str]], matcher: SkillMatcher):
+        self.jd_data = jd_data
+        self.skills = matcher.skills
+        self.skill_index = matcher.skill_index
+
+        self.required_mask, self.required_unresolved = self._resolve(
+            matcher, jd_data.get('required_skills', [])
+        )
+        self.preferred_mask, self.preferred_unresolved = self._resolve(
+            matcher, jd_data.get('preferred_skills', [])
+        )
+        self.required_total = self.required_mask.bit_count() + len(self.required_unresolved)
+        self.preferred_total = self.preferred_mask.bit_count() + len(self.preferred_unresolved)
+        self.min_years = required_years(jd_data.get('experience', []))
+
+    @staticmethod
+    def _resolve(matcher: SkillMatcher, lines: Iterable[str]) -> Tuple[int, List[str]]:
+        mask = 0
+        unresolved = []
+        seen = set()
+        for line in lines:
+            clean = line.lower().strip()
+            # Longest matches only, so "React.js" asks for React and not also JavaScript ("js")
+            skill_ids = matcher.find_ids_longest(clean)
+            if skill_ids:
+                for skill_id in skill_ids:
+                    mask |= 1 << skill_id
+            elif clean and clean not in seen:
+                seen.add(clean)
+                unresolved.append(line.strip())
+        return mask, unresolved
+
+    def mask_of(self, skills: Iterable[str]) -> int:
+        """Bitmask of canonical skill names; names outside the taxonomy are ignored."""
+        mask = 0
+        for skill in skills:
+            skill_id = self.skill_index.get(skill)
+            if skill_id is not None:
+                mask |= 1 << skill_id
+        return mask
+
+    @staticmethod
+    def ids(mask: int) -> List[int]:
+        """Skill IDs for the bits set in `mask`, ascending."""
+        ids = []
+        while mask:
+            low_bit = mask & -mask
+            ids.append(low_bit.bit_length() - 1)
+            mask ^= low_bit
+        return ids
+
+    def names(self, mask: int) -> List[str]:
+        """Canonical skill names for the bits set in `mask`, in taxonomy order."""
+        return [self.skills[skill_id] for skill_id in self.ids(mask)]
+
+    def required_skills(self) -> List[str]:
+        return self.names(self.required_mask) + self.required_unresolved
+
+    def preferred_skills(self) -> List[str]:
+        return self.names(self.preferred_mask) + self.preferred_unresolved
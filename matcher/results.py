@@ -0,0 +1,174 @@
+from typing import Callable, Dict, Iterable, List, Optional, Set
+
+import numpy as np
+
+from matcher.compiled_jd import CompiledJD
+
+SCORE_COLUMNS = ("total_score", "required", "preferred", "experience", "keywords")
+
+
+class ResultTable:
+    """
+    Columnar screening results for one JD.
+
+    Scores are float arrays and each candidate's skills are a packed bitset
+    over taxonomy skill IDs, so a row costs a few dozen bytes instead of a
+    nested dict with four string lists. Matched/missing skills are derived
+    from the bitset and the `CompiledJD` only when a row is materialized
+    with `row`. Resume text is not held at all: `text_keys` (e.g. content
+    hashes) are resolved through `text_loader` on demand. Extracted years of
+    experience (NaN when unknown) and email addresses are kept per row.
+    """
+
+    def __init__(self, jd: CompiledJD, text_loader: Optional[Callable[[str], Optional[str]]] = None):
+        self.jd = jd
+        self.text_loader = text_loader
+        self.names: List[str] = []
+        self.text_keys: List[Optional[str]] = []
+        self.emails: List[Optional[str]] = []
+        self._n = 0
+        self._width = (len(jd.skills) + 7) // 8
+        self._scores = {column: np.zeros(0) for column in SCORE_COLUMNS}
+        self._years = np.zeros(0)
+        self._skills = np.zeros((0, self._width), dtype=np.uint8)
+
+    @classmethod
+    def from_batch(cls, jd: CompiledJD, names: List[str], skill_matrix: np.ndarray, batch: Dict,
+                   text_keys: Optional[List[str]] = None,
+                   text_loader: Optional[Callable[[str], Optional[str]]] = None,
+                   experience_years: Optional[np.ndarray] = None,
+                   emails: Optional[List[Optional[str]]] = None) -> "ResultTable":
+        """Builds a table from a `Scorer.score_batch` result and the matrix (and years) it scored."""
+        table = cls(jd, text_loader)
+        table.names = list(names)
+        table.text_keys = list(text_keys) if text_keys is not None else [None] * len(names)
+        table.emails = list(emails) if emails is not None else [None] * len(names)
+        table._n = len(names)
+        table._scores = {column: np.asarray(batch[column], dtype=np.float64) for column in SCORE_COLUMNS}
+        table._years = (np.asarray(experience_years, dtype=np.float64) if experience_years is not None
+                        else np.full(len(names), np.nan))
+        table._skills = np.packbits(np.asarray(skill_matrix, dtype=bool), axis=1, bitorder='little')
+        return table
+
+    def __len__(self) -> int:
+        return self._n
+
+    def append(self, name: str, skills: Iterable[str], score_data: Dict, text_key: Optional[str] = None,
+               experience_years: Optional[float] = None, email: Optional[str] = None):
+        """Adds one row from `Scorer.score` output; storage grows geometrically."""
+        if self._n == len(self._skills):
+            self._grow(max(16, 2 * self._n))
+        i = self._n
+        self._scores["total_score"][i] = score_data['total_score']
+        for column in SCORE_COLUMNS[1:]:
+            self._scores[column][i] = score_data['breakdown'][column]
+        self._years[i] = np.nan if experience_years is None else experience_years
+        bits = self.jd.mask_of(skills).to_bytes(self._width, 'little')
+        self._skills[i] = np.frombuffer(bits, dtype=np.uint8)
+        self.names.append(name)
+        self.text_keys.append(text_key)
+        self.emails.append(email)
+        self._n += 1
+
+    def _grow(self, capacity: int):
+        for column, values in self._scores.items():
+            grown = np.zeros(capacity)
+            grown[:self._n] = values[:self._n]
+            self._scores[column] = grown
+        grown = np.full(capacity, np.nan)
+        grown[:self._n] = self._years[:self._n]
+        self._years = grown
+        grown = np.zeros((capacity, self._width), dtype=np.uint8)
+        grown[:self._n] = self._skills[:self._n]
+        self._skills = grown
+
+    def remove(self, i: int):
+        """
+        Removes row `i` in constant time by moving the last row into its
+        place, so the last row's index becomes `i`.
+        """
+        last = self._n - 1
+        if i != last:
+            for values in self._scores.values():
+                values[i] = values[last]
+            self._years[i] = self._years[last]
+            self._skills[i] = self._skills[last]
+            self.names[i] = self.names[last]
+            self.text_keys[i] = self.text_keys[last]
+            self.emails[i] = self.emails[last]
+        self.names.pop()
+        self.text_keys.pop()
+        self.emails.pop()
+        self._n = last
+
+    def column(self, name: str) -> np.ndarray:
+        """A score column (or "experience_years") as a read-only view (no copy)."""
+        view = (self._years if name == "experience_years" else self._scores[name])[:self._n]
+        view.flags.writeable = False
+        return view
+
+    def order(self, by: str = "total_score", descending: bool = True) -> np.ndarray:
+        """Row indices sorted by a score column; ties keep row order."""
+        values = (self._years if by == "experience_years" else self._scores[by])[:self._n]
+        return np.argsort(-values if descending else values, kind='stable')
+
+    def take(self, indices: np.ndarray) -> "ResultTable":
+        """A new table with only `indices`, in that order."""
+        indices = np.asarray(indices, dtype=np.intp)
+        table = ResultTable(self.jd, self.text_loader)
+        table.names = [self.names[i] for i in indices]
+        table.text_keys = [self.text_keys[i] for i in indices]
+        table.emails = [self.emails[i] for i in indices]
+        table._n = len(indices)
+        table._scores = {column: values[:self._n][indices] for column, values in self._scores.items()}
+        table._years = self._years[:self._n][indices]
+        table._skills = self._skills[:self._n][indices]
+        return table
+
+    def filter(self, mask: np.ndarray) -> "ResultTable":
+        return self.take(np.flatnonzero(mask))
+
+    def skills_mask(self, i: int) -> int:
+        return int.from_bytes(self._skills[i].tobytes(), 'little')
+
+    def skills(self, i: int) -> Set[str]:
+        return set(self.jd.names(self.skills_mask(i)))
+
+    def experience_years(self, i: int) -> Optional[float]:
+        years = self._years[i]
+        return None if np.isnan(years) else float(years)
+
+    def text(self, i: int) -> Optional[str]:
+        key = self.text_keys[i]
+        if key is None or self.text_loader is None:
+            return None
+        return self.text_loader(key)
+
+    def row(self, i: int) -> Dict:
+        """Materializes row `i` in the same shape as `Scorer.score` output."""
+        jd = self.jd
+        resume_mask = self.skills_mask(i)
+        return {
+            "total_score": float(self._scores["total_score"][i]),
+            "breakdown": {column: float(self._scores[column][i]) for column in SCORE_COLUMNS[1:]},
+            "details": {
+                "matched_required": jd.names(resume_mask & jd.required_mask),
+                "missing_required": jd.names(jd.required_mask & ~resume_mask) + jd.required_unresolved,
+                "matched_preferred": jd.names(resume_mask & jd.preferred_mask),
+                "missing_preferred": jd.names(jd.preferred_mask & ~resume_mask) + jd.preferred_unresolved
+            }
+        }
+
+    def to_dataframe(self):
+        """
+        A pandas DataFrame of names, score columns, years of experience and
+        emails. Numeric columns are passed without copying; skills and text
+        stay in the table.
+        """
+        import pandas as pd
+
+        data = {"name": self.names}
+        data.update({column: self._scores[column][:self._n] for column in SCORE_COLUMNS})
+        data["experience_years"] = self._years[:self._n]
+        data["email"] = self.emails
+        return pd.DataFrame(data, copy=False)
@@ -1,13 +1,30 @@
-from typing import Set, Dict, List
+from typing import Set, Dict, List, Optional, Union
+
+import numpy as np
+
+from matcher.compiled_jd import CompiledJD
+from extractors.resume_facts import required_years
 
 class Scorer:
     def __init__(self, weights: Dict[str, float]):
         self.weights = weights
 
-    def score(self, resume_skills: Set[str], jd_data: Dict[str, List[str]]) -> Dict:
+    def compile_jd(self, jd_data: Dict[str, List[str]], keyword_extractor) -> CompiledJD:
+        """
+        Resolves the JD skills against the extractor's taxonomy once,
+        so every resume in the batch can be scored with bitmasks.
+        """
+        return CompiledJD(jd_data, keyword_extractor.matcher)
+
+    def score(self, resume_skills: Set[str], jd_data: Union[CompiledJD, Dict[str, List[str]]],
+              experience_years: Optional[float] = None) -> Dict:
         """
         Calculates a score (0-100) and returns detailed analysis.
+        Pass a `CompiledJD` (see `compile_jd`) when scoring many resumes against the same JD.
+        `experience_years` comes from `KeywordExtractor.extract_profile` (None if unknown).
         """
+        if isinstance(jd_data, CompiledJD):
+            return self._score_compiled(resume_skills, jd_data, experience_years)
         
         # 1. Required Skills Match
         # Normalize resume skills to lower case for comparison
@@ -37,13 +54,198 @@ class Scorer:
             score_pref = (len(matches_pref) / len(preferred_skills_jd)) * 100
             
         # 3. Experience Match
-        # Placeholder: Award 50 points if we are just screening. 
-        score_exp = 50
+        score_exp = self._experience_score(experience_years, required_years(jd_data.get('experience', [])))
 
         # 4. Keywords Match (Contextual/Domain)
         # Score based on density of skills. Capped at 100 for 10 skills.
         score_keys = min((len(resume_skills) / 10) * 100, 100)
 
+        return self._result(score_req, score_pref, score_exp, score_keys, {
+            "matched_required": list(matches_req),
+            "missing_required": list(missing_req),
+            "matched_preferred": list(matches_pref),
+            "missing_preferred": list(missing_pref)
+        })
+
+    def _score_compiled(self, resume_skills: Set[str], jd: CompiledJD, experience_years: Optional[float]) -> Dict:
+        resume_mask = jd.mask_of(resume_skills)
+
+        # 1./2. Required and Preferred Skills Match (unresolved JD lines are always missing)
+        matches_req = resume_mask & jd.required_mask
+        matches_pref = resume_mask & jd.preferred_mask
+        score_req = (matches_req.bit_count() / jd.required_total) * 100 if jd.required_total else 0
+        score_pref = (matches_pref.bit_count() / jd.preferred_total) * 100 if jd.preferred_total else 0
+
+        # 3. Experience Match
+        score_exp = self._experience_score(experience_years, jd.min_years)
+
+        # 4. Keywords Match
+        score_keys = min((len(resume_skills) / 10) * 100, 100)
+
+        return self._result(score_req, score_pref, score_exp, score_keys, {
+            "matched_required": jd.names(matches_req),
+            "missing_required": jd.names(jd.required_mask & ~resume_mask) + jd.required_unresolved,
+            "matched_preferred": jd.names(matches_pref),
+            "missing_preferred": jd.names(jd.preferred_mask & ~resume_mask) + jd.preferred_unresolved
+        })
+
+    @staticmethod
+    def _experience_score(experience_years: Optional[float], min_years: Optional[float]) -> float:
+        # Share of the required years, capped at 100. Neutral 50 when the JD asks
+        # for no minimum or the resume states no experience.
+        if experience_years is None or min_years is None:
+            return 50
+        if min_years <= 0:
+            return 100
+        return min(experience_years / min_years, 1.0) * 100
+
+    @staticmethod
+    def _experience_scores(experience_years: Optional[np.ndarray], min_years: np.ndarray) -> np.ndarray:
+        """
+        `_experience_score` for candidates x JDs at once: `experience_years` has
+        one entry per candidate and `min_years` one per JD, NaN meaning unknown.
+        """
+        min_years = np.asarray(min_years, dtype=np.float64)[None, :]
+        if experience_years is None:
+            return np.full((1, min_years.shape[1]), 50.0)
+        years = np.asarray(experience_years, dtype=np.float64)[:, None]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            ratio = np.where(min_years > 0, np.minimum(years / min_years, 1.0) * 100, 100.0)
+        return np.where(np.isnan(years) | np.isnan(min_years), 50.0, ratio)
+
+    def score_batch(self, skill_matrix: np.ndarray, jd: CompiledJD, top_k: Optional[int] = None,
+                    experience_years: Optional[np.ndarray] = None) -> Dict:
+        """
+        Scores every candidate in one vectorized pass.
+
+        `skill_matrix` is a candidates x skills boolean matrix over taxonomy
+        skill IDs (see `KeywordExtractor.skill_matrix`); `experience_years` has
+        one entry per candidate (NaN or None when unknown). Returns one array per
+        score (same values as `score`) plus `top_indices`: the indices of the
+        best `top_k` candidates (all candidates when None), highest score
+        first and ties broken by row order.
+        """
+        skill_matrix = np.asarray(skill_matrix, dtype=bool)
+        n = skill_matrix.shape[0]
+        required_ids = np.array(jd.ids(jd.required_mask), dtype=np.intp)
+        preferred_ids = np.array(jd.ids(jd.preferred_mask), dtype=np.intp)
+
+        if jd.required_total:
+            score_req = np.count_nonzero(skill_matrix[:, required_ids], axis=1) * (100.0 / jd.required_total)
+        else:
+            score_req = np.zeros(n)
+        if jd.preferred_total:
+            score_pref = np.count_nonzero(skill_matrix[:, preferred_ids], axis=1) * (100.0 / jd.preferred_total)
+        else:
+            score_pref = np.zeros(n)
+
+        min_years = [np.nan if jd.min_years is None else jd.min_years]
+        score_exp = np.broadcast_to(self._experience_scores(experience_years, min_years)[:, 0], (n,))
+        score_keys = np.minimum(np.count_nonzero(skill_matrix, axis=1) * 10.0, 100.0)
+
+        total_score = np.round(
+            score_req * self.weights['required_skills'] +
+            score_pref * self.weights['preferred_skills'] +
+            score_exp * self.weights['experience'] +
+            score_keys * self.weights['keywords'],
+            2
+        )
+
+        return {
+            "total_score": total_score,
+            "required": np.round(score_req, 2),
+            "preferred": np.round(score_pref, 2),
+            "experience": np.round(score_exp, 2),
+            "keywords": np.round(score_keys, 2),
+            "top_indices": self.top_k(total_score, n if top_k is None else top_k)
+        }
+
+    def score_many(self, skill_matrix: np.ndarray, jds: List[CompiledJD], top_k: int = 10,
+                   best_per_candidate: int = 3, experience_years: Optional[np.ndarray] = None) -> Dict:
+        """
+        Scores every candidate against every JD at once.
+        `experience_years` is as in `score_batch`.
+
+        Skill hits for all JDs come from two matrix products over the shared
+        candidate skill vectors, so the cost is one pass over the pool rather
+        than one `score_batch` per JD. Totals match `score`/`score_batch`.
+
+        Returns:
+            total_score: candidates x JDs matrix of weighted totals.
+            top_indices: per JD, the best `top_k` candidate indices (see `top_k`).
+            best_jds: candidates x `best_per_candidate` JD indices, best fit first.
+        """
+        skills = np.asarray(skill_matrix, dtype=np.float32)
+        n = skills.shape[0]
+        num_skills = skills.shape[1]
+
+        required = np.zeros((num_skills, len(jds)), dtype=np.float32)
+        preferred = np.zeros((num_skills, len(jds)), dtype=np.float32)
+        required_total = np.zeros(len(jds))
+        preferred_total = np.zeros(len(jds))
+        for j, jd in enumerate(jds):
+            required[jd.ids(jd.required_mask), j] = 1
+            preferred[jd.ids(jd.preferred_mask), j] = 1
+            required_total[j] = jd.required_total
+            preferred_total[j] = jd.preferred_total
+
+        # Hit counts are small integers, exact in float32
+        with np.errstate(divide='ignore', invalid='ignore'):
+            req_scale = np.where(required_total > 0, 100.0 / required_total, 0.0)
+            pref_scale = np.where(preferred_total > 0, 100.0 / preferred_total, 0.0)
+        score_req = (skills @ required).astype(np.float64) * req_scale
+        score_pref = (skills @ preferred).astype(np.float64) * pref_scale
+        score_exp = self._experience_scores(
+            experience_years, [np.nan if jd.min_years is None else jd.min_years for jd in jds]
+        )
+        score_keys = np.minimum(skills.sum(axis=1, dtype=np.float64) * 10.0, 100.0)
+
+        total_score = np.round(
+            score_req * self.weights['required_skills'] +
+            score_pref * self.weights['preferred_skills'] +
+            score_exp * self.weights['experience'] +
+            score_keys[:, None] * self.weights['keywords'],
+            2
+        )
+
+        best = max(0, min(best_per_candidate, len(jds)))
+        if 0 < best < len(jds):
+            best_jds = np.argpartition(-total_score, best - 1, axis=1)[:, :best]
+        else:
+            best_jds = np.tile(np.arange(len(jds)), (n, 1))[:, :best]
+        # Order each candidate's picks by score, ties by JD order
+        order = np.lexsort((best_jds, -np.take_along_axis(total_score, best_jds, axis=1)), axis=1)
+        best_jds = np.take_along_axis(best_jds, order, axis=1)
+
+        return {
+            "total_score": total_score,
+            "top_indices": [self.top_k(total_score[:, j], top_k) for j in range(len(jds))],
+            "best_jds": best_jds
+        }
+
+    @staticmethod
+    def top_k(scores: np.ndarray, k: int) -> np.ndarray:
+        """
+        Indices of the `k` highest scores, best first, ties broken by index.
+        Uses partial selection, so only the selected rows get fully sorted.
+        """
+        n = len(scores)
+        k = max(0, min(k, n))
+        if k == 0:
+            return np.empty(0, dtype=np.intp)
+        if k < n:
+            # Everything above the k-th largest value is in; fill the rest with the
+            # earliest rows tied with it, so ties resolve the same way as a stable sort.
+            kth = np.partition(scores, n - k)[n - k]
+            above = np.flatnonzero(scores > kth)
+            ties = np.flatnonzero(scores == kth)[:k - len(above)]
+            candidates = np.concatenate([above, ties])
+        else:
+            candidates = np.arange(n)
+        return candidates[np.lexsort((candidates, -scores[candidates]))]
+
+    def _result(self, score_req: float, score_pref: float, score_exp: float, score_keys: float,
+                details: Dict[str, List[str]]) -> Dict:
         total_score = (
             (score_req * self.weights['required_skills']) +
             (score_pref * self.weights['preferred_skills']) +
@@ -59,12 +261,7 @@ class Scorer:
                 "experience": round(score_exp, 2),
                 "keywords": round(score_keys, 2)
             },
-            "details": {
-                "matched_required": list(matches_req),
-                "missing_required": list(missing_req),
-                "matched_preferred": list(matches_pref),
-                "missing_preferred": list(missing_pref)
-            }
+            "details": details
         }
 
     def _normalize_skills(self, skills_list: List[str]) -> Set[str]:
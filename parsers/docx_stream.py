@@ -0,0 +1,85 @@
+import re
+import zipfile
+import xml.etree.ElementTree as ET
+from typing import Iterator
+
+W_NS = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+MC_FALLBACK = "{http://schemas.openxmlformats.org/markup-compatibility/2006}Fallback"
+
+_P = W_NS + "p"
+_T = W_NS + "t"
+_TAB = W_NS + "tab"
+_TABS = W_NS + "tabs"
+_BR = W_NS + "br"
+_CR = W_NS + "cr"
+
+_HEADER_FOOTER = re.compile(r"word/(header|footer)\d*\.xml$")
+
+
+def docx_text_parts(zf: zipfile.ZipFile) -> list:
+    """Body first, then headers and footers (in part-name order)."""
+    names = zf.namelist()
+    parts = ["word/document.xml"] if "word/document.xml" in names else []
+    parts += sorted(n for n in names if _HEADER_FOOTER.match(n))
+    return parts
+
+
+def iter_docx_paragraphs(source) -> Iterator[str]:
+    """
+    Streams paragraph text out of a DOCX (path or binary file-like object).
+
+    Each XML part is decompressed and parsed incrementally and every element
+    is detached from the tree once it ends, so only the chain of currently
+    open elements is held and memory stays flat regardless of document size
+    or embedded media. Unlike `python-docx`'s `doc.paragraphs`, this also returns text
+    from tables, text boxes, headers and footers. The VML fallback copy of
+    a text box (`mc:Fallback`) is skipped so its text is not doubled.
+    """
+    with zipfile.ZipFile(source) as zf:
+        for part in docx_text_parts(zf):
+            with zf.open(part) as xml_file:
+                yield from _iter_part_paragraphs(xml_file)
+
+
+def _iter_part_paragraphs(xml_file) -> Iterator[str]:
+    # One buffer per open paragraph: text box paragraphs nest inside body paragraphs
+    stack = []
+    fallback_depth = 0
+    # <w:tab> inside <w:tabs> is a tab stop definition, not a tab character
+    in_tab_stops = False
+    # Elements from the root down to the one being parsed
+    open_elems = []
+    for event, elem in ET.iterparse(xml_file, events=("start", "end")):
+        tag = elem.tag
+        if event == "start":
+            open_elems.append(elem)
+            if tag == MC_FALLBACK:
+                fallback_depth += 1
+            elif tag == _TABS:
+                in_tab_stops = True
+            elif tag == _P and not fallback_depth:
+                stack.append([])
+            continue
+
+        if tag == MC_FALLBACK:
+            fallback_depth -= 1
+        elif tag == _TABS:
+            in_tab_stops = False
+        elif fallback_depth or in_tab_stops or not stack:
+            pass
+        elif tag == _T:
+            if elem.text:
+                stack[-1].append(elem.text)
+        elif tag == _TAB:
+            stack[-1].append("\t")
+        elif tag == _BR or tag == _CR:
+            stack[-1].append("\n")
+        elif tag == _P:
+            text = "".join(stack.pop())
+            if text:
+                yield text
+        # Detach the finished element so it (and its subtree) can be freed. Earlier
+        # siblings are already gone, so it is its parent's only child
+        open_elems.pop()
+        if open_elems:
+            open_elems[-1].remove(elem)
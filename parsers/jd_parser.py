@@ -31,6 +31,10 @@ class JDParser:
                 continue
             elif "experience" in line_lower:
                 current_section = "experience"
+                # Keep a requirement on the header line itself ("Experience: 5+ years")
+                _, _, rest = line.partition(':')
+                if rest.strip():
+                    sections["experience"].append(rest.strip())
                 continue
                 
             if current_section and (line.startswith('-') or line.startswith('•')):
@@ -1,37 +1,118 @@
+import io
 import os
 from pathlib import Path
-import PyPDF2
-from docx import Document
+from typing import BinaryIO, Iterator, Optional, Union
+from parsers.docx_stream import iter_docx_paragraphs
+
+# A path, raw bytes (bytes/bytearray/memoryview) or a binary file-like object (e.g. BytesIO)
+ResumeSource = Union[str, os.PathLike, bytes, bytearray, memoryview, BinaryIO]
+
+SUPPORTED_FORMATS = ('.pdf', '.docx', '.txt')
 
 class ResumeParser:
-    def parse(self, file_path: str) -> str:
-        file_path = Path(file_path)
-        ext = file_path.suffix.lower()
+    def __init__(self, max_pages: Optional[int] = None, max_chars: Optional[int] = None):
+        """
+        `max_pages` caps how many PDF pages are read and `max_chars` caps the
+        extracted text for any format; extraction stops as soon as a cap is hit,
+        so a 300-page portfolio costs no more than a resume. None means unlimited.
+        """
+        self.max_pages = max_pages
+        self.max_chars = max_chars
+
+    def parse(self, source: ResumeSource, name: Optional[str] = None) -> str:
+        """
+        Extracts text from a resume on disk or in memory.
+        For in-memory sources the format comes from `name`'s extension when given,
+        otherwise from the leading magic bytes; nothing is written to disk.
+        """
+        return "\n".join(self.iter_text(source, name)).strip()
+
+    def iter_text(self, source: ResumeSource, name: Optional[str] = None) -> Iterator[str]:
+        """
+        Lazily yields the resume text in chunks (PDF pages, DOCX paragraphs, the
+        whole TXT file), within the page/character caps. `parse` joins the chunks
+        with newlines; consumers such as `KeywordExtractor.extract_skills_stream`
+        can process them as they arrive.
+        """
+        if isinstance(source, (str, os.PathLike)):
+            file_path = Path(source)
+            chunks = self._extract(file_path, file_path.suffix.lower())
+        else:
+            stream = self._as_stream(source)
+            ext = Path(name).suffix.lower() if name else self._sniff_format(stream)
+            chunks = self._extract(stream, ext)
+        return self._limit_chars(chunks) if self.max_chars else chunks
+
+    def _extract(self, source, ext: str) -> Iterator[str]:
         if ext == '.pdf':
-            return self._extract_pdf(file_path)
+            return self._extract_pdf(source)
         elif ext == '.docx':
-            return self._extract_docx(file_path)
+            return self._extract_docx(source)
         elif ext == '.txt':
-            return self._extract_txt(file_path)
+            return self._extract_txt(source)
         else:
             raise ValueError(f"Unsupported file format: {ext}")
 
-    def _extract_pdf(self, file_path: Path) -> str:
-        text = ""
-        with open(file_path, "rb") as file:
-            pdf_reader = PyPDF2.PdfReader(file)
-            for page in pdf_reader.pages:
-                page_text = page.extract_text()
-                if page_text:
-                    text += page_text + "\n"
-        return text.strip()
-
-    def _extract_docx(self, file_path: Path) -> str:
-        doc = Document(file_path)
-        return "\n".join(
-            para.text for para in doc.paragraphs
-        ).strip()
-    
-    def _extract_txt(self, file_path: Path) -> str:
-         with open(file_path, "r", encoding="utf-8", errors="ignore") as file:
-            return file.read().strip()
+    def _limit_chars(self, chunks: Iterator[str]) -> Iterator[str]:
+        remaining = self.max_chars
+        for chunk in chunks:
+            if len(chunk) >= remaining:
+                if remaining > 0:
+                    yield chunk[:remaining]
+                # Stop pulling from the generator so no further pages get parsed
+                chunks.close()
+                return
+            yield chunk
+            remaining -= len(chunk) + 1  # joined with "\n"
+
+    @staticmethod
+    def _as_stream(source) -> BinaryIO:
+        if isinstance(source, (bytes, bytearray, memoryview)):
+            return io.BytesIO(source)
+        source.seek(0)
+        return source
+
+    @staticmethod
+    def _sniff_format(stream: BinaryIO) -> str:
+        head = stream.read(8)
+        stream.seek(0)
+        if head.startswith(b"%PDF"):
+            return '.pdf'
+        if head.startswith(b"PK\x03\x04"):
+            # DOCX is a zip container
+            return '.docx'
+        return '.txt'
+
+    def _extract_pdf(self, source) -> Iterator[str]:
+        if isinstance(source, Path):
+            with open(source, "rb") as file:
+                yield from self._extract_pdf(file)
+            return
+        # Imported on first use: PyPDF2 is slow to import and many runs never see a PDF
+        import PyPDF2
+
+        pdf_reader = PyPDF2.PdfReader(source)
+        # Pages are only parsed when reached, so stopping early skips the rest of the file
+        for page_number, page in enumerate(pdf_reader.pages):
+            if self.max_pages is not None and page_number >= self.max_pages:
+                break
+            page_text = page.extract_text()
+            if page_text:
+                yield page_text
+
+    def _extract_docx(self, source) -> Iterator[str]:
+        # Streams the XML parts instead of building python-docx's object model;
+        # also picks up tables, text boxes, headers and footers.
+        return iter_docx_paragraphs(source)
+
+    def _extract_txt(self, source) -> Iterator[str]:
+        if isinstance(source, Path):
+            with open(source, "r", encoding="utf-8", errors="ignore") as file:
+                # Don't load more than the character cap could ever keep
+                yield file.read(self.max_chars or -1)
+            return
+        data = source.getbuffer() if isinstance(source, io.BytesIO) else source.read()
+        if self.max_chars:
+            # UTF-8 needs at most 4 bytes per character
+            data = data[:self.max_chars * 4]
+        yield str(data, "utf-8", errors="ignore")
@@ -0,0 +1,318 @@
+import io
+import multiprocessing
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, Optional, Set, Tuple
+
+from parsers.resume_parser import ResumeParser
+from extractors.keyword_extractor import KeywordExtractor
+from extractors.skill_matcher import SkillMatcher
+from extractors.resume_facts import extract_facts
+from matcher.scorer import Scorer
+from pipeline.cache import ParseCache, content_hash
+from pipeline.dedup import MinHasher
+from pipeline.isolation import SAFE_START_METHOD, IsolatedPool
+
+# Components built once per worker process by `_init_worker`
+_worker = {}
+
+
+def extract_resume(source, resume_parser: ResumeParser, keyword_extractor: KeywordExtractor,
+                   cache: Optional[ParseCache] = None, name: Optional[str] = None,
+                   timings: Optional[Dict[str, float]] = None) -> Tuple[str, Set[str], Dict]:
+    """
+    Returns `(resume_text, resume_skills, facts)` for a resume path or in-memory
+    source (bytes or a file-like object such as an upload, with its file `name`),
+    where `facts` holds `experience_years`, `email` and `phone`.
+    Goes through `cache` when given so unchanged files skip parsing (and skill
+    extraction, while the taxonomy is unchanged); facts are cheap to recompute
+    from cached text and depend on today's date, so they are not cached.
+    Seconds spent are added to `timings` under "parse" (reading, hashing, cache
+    lookups and parsing) and "extract" (skills and facts) when it is given.
+    """
+    if timings is None:
+        timings = {}
+    if cache is None:
+        return _parse_and_extract(source, name, resume_parser, keyword_extractor, timings)
+
+    start = time.perf_counter()
+
+    if isinstance(source, (str, os.PathLike)):
+        # Read once; the same bytes are hashed and, on a miss, parsed from memory
+        with open(source, "rb") as f:
+            source, name = f.read(), Path(source).name
+    data = source.getbuffer() if isinstance(source, io.BytesIO) else source
+    if not isinstance(data, (bytes, bytearray, memoryview)):
+        data = source.read()
+        source = data
+
+    key = content_hash(data)
+    resume_text, resume_skills = cache.get(key)
+    _add_time(timings, "parse", start)
+    if resume_text is None:
+        resume_text, resume_skills, facts = _parse_and_extract(source, name, resume_parser, keyword_extractor,
+                                                               timings)
+        start = time.perf_counter()
+        cache.put(key, resume_text, resume_skills)
+        _add_time(timings, "parse", start)
+    elif resume_skills is None:
+        start = time.perf_counter()
+        profile = keyword_extractor.extract_profile(resume_text)
+        resume_skills = profile.pop("skills")
+        facts = profile
+        _add_time(timings, "extract", start)
+        cache.put(key, resume_text, resume_skills)
+    else:
+        start = time.perf_counter()
+        facts = extract_facts(resume_text)
+        _add_time(timings, "extract", start)
+    return resume_text, resume_skills, facts
+
+
+def _add_time(timings: Dict[str, float], stage: str, start: float) -> float:
+    now = time.perf_counter()
+    timings[stage] = timings.get(stage, 0.0) + now - start
+    return now
+
+
+def _parse_and_extract(source, name: Optional[str], resume_parser: ResumeParser,
+                       keyword_extractor: KeywordExtractor,
+                       timings: Dict[str, float]) -> Tuple[str, Set[str], Dict]:
+    # Skills and facts are extracted page by page while the parser streams the document;
+    # time spent producing a chunk counts as parsing, the rest as extraction
+    chunks = []
+    parse_seconds = 0.0
+
+    def collect():
+        nonlocal parse_seconds
+        pages = iter(resume_parser.iter_text(source, name))
+        while True:
+            start = time.perf_counter()
+            chunk = next(pages, None)
+            parse_seconds += time.perf_counter() - start
+            if chunk is None:
+                return
+            chunks.append(chunk)
+            yield chunk
+
+    start = time.perf_counter()
+    profile = keyword_extractor.extract_profile_stream(collect())
+    elapsed = time.perf_counter() - start
+    timings["parse"] = timings.get("parse", 0.0) + parse_seconds
+    timings["extract"] = timings.get("extract", 0.0) + elapsed - parse_seconds
+    resume_skills = profile.pop("skills")
+    return "\n".join(chunks).strip(), resume_skills, profile
+
+
+def screen_file(source, resume_parser: ResumeParser, keyword_extractor: KeywordExtractor,
+                scorer: Scorer, jd_data: Dict, cache: Optional[ParseCache] = None,
+                name: Optional[str] = None, minhasher: Optional[MinHasher] = None) -> Dict:
+    """
+    Parses, extracts and scores a single resume (a path, or an in-memory source with its `name`).
+    Shared by the serial CLI loop and the worker processes so both produce identical results.
+    With a `minhasher`, the result also carries the text's MinHash `"signature"`
+    (None for empty text) for near-duplicate detection.
+    `"timings"` holds the seconds spent per stage (parse, extract, score).
+    """
+    timings = {}
+    resume_text, resume_skills, facts = extract_resume(source, resume_parser, keyword_extractor, cache, name,
+                                                       timings)
+    start = time.perf_counter()
+    score_data = scorer.score(resume_skills, jd_data, facts['experience_years'])
+    start = _add_time(timings, "score", start)
+    result = {
+        "name": name or Path(source).name,
+        "score": score_data['total_score'],
+        "matched": sorted(resume_skills),
+        "timings": timings
+    }
+    if minhasher is not None:
+        result["signature"] = minhasher.signature(resume_text)
+        _add_time(timings, "extract", start)
+    return result
+
+
+def _init_worker(skills_taxonomy: Dict, matcher: Optional[SkillMatcher], weights: Dict[str, float],
+                 jd_data: Optional[Dict], parser_options: Dict, minhasher: Optional[MinHasher],
+                 cache_args: Optional[Tuple[str, str, int, str]]):
+    _worker["parser"] = ResumeParser(**parser_options)
+    _worker["minhasher"] = minhasher
+    # The parent's compiled matcher (inherited on fork, unpickled otherwise) instead of recompiling
+    _worker["extractor"] = KeywordExtractor(skills_taxonomy, matcher)
+    _worker["scorer"] = Scorer(weights)
+    if jd_data is not None:
+        _worker["jd_data"] = _worker["scorer"].compile_jd(jd_data, _worker["extractor"])
+    # Each process opens its own connection; SQLite connections can't cross a fork
+    _worker["cache"] = ParseCache(*cache_args) if cache_args else None
+
+
+def _task_name(task: Tuple) -> str:
+    return task[2] if task[2] else Path(task[1]).name
+
+
+def _screen_task(task: Tuple[int, object, Optional[str]]) -> Tuple[int, Dict]:
+    index, source, name = task
+    try:
+        result = screen_file(
+            source, _worker["parser"], _worker["extractor"], _worker["scorer"], _worker["jd_data"],
+            _worker["cache"], name, _worker["minhasher"]
+        )
+    except MemoryError:
+        # Let an isolated worker report the file as skipped and recycle itself
+        raise
+    except Exception as e:
+        result = {"name": _task_name(task), "error": str(e)}
+    return index, result
+
+
+def _extract_task(task: Tuple[int, object, Optional[str]], include_text: bool = False) -> Tuple[int, Dict]:
+    index, source, name = task
+    try:
+        timings = {}
+        resume_text, resume_skills, facts = extract_resume(
+            source, _worker["parser"], _worker["extractor"], _worker["cache"], name, timings
+        )
+        result = {"name": _task_name(task), "skills": sorted(resume_skills), **facts, "timings": timings}
+        if include_text:
+            result["text"] = resume_text
+        if _worker["minhasher"] is not None:
+            start = time.perf_counter()
+            result["signature"] = _worker["minhasher"].signature(resume_text)
+            _add_time(timings, "extract", start)
+    except MemoryError:
+        raise
+    except Exception as e:
+        result = {"name": _task_name(task), "error": str(e)}
+    return index, result
+
+
+def _extract_with_text_task(task: Tuple[int, object, Optional[str]]) -> Tuple[int, Dict]:
+    return _extract_task(task, include_text=True)
+
+
+def _run_pool(task_fn, files: Iterable, workers: int, chunksize: int, initargs: Tuple,
+              cache: Optional[ParseCache], limits: Optional[Dict],
+              start_method: Optional[str] = None) -> Iterator[Tuple[int, Dict]]:
+    # Items are paths, or (name, bytes) pairs for in-memory sources such as uploads
+    # and archive members. `files` may be a lazy stream; it is consumed as workers free up.
+    total = len(files) if hasattr(files, '__len__') else None
+    tasks = (
+        (i, f[1], f[0]) if isinstance(f, tuple) else (i, str(f), None)
+        for i, f in enumerate(files)
+    )
+    cache_args = (cache.path, cache.taxonomy_fp, cache.max_bytes, cache.parser_fp) if cache else None
+    initargs = initargs + (cache_args,)
+
+    timeout = (limits or {}).get('timeout_seconds')
+    max_memory_mb = (limits or {}).get('max_memory_mb')
+    if timeout or max_memory_mb:
+        # One task per worker round trip, so a single pathological file can be
+        # killed (and reported as skipped) without taking other files with it.
+        pool = IsolatedPool(workers, _init_worker, initargs, timeout=timeout, max_memory_mb=max_memory_mb,
+                            start_method=start_method)
+        yield from pool.imap_unordered(task_fn, tasks)
+        return
+    # Pool pickles its tasks, and memoryviews can't be pickled
+    tasks = ((i, bytes(source) if isinstance(source, memoryview) else source, name) for i, source, name in tasks)
+
+    if not chunksize:
+        # Roughly four chunks per worker keeps the pool balanced without
+        # paying a round trip per file.
+        chunksize = max(1, min(64, total // (workers * 4))) if total else 16
+
+    # Pool's feeder thread drains its input eagerly; cap the tasks in flight so a
+    # streamed archive is never held in memory as a whole.
+    slots = threading.Semaphore(workers * chunksize * 4)
+    stop = threading.Event()
+
+    def throttled():
+        for task in tasks:
+            while not slots.acquire(timeout=0.1):
+                if stop.is_set():
+                    return
+            yield task
+
+    with multiprocessing.get_context(start_method).Pool(
+        processes=workers,
+        initializer=_init_worker,
+        initargs=initargs,
+    ) as pool:
+        try:
+            for index, result in pool.imap_unordered(task_fn, throttled(), chunksize=chunksize):
+                slots.release()
+                yield index, result
+            # Let the workers exit normally rather than be terminated by `with`,
+            # so their caches write pending access times (see `ParseCache`)
+            pool.close()
+            pool.join()
+        finally:
+            # Unblock the feeder before the pool shuts down and joins it
+            stop.set()
+
+
+def screen_parallel(files: Iterable, skills_taxonomy: Dict, weights: Dict[str, float], jd_data: Dict,
+                    workers: int, chunksize: int = 0, cache: Optional[ParseCache] = None,
+                    parser_options: Optional[Dict] = None, limits: Optional[Dict] = None,
+                    minhasher: Optional[MinHasher] = None, matcher: Optional[SkillMatcher] = None,
+                    start_method: Optional[str] = None) -> Iterator[Tuple[int, Dict]]:
+    """
+    Screens `files` across a pool of `workers` processes.
+    Items in `files` are paths or `(name, data)` pairs for in-memory resumes;
+    `files` may be a lazy stream (e.g. `pipeline.sources.iter_resume_sources`).
+
+    Yields `(index, result)` pairs in completion order, where `index` is the
+    position of the file in `files` and `result` is either the dict returned by
+    `screen_file`, `{"name": ..., "error": ...}` or, when `limits` are set,
+    `{"name": ..., "skipped": "timeout" | "oom" | "crashed"}`.
+    Tasks are submitted in chunks to keep IPC overhead low for small files.
+    When `cache` is given, every worker opens the same cache file.
+    `parser_options` are passed to each worker's `ResumeParser` (page/character caps).
+    `limits` (`timeout_seconds`, `max_memory_mb`) switch to an `IsolatedPool`
+    that enforces them per file.
+    With a `minhasher`, results carry a MinHash `"signature"` (see `screen_file`).
+    Pass the `matcher` already compiled from `skills_taxonomy` (e.g. the
+    `CompiledTaxonomy.matcher`) so workers do not each compile their own.
+    `start_method` is the multiprocessing start method for the workers
+    (`pipeline.isolation.SAFE_START_METHOD` from multithreaded processes).
+    """
+    initargs = (skills_taxonomy, matcher, weights, jd_data, parser_options or {}, minhasher)
+    return _run_pool(_screen_task, files, workers, chunksize, initargs, cache, limits, start_method)
+
+
+def extract_parallel(files: Iterable, skills_taxonomy: Dict, workers: int, chunksize: int = 0,
+                     cache: Optional[ParseCache] = None, include_text: bool = False,
+                     parser_options: Optional[Dict] = None, limits: Optional[Dict] = None,
+                     minhasher: Optional[MinHasher] = None, matcher: Optional[SkillMatcher] = None,
+                     start_method: Optional[str] = None) -> Iterator[Tuple[int, Dict]]:
+    """
+    Like `screen_parallel`, but only parses and extracts: results are
+    `{"name": ..., "skills": [...], "experience_years": ..., "email": ..., "phone": ...}`
+    (plus `"text"` with `include_text` and
+    `"signature"` with a `minhasher`) and `"timings"`, to be scored later (e.g. against many JDs).
+    """
+    task_fn = _extract_with_text_task if include_text else _extract_task
+    initargs = (skills_taxonomy, matcher, {}, None, parser_options or {}, minhasher)
+    return _run_pool(task_fn, files, workers, chunksize, initargs, cache, limits, start_method)
+
+
+def extraction_pool(skills_taxonomy: Dict, workers: int, cache: Optional[ParseCache] = None,
+                    parser_options: Optional[Dict] = None, limits: Optional[Dict] = None,
+                    matcher: Optional[SkillMatcher] = None) -> IsolatedPool:
+    """
+    A started, long-lived `IsolatedPool` whose workers are set up like
+    `extract_parallel`'s, for extracting single resumes as they arrive with
+    `pool.run((0, source, name))` (e.g. from asyncio via `loop.run_in_executor`
+    on a thread pool). Results are `extract_parallel` results; `limits` apply
+    per file as there. Workers are started with `SAFE_START_METHOD`, so they
+    inherit no sockets or locks from a server process.
+    """
+    cache_args = (cache.path, cache.taxonomy_fp, cache.max_bytes, cache.parser_fp) if cache else None
+    pool = IsolatedPool(workers, _init_worker,
+                        (skills_taxonomy, matcher, {}, None, parser_options or {}, None, cache_args),
+                        timeout=(limits or {}).get('timeout_seconds'),
+                        max_memory_mb=(limits or {}).get('max_memory_mb'),
+                        start_method=SAFE_START_METHOD)
+    pool.start(_extract_task)
+    return pool
@@ -0,0 +1,171 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from multiprocessing.util import Finalize
+from typing import Dict, Optional, Set, Tuple
+
+# Hits record their access time in memory; it is written once this many are
+# pending or the oldest is this many seconds old, on `put`, and on close/exit
+ACCESS_BATCH = 256
+ACCESS_FLUSH_SECONDS = 5.0
+# Other processes sharing the file change its size too; the running total is re-read this often
+RESYNC_PUTS = 1000
+
+
+def content_hash(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def taxonomy_fingerprint(skills_taxonomy: Dict) -> str:
+    """Stable hash of the taxonomy; cached skills are only valid for the taxonomy that produced them."""
+    canonical = json.dumps(skills_taxonomy, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def parser_fingerprint(parser_options: Optional[Dict]) -> str:
+    """
+    Canonical form (compact, key-sorted JSON) of the parser options; text parsed
+    under other page/character caps is not reused.
+    """
+    return json.dumps(parser_options or {}, sort_keys=True, separators=(",", ":"))
+
+
+def _write_access_times(conn: sqlite3.Connection, accessed: Dict[str, float], commit: bool = True):
+    if accessed:
+        conn.executemany("UPDATE entries SET last_access = ? WHERE hash = ?",
+                         [(when, key) for key, when in accessed.items()])
+        accessed.clear()
+        if commit:
+            conn.commit()
+
+
+def _close(conn: sqlite3.Connection, accessed: Dict[str, float], lock: threading.Lock):
+    with lock:
+        _write_access_times(conn, accessed)
+        conn.close()
+
+
+class ParseCache:
+    """
+    Persistent, content-addressed cache of parsed resume text and extracted skills.
+
+    Entries are keyed by the SHA-256 of the file bytes, so renamed or copied
+    files still hit. The skills stored with an entry are tagged with the
+    taxonomy fingerprint and ignored once the taxonomy changes (the parsed
+    text stays valid). Entries parsed with other parser options (e.g. a
+    different `max_pages`) are treated as misses. The total size is bounded; least recently used entries
+    are evicted first.
+
+    Hits only write their access time in batches (see `ACCESS_BATCH`), and
+    the total size is kept as a running figure rather than summed on every
+    `put`, so neither lookups nor inserts pay for a commit or a table scan
+    of their own. Pending access times are written on `close`, or when the
+    process exits normally (pool workers in `pipeline.batch` are shut down
+    that way; a terminated process loses them).
+    """
+
+    def __init__(self, path: str, taxonomy_fp: str, max_bytes: int = 512 * 1024 * 1024, parser_fp: str = ""):
+        self.path = path
+        self.taxonomy_fp = taxonomy_fp
+        self.max_bytes = max_bytes
+        self.parser_fp = parser_fp
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        # Several worker processes may share the file, so wait on locks instead of failing.
+        # The Streamlit app shares one instance across script threads, guarded by `_lock`.
+        self.conn = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        self._lock = threading.Lock()
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS entries (
+                hash TEXT PRIMARY KEY,
+                text TEXT NOT NULL,
+                skills TEXT,
+                taxonomy TEXT,
+                size INTEGER NOT NULL,
+                last_access REAL NOT NULL,
+                parser TEXT NOT NULL DEFAULT ''
+            )
+        """)
+        columns = {row[1] for row in self.conn.execute("PRAGMA table_info(entries)")}
+        if "parser" not in columns:  # caches written before parser options were recorded
+            self.conn.execute("ALTER TABLE entries ADD COLUMN parser TEXT NOT NULL DEFAULT ''")
+        self.conn.execute("CREATE INDEX IF NOT EXISTS idx_entries_last_access ON entries(last_access)")
+        self.conn.commit()
+        self._total_bytes = self._stored_bytes()
+        self._puts = 0
+        # Content hash -> time of its latest hit, not yet written
+        self._accessed: Dict[str, float] = {}
+        self._accessed_since = time.monotonic()
+        self._finalizer = Finalize(self, _close, (self.conn, self._accessed, self._lock), exitpriority=0)
+
+    def _stored_bytes(self) -> int:
+        return self.conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+
+    def get(self, key: str) -> Tuple[Optional[str], Optional[Set[str]]]:
+        """
+        Returns `(text, skills)` for a content hash.
+        `text` is None on a miss (including text parsed with other parser
+        options); `skills` is None when they were extracted
+        with a different taxonomy and need to be recomputed.
+        """
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT text, skills, taxonomy FROM entries WHERE hash = ? AND parser = ?", (key, self.parser_fp)
+            ).fetchone()
+            if row is None:
+                return None, None
+            if not self._accessed:
+                self._accessed_since = time.monotonic()
+            self._accessed[key] = time.time()
+            if len(self._accessed) >= ACCESS_BATCH or time.monotonic() - self._accessed_since >= ACCESS_FLUSH_SECONDS:
+                _write_access_times(self.conn, self._accessed)
+        text, skills, taxonomy = row
+        if skills is None or taxonomy != self.taxonomy_fp:
+            return text, None
+        return text, set(json.loads(skills))
+
+    def put(self, key: str, text: str, skills: Set[str]):
+        skills_json = json.dumps(sorted(skills))
+        size = len(text.encode("utf-8")) + len(skills_json)
+        with self._lock:
+            replaced = self.conn.execute("SELECT size FROM entries WHERE hash = ?", (key,)).fetchone()
+            self.conn.execute(
+                "INSERT OR REPLACE INTO entries (hash, text, skills, taxonomy, size, last_access, parser) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (key, text, skills_json, self.taxonomy_fp, size, time.time(), self.parser_fp),
+            )
+            self._accessed.pop(key, None)
+            # Same transaction: eviction below orders by up-to-date access times
+            _write_access_times(self.conn, self._accessed, commit=False)
+            self.conn.commit()
+            self._total_bytes += size - (replaced[0] if replaced else 0)
+            self._puts += 1
+            if self._puts % RESYNC_PUTS == 0:
+                self._total_bytes = self._stored_bytes()
+            self._evict()
+
+    def _evict(self):
+        if self._total_bytes <= self.max_bytes:
+            return
+        # Evict from the real figure, which includes what other processes added since the last re-read
+        total = self._stored_bytes()
+        self._total_bytes = total
+        if total <= self.max_bytes:
+            return
+        to_delete = []
+        for key, size in self.conn.execute("SELECT hash, size FROM entries ORDER BY last_access"):
+            if total <= self.max_bytes:
+                break
+            to_delete.append((key,))
+            total -= size
+        self.conn.executemany("DELETE FROM entries WHERE hash = ?", to_delete)
+        self.conn.commit()
+        self._total_bytes = total
+
+    def close(self):
+        self._finalizer()
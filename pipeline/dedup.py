@@ -0,0 +1,109 @@
+import re
+import zlib
+from typing import Dict, Hashable, List, Optional, Set, Tuple
+
+import numpy as np
+
+# Largest prime below 2**32: hash values fit in uint32 and a*x + b can't overflow uint64
+_PRIME = 4294967291
+_WORD_RE = re.compile(r"\w+")
+# Shingles hashed per block, bounding the (shingles x permutations) temporary
+_BLOCK = 2048
+
+
+class MinHasher:
+    """
+    MinHash signatures over word shingles: the fraction of equal positions in two
+    signatures estimates the Jaccard similarity of the two texts' shingle sets.
+    Hashing is seeded and uses crc32, so signatures agree across processes.
+    """
+
+    def __init__(self, num_perm: int = 128, shingle_size: int = 5, seed: int = 1):
+        self.num_perm = num_perm
+        self.shingle_size = shingle_size
+        rng = np.random.RandomState(seed)
+        self._a = rng.randint(1, 1 << 31, size=num_perm).astype(np.uint64)
+        self._b = rng.randint(0, 1 << 31, size=num_perm).astype(np.uint64)
+
+    def shingles(self, text: str) -> np.ndarray:
+        """Distinct hashes of the text's `shingle_size`-word windows (case-insensitive)."""
+        words = _WORD_RE.findall(text.lower())
+        k = self.shingle_size
+        grams = (" ".join(words[i:i + k]) for i in range(max(1, len(words) - k + 1))) if words else ()
+        hashes = np.fromiter((zlib.crc32(g.encode("utf-8")) for g in grams), dtype=np.uint64)
+        return np.unique(hashes)
+
+    def signature(self, text: str) -> Optional[np.ndarray]:
+        """uint32 signature of length `num_perm`, or None for text without words."""
+        shingles = self.shingles(text)
+        if not len(shingles):
+            return None
+        signature = np.full(self.num_perm, _PRIME, dtype=np.uint64)
+        for start in range(0, len(shingles), _BLOCK):
+            block = shingles[start:start + _BLOCK, None]
+            hashed = (block * self._a + self._b) % _PRIME
+            np.minimum(signature, hashed.min(axis=0), out=signature)
+        return signature.astype(np.uint32)
+
+
+def similarity(signature_a: np.ndarray, signature_b: np.ndarray) -> float:
+    """Estimated Jaccard similarity of the texts behind two signatures."""
+    return float(np.mean(signature_a == signature_b))
+
+
+class DuplicateIndex:
+    """
+    Streaming near-duplicate clustering.
+
+    Signatures are split into `bands`; two items become candidates when any
+    band matches exactly (locality-sensitive hashing), so each insert only
+    looks at a handful of earlier items instead of all of them. Candidates
+    whose estimated similarity reaches `threshold` are merged with union-find.
+    The representative of a cluster is its smallest item ID, so the outcome
+    does not depend on the order items arrive in.
+    """
+
+    def __init__(self, num_perm: int = 128, bands: int = 16, threshold: float = 0.8):
+        if num_perm % bands:
+            raise ValueError("num_perm must be a multiple of bands")
+        self.rows = num_perm // bands
+        self.threshold = threshold
+        self._buckets: List[Dict[bytes, List[Hashable]]] = [{} for _ in range(bands)]
+        self._signatures: Dict[Hashable, np.ndarray] = {}
+        self._parent: Dict[Hashable, Hashable] = {}
+
+    def find(self, item_id: Hashable) -> Hashable:
+        """The representative of `item_id`'s cluster (itself when it has no duplicates)."""
+        parent = self._parent
+        root = item_id
+        while parent[root] != root:
+            root = parent[root]
+        while parent[item_id] != root:
+            parent[item_id], item_id = root, parent[item_id]
+        return root
+
+    def add(self, item_id: Hashable, signature: np.ndarray) -> Tuple[Hashable, List[Hashable]]:
+        """
+        Indexes an item and merges it into every cluster it is a near-duplicate of.
+        Returns `(representative, replaced)`, where `replaced` lists former
+        representatives (other than `item_id`) that are now part of this cluster.
+        """
+        candidates: Set[Hashable] = set()
+        rows = self.rows
+        for band, buckets in enumerate(self._buckets):
+            bucket = buckets.setdefault(signature[band * rows:(band + 1) * rows].tobytes(), [])
+            candidates.update(bucket)
+            bucket.append(item_id)
+        self._signatures[item_id] = signature
+        self._parent[item_id] = item_id
+
+        roots = {item_id}
+        for other in candidates:
+            root = self.find(other)
+            # One verified member is enough to join a cluster
+            if root not in roots and similarity(signature, self._signatures[other]) >= self.threshold:
+                roots.add(root)
+        representative = min(roots)
+        for root in roots:
+            self._parent[root] = representative
+        return representative, sorted(roots - {representative, item_id})
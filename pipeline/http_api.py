@@ -0,0 +1,151 @@
+import asyncio
+import json
+from typing import Dict, Optional, Tuple
+from urllib.parse import parse_qs, unquote, urlsplit
+
+from pipeline.service import ScreeningService
+
+REASONS = {200: "OK", 201: "Created", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+           411: "Length Required", 413: "Payload Too Large", 422: "Unprocessable Entity",
+           500: "Internal Server Error"}
+
+
+class HTTPError(Exception):
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+class ScreeningAPI:
+    """
+    Minimal HTTP/1.1 JSON API over a `ScreeningService`, served with asyncio
+    streams (one request per connection).
+
+        GET    /health                      service status
+        GET    /metrics                     stage timings, Prometheus text format
+        POST   /resumes?name=jane.pdf       body: the resume file; parses and scores it
+        GET    /candidates                  every indexed candidate
+        DELETE /candidates/{id}
+        POST   /jds?name=backend            body: JD text; scores the whole pool against it
+        GET    /jds                         every JD
+        GET    /jds/{id}/ranking?limit=20&offset=0
+        DELETE /jds/{id}
+    """
+
+    def __init__(self, service: ScreeningService, max_body_bytes: int = 20 * 1024 * 1024):
+        self.service = service
+        self.max_body_bytes = max_body_bytes
+
+    async def serve(self, host: str = "127.0.0.1", port: int = 8765) -> asyncio.AbstractServer:
+        return await asyncio.start_server(self._handle, host, port)
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            try:
+                method, target, headers = await self._read_head(reader)
+                body = await self._read_body(reader, headers)
+                status, payload = await self.route(method, target, headers, body)
+            except HTTPError as e:
+                status, payload = e.status, {"error": str(e)}
+            except (asyncio.IncompleteReadError, ConnectionError):
+                return
+            except Exception as e:
+                status, payload = 500, {"error": str(e)}
+            writer.write(self._response(status, payload))
+            await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    async def _read_head(self, reader: asyncio.StreamReader) -> Tuple[str, str, Dict[str, str]]:
+        request_line = (await reader.readline()).decode("latin-1").strip()
+        parts = request_line.split(" ")
+        if len(parts) != 3:
+            raise HTTPError(400, "malformed request line")
+        headers = {}
+        while True:
+            line = await reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            key, _, value = line.decode("latin-1").partition(":")
+            headers[key.strip().lower()] = value.strip()
+        return parts[0].upper(), parts[1], headers
+
+    async def _read_body(self, reader: asyncio.StreamReader, headers: Dict[str, str]) -> bytes:
+        if "chunked" in headers.get("transfer-encoding", ""):
+            raise HTTPError(411, "send a Content-Length")
+        try:
+            length = int(headers.get("content-length", 0))
+        except ValueError:
+            length = -1
+        if length < 0:
+            raise HTTPError(400, "invalid Content-Length")
+        if length > self.max_body_bytes:
+            raise HTTPError(413, f"body larger than {self.max_body_bytes} bytes")
+        return await reader.readexactly(length) if length else b""
+
+    @staticmethod
+    def _response(status: int, payload) -> bytes:
+        if isinstance(payload, str):
+            body, content_type = payload.encode("utf-8"), "text/plain; version=0.0.4"
+        else:
+            body, content_type = json.dumps(payload).encode("utf-8"), "application/json"
+        head = (f"HTTP/1.1 {status} {REASONS.get(status, '')}\r\n"
+                f"Content-Type: {content_type}\r\nContent-Length: {len(body)}\r\nConnection: close\r\n\r\n")
+        return head.encode("latin-1") + body
+
+    async def route(self, method: str, target: str, headers: Dict[str, str], body: bytes):
+        url = urlsplit(target)
+        query = {key: values[-1] for key, values in parse_qs(url.query).items()}
+        parts = [unquote(p) for p in url.path.strip("/").split("/") if p]
+        service = self.service
+
+        if parts == ["health"] and method == "GET":
+            return 200, {"status": "ok", **service.status()}
+        if parts == ["metrics"] and method == "GET":
+            return 200, service.metrics.prometheus()
+
+        if parts == ["resumes"] and method == "POST":
+            if not body:
+                raise HTTPError(400, "empty body; send the resume file")
+            name = query.get("name") or "resume.txt"
+            summary = await service.add_resume(body, name)
+            if "error" in summary:
+                raise HTTPError(422, summary["error"])
+            return 201, summary
+        if parts == ["candidates"] and method == "GET":
+            return 200, [service.candidate_summary(c) for c in service.candidates.values()]
+        if len(parts) == 2 and parts[0] == "candidates" and method == "DELETE":
+            if not service.remove_candidate(parts[1]):
+                raise HTTPError(404, "no such candidate")
+            return 200, {"deleted": parts[1]}
+
+        if parts == ["jds"] and method == "POST":
+            text = body.decode("utf-8", errors="replace")
+            if not text.strip():
+                raise HTTPError(400, "empty body; send the JD text")
+            return 201, service.add_jd(text, query.get("name"))
+        if parts == ["jds"] and method == "GET":
+            return 200, [service.jd_summary(jd) for jd in service.jds.values()]
+        if len(parts) == 3 and parts[0] == "jds" and parts[2] == "ranking" and method == "GET":
+            ranking = service.ranking(parts[1], _int(query, "limit"), _int(query, "offset") or 0)
+            if ranking is None:
+                raise HTTPError(404, "no such JD")
+            return 200, ranking
+        if len(parts) == 2 and parts[0] == "jds" and method == "DELETE":
+            if not service.remove_jd(parts[1]):
+                raise HTTPError(404, "no such JD")
+            return 200, {"deleted": parts[1]}
+
+        known = {"health", "metrics", "resumes", "candidates", "jds"}
+        raise HTTPError(405 if parts and parts[0] in known else 404, f"{method} {url.path} is not supported")
+
+
+def _int(query: Dict[str, str], key: str) -> Optional[int]:
+    if key not in query:
+        return None
+    try:
+        return max(0, int(query[key]))
+    except ValueError:
+        raise HTTPError(400, f"{key} must be an integer")
@@ -0,0 +1,249 @@
+import multiprocessing
+import os
+import signal
+import threading
+import time
+from multiprocessing.connection import wait
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Iterator, Optional, Tuple
+
+try:
+    import resource
+except ImportError:  # Windows: no per-process memory limits
+    resource = None
+
+SKIPPED_TIMEOUT = "timeout"
+SKIPPED_OOM = "oom"
+SKIPPED_CRASHED = "crashed"
+# Forking a multithreaded parent (Streamlit, an asyncio server) copies locks held by
+# other threads and inherits its sockets; a fork server starts workers from a clean process
+SAFE_START_METHOD = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+
+
+def _current_address_space() -> int:
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[0]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError):
+        return 0
+
+
+def _worker_main(conn, initializer: Callable, initargs: Tuple, task_fn: Callable,
+                 max_memory_mb: Optional[int]):
+    initializer(*initargs)
+    if max_memory_mb and resource is not None:
+        # The budget is on top of what the worker already maps after start-up
+        # (interpreter, taxonomy, numpy), so it bounds what a single document may add.
+        limit = _current_address_space() + max_memory_mb * 1024 * 1024
+        resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+
+    while True:
+        try:
+            message = conn.recv()
+            if message is None:
+                break
+            kind, task = message
+            if kind == "buffer":
+                # In-memory source sent as raw bytes after the rest of the task
+                task = (task[0], conn.recv_bytes()) + task[1:]
+        except EOFError:
+            break
+        try:
+            conn.send(("ok", task_fn(task)))
+        except MemoryError:
+            # Report and exit; the pool starts a fresh worker with a clean heap
+            conn.send(("oom", None))
+            break
+
+
+class IsolatedPool:
+    """
+    Worker processes with a per-task wall-clock timeout and memory ceiling.
+
+    Each worker has its own pipe and runs one task at a time, so a task that
+    hangs or blows its memory budget can be killed without losing any other
+    work. The offending task is reported as skipped ("timeout", "oom" or
+    "crashed") and the worker is replaced.
+    Tasks are tuples whose first two items are `(index, source)`; an optional
+    third item is the file name for in-memory sources. A source may be a
+    `memoryview` (e.g. of an upload's buffer); it is written to the worker's
+    pipe directly, without a copy in this process.
+    `start_method` picks the multiprocessing start method (default: the
+    platform's; pass `SAFE_START_METHOD` from multithreaded processes).
+
+    Besides `imap_unordered` over a batch, a long-lived pool can be `start`ed
+    and fed one task at a time with `run`, from up to `workers` threads.
+    """
+
+    def __init__(self, workers: int, initializer: Callable, initargs: Tuple,
+                 timeout: Optional[float] = None, max_memory_mb: Optional[int] = None,
+                 start_method: Optional[str] = None):
+        self.workers = max(1, workers)
+        self.initializer = initializer
+        self.initargs = initargs
+        self.timeout = timeout
+        self.max_memory_mb = max_memory_mb
+        self._context = multiprocessing.get_context(start_method)
+        self._procs = {}
+        # For `start`/`run`: the task function, idle workers and a lock over them and `_procs`
+        self._task_fn = None
+        self._idle = []
+        self._lock = threading.Lock()
+
+    def _spawn(self, task_fn: Callable):
+        parent_conn, child_conn = self._context.Pipe()
+        proc = self._context.Process(
+            target=_worker_main,
+            args=(child_conn, self.initializer, self.initargs, task_fn, self.max_memory_mb),
+            daemon=True,
+        )
+        proc.start()
+        child_conn.close()
+        with self._lock:
+            self._procs[parent_conn] = proc
+        return parent_conn
+
+    def _retire(self, conn, kill: bool = False):
+        with self._lock:
+            proc = self._procs.pop(conn, None)
+        if proc is None:
+            return None  # already retired, by `close` while its task ran
+        if kill and proc.is_alive():
+            proc.kill()
+        proc.join()
+        conn.close()
+        return proc.exitcode
+
+    @staticmethod
+    def _send(conn, task: Tuple):
+        if isinstance(task[1], memoryview):
+            conn.send(("buffer", (task[0],) + task[2:]))
+            conn.send_bytes(task[1])
+        else:
+            conn.send(("task", task))
+
+    @staticmethod
+    def _skipped(task: Tuple, reason: str) -> Tuple[int, Dict]:
+        name = task[2] if len(task) > 2 and task[2] else Path(str(task[1])).name
+        return task[0], {"name": name, "skipped": reason}
+
+    def start(self, task_fn: Callable):
+        """Starts all workers for `run`, so they are ready before the first task."""
+        self._task_fn = task_fn
+        for _ in range(self.workers):
+            conn = self._spawn(task_fn)
+            with self._lock:
+                self._idle.append(conn)
+
+    def run(self, task: Tuple) -> Tuple[int, Dict]:
+        """
+        Runs one task on an idle worker of a `start`ed pool and returns
+        `(index, result)`, with the same timeout and memory handling as
+        `imap_unordered`. Blocks; thread-safe for up to `workers` callers.
+        """
+        with self._lock:
+            conn = self._idle.pop() if self._idle else None
+        if conn is None:
+            conn = self._spawn(self._task_fn)
+        try:
+            self._send(conn, task)
+            if not conn.poll(self.timeout):
+                self._replace(conn, kill=True)
+                return self._skipped(task, SKIPPED_TIMEOUT)
+            status, payload = conn.recv()
+        except (EOFError, OSError):
+            exitcode = self._replace(conn, kill=True)
+            return self._skipped(task, SKIPPED_OOM if exitcode == -signal.SIGKILL else SKIPPED_CRASHED)
+        if status != "ok":
+            self._replace(conn)
+            return self._skipped(task, SKIPPED_OOM)
+        with self._lock:
+            self._idle.append(conn)
+        return payload
+
+    def _replace(self, conn, kill: bool = False) -> Optional[int]:
+        # Warms up the replacement now, so its start-up does not eat into the next task's timeout
+        exitcode = self._retire(conn, kill)
+        if self._task_fn is not None:
+            fresh = self._spawn(self._task_fn)
+            with self._lock:
+                self._idle.append(fresh)
+        return exitcode
+
+    def close(self):
+        """Stops the workers of a `start`ed pool; tasks still running are killed."""
+        self._task_fn = None  # no replacements from here on
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for conn in idle:
+            try:
+                conn.send(None)
+            except OSError:
+                pass
+        with self._lock:
+            conns = list(self._procs)
+        for conn in conns:
+            self._retire(conn, kill=conn not in idle)
+
+    def imap_unordered(self, task_fn: Callable, tasks: Iterable[Tuple]) -> Iterator[Tuple[int, Dict]]:
+        """Runs `task_fn` over `tasks`, yielding `(index, result)` in completion order."""
+        tasks = iter(tasks)
+        idle = [self._spawn(task_fn) for _ in range(self.workers)]
+        busy = {}  # conn -> (task, deadline)
+        exhausted = False
+
+        def replace():
+            # No point warming up a new worker once there is nothing left to hand out
+            if not exhausted:
+                idle.append(self._spawn(task_fn))
+
+        try:
+            while True:
+                while idle and not exhausted:
+                    task = next(tasks, None)
+                    if task is None:
+                        exhausted = True
+                        break
+                    conn = idle.pop()
+                    self._send(conn, task)
+                    deadline = time.monotonic() + self.timeout if self.timeout else None
+                    busy[conn] = (task, deadline)
+                if not busy:
+                    break
+
+                deadlines = [d for _, d in busy.values() if d is not None]
+                wait_for = max(0.0, min(deadlines) - time.monotonic()) if deadlines else None
+                for conn in wait(list(busy), timeout=wait_for):
+                    task, _ = busy.pop(conn)
+                    try:
+                        status, payload = conn.recv()
+                    except (EOFError, OSError):
+                        # Died without answering: SIGKILL usually means the kernel OOM killer
+                        exitcode = self._retire(conn)
+                        reason = SKIPPED_OOM if exitcode == -signal.SIGKILL else SKIPPED_CRASHED
+                        yield self._skipped(task, reason)
+                        replace()
+                        continue
+                    if status == "ok":
+                        yield payload
+                        idle.append(conn)
+                    else:
+                        self._retire(conn)
+                        yield self._skipped(task, SKIPPED_OOM)
+                        replace()
+
+                now = time.monotonic()
+                for conn, (task, deadline) in list(busy.items()):
+                    if deadline is not None and now >= deadline:
+                        del busy[conn]
+                        self._retire(conn, kill=True)
+                        yield self._skipped(task, SKIPPED_TIMEOUT)
+                        replace()
+        finally:
+            for conn in idle:
+                try:
+                    conn.send(None)
+                except OSError:
+                    pass
+            for conn in list(self._procs):
+                self._retire(conn, kill=conn in busy)
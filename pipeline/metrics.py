@@ -0,0 +1,240 @@
+import cProfile
+import io
+import json
+import os
+import pstats
+import threading
+import time
+import tracemalloc
+from bisect import bisect_left
+from collections import deque
+from contextlib import contextmanager
+from itertools import accumulate
+from typing import Deque, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+# Display order; any other stage name recorded is listed after these
+STAGES = ("parse", "extract", "score", "llm", "email")
+# Histogram bucket upper bounds in seconds (Prometheus `le` labels)
+BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+
+class Metrics:
+    """
+    Per-stage timings for a screening run.
+
+    Each file contributes one record of stage durations (parse, extract,
+    score), measured where the work happens, in the worker processes too,
+    and shipped back with the result. One-off operations such as LLM and
+    email calls are timed with `time`. At the end of a run the samples are
+    summarized per stage (count, total, percentiles, histogram buckets),
+    slow files are picked out by name, and everything can be written as
+    JSON or as a Prometheus textfile.
+
+    Only the latest `max_samples` durations per stage (and files) are kept,
+    so a long-running service stays within bounded memory; percentiles, max
+    and slow files cover that window, while counts, totals and histogram
+    buckets cover everything recorded. Readers work on a snapshot taken
+    under the lock, so they are safe while other threads record.
+    """
+
+    def __init__(self, max_samples: int = 100_000):
+        self.max_samples = max_samples
+        self.samples: Dict[str, Deque[float]] = {}
+        # (file name, total seconds, {stage: seconds})
+        self.files: Deque[Tuple[str, float, Dict[str, float]]] = deque(maxlen=max_samples)
+        self.file_count = 0
+        # Per stage over everything recorded: [count, total seconds, count per bucket in `BUCKETS`]
+        self._totals: Dict[str, list] = {}
+        self._lock = threading.Lock()
+        self.started = time.time()
+
+    def _add(self, stage: str, seconds: float):
+        # Caller holds `_lock`
+        if stage not in self.samples:
+            self.samples[stage] = deque(maxlen=self.max_samples)
+            self._totals[stage] = [0, 0.0, [0] * len(BUCKETS)]
+        self.samples[stage].append(seconds)
+        totals = self._totals[stage]
+        totals[0] += 1
+        totals[1] += seconds
+        bucket = bisect_left(BUCKETS, seconds)
+        if bucket < len(BUCKETS):
+            totals[2][bucket] += 1
+
+    def record_file(self, name: str, timings: Dict[str, float]):
+        with self._lock:
+            for stage, seconds in timings.items():
+                self._add(stage, seconds)
+            self.files.append((name, sum(timings.values()), timings))
+            self.file_count += 1
+
+    def record(self, stage: str, seconds: float):
+        with self._lock:
+            self._add(stage, seconds)
+
+    @contextmanager
+    def time(self, stage: str) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(stage, time.perf_counter() - start)
+
+    def _snapshot(self) -> Tuple[Dict[str, List[float]], Dict[str, Tuple[int, float, List[int]]], List[Tuple]]:
+        with self._lock:
+            samples = {stage: list(values) for stage, values in self.samples.items()}
+            totals = {stage: (count, total, list(buckets)) for stage, (count, total, buckets) in self._totals.items()}
+            files = list(self.files)
+        return samples, totals, files
+
+    @staticmethod
+    def _ordered(stages) -> List[str]:
+        return [s for s in STAGES if s in stages] + sorted(set(stages) - set(STAGES))
+
+    def stages(self) -> List[str]:
+        with self._lock:
+            return self._ordered(list(self.samples))
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """Per stage: count, total, mean, p50, p90, p99 and max, in seconds."""
+        samples, totals, _ = self._snapshot()
+        return self._summary(samples, totals)
+
+    def _summary(self, samples: Dict[str, List[float]], totals: Dict) -> Dict[str, Dict[str, float]]:
+        summary = {}
+        for stage in self._ordered(samples):
+            values = np.asarray(samples[stage])
+            count, total, _ = totals[stage]
+            p50, p90, p99 = np.percentile(values, [50, 90, 99])
+            summary[stage] = {
+                "count": count,
+                "total": total,
+                "mean": total / count,
+                "p50": float(p50),
+                "p90": float(p90),
+                "p99": float(p99),
+                "max": float(values.max()),
+            }
+        return summary
+
+    def histogram(self, stage: str) -> List[Tuple[float, int]]:
+        """Cumulative `(upper bound, count)` pairs over `BUCKETS`."""
+        with self._lock:
+            buckets = list(self._totals[stage][2]) if stage in self._totals else [0] * len(BUCKETS)
+        return list(zip(BUCKETS, accumulate(buckets)))
+
+    def outliers(self, factor: float = 5.0, limit: int = 10) -> List[Dict]:
+        """
+        Files that took more than `factor` times the median file (all stages
+        together), slowest first.
+        """
+        return self._outliers(self._snapshot()[2], factor, limit)
+
+    @staticmethod
+    def _outliers(files: List[Tuple], factor: float = 5.0, limit: int = 10) -> List[Dict]:
+        if not files:
+            return []
+        median = float(np.median([total for _, total, _ in files]))
+        slow = [f for f in files if f[1] > median * factor and f[1] > 0]
+        slow.sort(key=lambda f: f[1], reverse=True)
+        return [
+            {"name": name, "seconds": total, "stages": timings, "x_median": total / median if median else None}
+            for name, total, timings in slow[:limit]
+        ]
+
+    def format_summary(self) -> str:
+        samples, totals, files = self._snapshot()
+        lines = [f"{'stage':<10} {'count':>7} {'total s':>9} {'mean ms':>9} {'p50 ms':>9} "
+                 f"{'p90 ms':>9} {'p99 ms':>9} {'max ms':>9}"]
+        for stage, s in self._summary(samples, totals).items():
+            lines.append(
+                f"{stage:<10} {s['count']:>7} {s['total']:>9.2f} {s['mean'] * 1000:>9.1f} {s['p50'] * 1000:>9.1f} "
+                f"{s['p90'] * 1000:>9.1f} {s['p99'] * 1000:>9.1f} {s['max'] * 1000:>9.1f}"
+            )
+        outliers = self._outliers(files)
+        if outliers:
+            lines.append("Slow files:")
+            for o in outliers:
+                stages = ", ".join(f"{stage} {seconds * 1000:.0f} ms" for stage, seconds in o['stages'].items())
+                lines.append(f"  {o['name']}: {o['seconds'] * 1000:.0f} ms ({o['x_median']:.1f}x median; {stages})")
+        return "\n".join(lines)
+
+    def to_dict(self) -> Dict:
+        samples, totals, files = self._snapshot()
+        return {
+            "started": self.started,
+            "wall_seconds": time.time() - self.started,
+            "files": self.file_count,
+            "stages": self._summary(samples, totals),
+            "histograms": {stage: [[bound, count] for bound, count in zip(BUCKETS, accumulate(totals[stage][2]))]
+                           for stage in self._ordered(samples)},
+            "outliers": self._outliers(files),
+        }
+
+    def prometheus(self, prefix: str = "resume_screener") -> str:
+        """Prometheus text exposition format, e.g. for node_exporter's textfile collector."""
+        lines = [
+            f"# HELP {prefix}_stage_seconds Time spent per pipeline stage.",
+            f"# TYPE {prefix}_stage_seconds histogram",
+        ]
+        _, totals, _ = self._snapshot()
+        for stage in self._ordered(totals):
+            count, total, buckets = totals[stage]
+            for bound, cumulative in zip(BUCKETS, accumulate(buckets)):
+                lines.append(f'{prefix}_stage_seconds_bucket{{stage="{stage}",le="{bound:g}"}} {cumulative}')
+            lines.append(f'{prefix}_stage_seconds_bucket{{stage="{stage}",le="+Inf"}} {count}')
+            lines.append(f'{prefix}_stage_seconds_sum{{stage="{stage}"}} {total:.6f}')
+            lines.append(f'{prefix}_stage_seconds_count{{stage="{stage}"}} {count}')
+        lines += [
+            f"# HELP {prefix}_files Files timed in the last run.",
+            f"# TYPE {prefix}_files gauge",
+            f"{prefix}_files {self.file_count}",
+            f"# HELP {prefix}_run_wall_seconds Wall-clock duration of the last run.",
+            f"# TYPE {prefix}_run_wall_seconds gauge",
+            f"{prefix}_run_wall_seconds {time.time() - self.started:.3f}",
+        ]
+        return "\n".join(lines) + "\n"
+
+    def write(self, path: str):
+        """Writes JSON, or a Prometheus textfile for `.prom` paths (atomically, so scrapers never see half a file)."""
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        content = self.prometheus() if path.endswith(".prom") else json.dumps(self.to_dict(), indent=2)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(content)
+        os.replace(tmp_path, path)
+
+
+@contextmanager
+def profiling(profile_path: Optional[str] = None, trace_memory: bool = False, top: int = 15) -> Iterator[None]:
+    """
+    Optionally runs the block under cProfile (stats dumped to `profile_path`,
+    top functions printed) and/or tracemalloc (peak and top allocation sites
+    printed). Only the current process is covered; with one worker, `main.py` parses
+    in-process (without per-file limits) so parsing is profiled too.
+    """
+    profiler = cProfile.Profile() if profile_path else None
+    if trace_memory:
+        tracemalloc.start()
+    if profiler:
+        profiler.enable()
+    try:
+        yield
+    finally:
+        if profiler:
+            profiler.disable()
+            profiler.dump_stats(profile_path)
+            out = io.StringIO()
+            pstats.Stats(profiler, stream=out).sort_stats("cumulative").print_stats(top)
+            print(out.getvalue())
+        if trace_memory:
+            snapshot = tracemalloc.take_snapshot()
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            print(f"Peak traced memory: {peak / (1024 * 1024):.1f} MB")
+            for stat in snapshot.statistics("lineno")[:top]:
+                print(f"  {stat}")
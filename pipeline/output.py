@@ -0,0 +1,173 @@
+import csv
+import heapq
+import io
+import json
+import os
+from typing import Dict, List, Optional
+
+CSV_FIELDS = ["index", "source", "name", "status", "score", "matched"]
+# Status of the first record, naming the JD/weights/taxonomy the file was scored with
+RUN_PREFIX = "run: "
+
+
+class TopK:
+    """
+    Bounded ranking: keeps the `k` best results in a min-heap (all of them when k is None).
+    `ranked` orders by score descending, breaking ties by input index, so
+    parallel runs (which finish out of order) rank exactly like serial ones.
+    """
+
+    def __init__(self, k: Optional[int] = None):
+        if k is not None and k < 1:
+            raise ValueError(f"k must be at least 1, got {k}")
+        self.k = k
+        self._heap = []
+
+    def push(self, index: int, result: Dict):
+        # Min-heap on (score, -index): the root is the entry that would rank last
+        entry = (result['score'], -index, result)
+        if self.k is None or len(self._heap) < self.k:
+            heapq.heappush(self._heap, entry)
+        elif entry[:2] > self._heap[0][:2]:
+            heapq.heapreplace(self._heap, entry)
+
+    def ranked(self) -> List[Dict]:
+        return [result for _, _, result in sorted(self._heap, key=lambda e: (-e[0], -e[1]))]
+
+
+class ResultWriter:
+    """
+    Appends one record per screened file to a JSONL or CSV file (picked by suffix)
+    as soon as it is produced, flushing each line so a crash loses at most the
+    record being written. `load_completed` reads such a file back to resume a run.
+
+    A new file starts with a `"run: <run_key>"` record identifying what the
+    scores were computed against (see `recorded_run`).
+    """
+
+    def __init__(self, path: str, run_key: str):
+        self.path = path
+        self.format = "csv" if path.lower().endswith(".csv") else "jsonl"
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        _truncate_partial_line(path)
+        is_new = not os.path.exists(path) or os.path.getsize(path) == 0
+        self._file = open(path, "a", encoding="utf-8", newline="")
+        if self.format == "csv":
+            self._csv = csv.DictWriter(self._file, fieldnames=CSV_FIELDS)
+            if is_new:
+                self._csv.writeheader()
+        if is_new:
+            self._write_record({"index": None, "source": None, "name": None,
+                                "status": RUN_PREFIX + run_key, "score": None, "matched": []})
+
+    def write(self, index: int, source: str, result: Dict):
+        self._write_record({
+            "index": index,
+            "source": source,
+            "name": result['name'],
+            "status": "skipped: " + result['skipped'] if "skipped" in result else
+                      "error: " + result['error'] if "error" in result else
+                      "duplicate: " + result['duplicate'] if "duplicate" in result else "ok",
+            "score": result.get('score'),
+            "matched": result.get('matched', []),
+        })
+
+    def _write_record(self, record: Dict):
+        if self.format == "csv":
+            self._csv.writerow(dict(record, matched=";".join(record['matched'])))
+        else:
+            self._file.write(json.dumps(record) + "\n")
+        self._file.flush()
+
+    def close(self):
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def _truncate_partial_line(path: str):
+    """Drops a trailing half-written record left behind by a crash."""
+    if not os.path.exists(path):
+        return
+    with open(path, "rb+") as f:
+        f.seek(0, io.SEEK_END)
+        size = f.tell()
+        if size == 0:
+            return
+        f.seek(size - 1)
+        if f.read(1) == b"\n":
+            return
+        # Walk back to the last newline
+        pos = size - 1
+        while pos > 0:
+            step = min(4096, pos)
+            f.seek(pos - step)
+            chunk = f.read(step)
+            newline = chunk.rfind(b"\n")
+            if newline != -1:
+                f.truncate(pos - step + newline + 1)
+                return
+            pos -= step
+        f.truncate(0)
+
+
+def _read_records(path: str):
+    with open(path, "r", encoding="utf-8", newline="") as f:
+        if path.lower().endswith(".csv"):
+            for row in csv.DictReader(f):
+                if row.get("status") is None:
+                    continue
+                if row["status"].startswith(RUN_PREFIX):
+                    yield {"status": row["status"]}
+                    continue
+                if not row.get("index"):
+                    continue
+                yield {
+                    "index": int(row["index"]),
+                    "source": row["source"],
+                    "name": row["name"],
+                    "status": row["status"],
+                    "score": float(row["score"]) if row["score"] else None,
+                    "matched": row["matched"].split(";") if row["matched"] else [],
+                }
+        else:
+            for line in f:
+                if not line.endswith("\n"):
+                    break
+                yield json.loads(line)
+
+
+def recorded_run(path: str) -> Optional[str]:
+    """
+    The run key an output file was started with, None for a missing or empty
+    file, or "" when it has records but no run key (written by an older version).
+    """
+    if not os.path.exists(path) or os.path.getsize(path) == 0:
+        return None
+    for record in _read_records(path):
+        status = record["status"]
+        return status[len(RUN_PREFIX):] if status.startswith(RUN_PREFIX) else ""
+    return None
+
+
+def load_completed(path: str) -> Dict[str, Dict]:
+    """
+    Records of files a previous run finished (ok, duplicate or skipped), keyed
+    by source; the latest record per source wins, so files that failed are
+    retried. A trailing partial line from a crash is ignored.
+    """
+    if not os.path.exists(path):
+        return {}
+    latest = {}
+    for record in _read_records(path):
+        if not record["status"].startswith(RUN_PREFIX):
+            latest[record["source"]] = record
+    # Only these outcomes are final; errors may be transient
+    return {source: record for source, record in latest.items()
+            if record["status"] == "ok" or record["status"].startswith(("duplicate: ", "skipped: "))}
@@ -0,0 +1,286 @@
+import asyncio
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, Optional, Set, Tuple
+
+import numpy as np
+
+from extractors.keyword_extractor import KeywordExtractor
+from matcher.results import ResultTable
+from matcher.scorer import Scorer
+from parsers.jd_parser import JDParser
+from pipeline.batch import extraction_pool
+from pipeline.cache import ParseCache, content_hash
+from pipeline.metrics import Metrics
+from pipeline.sources import iter_resume_sources
+from pipeline.taxonomy import CompiledTaxonomy
+
+# Marks candidates submitted through the API rather than found in the inbox
+API_SOURCE = "api"
+
+
+class ScreeningService:
+    """
+    Resident screening state: the compiled taxonomy, every submitted JD and
+    an in-memory candidate index, kept warm between requests.
+
+    Candidates are identified by the hash of their file's content. Each JD
+    keeps a `ResultTable` with one row per candidate, so a new resume is
+    scored against every JD as it arrives and a new JD scores the whole pool
+    in one `score_batch` call. Rankings are read straight from the tables.
+
+    Parsing and extraction run in an `IsolatedPool` (`pipeline.batch.extraction_pool`),
+    with the per-file `limits` from config, so a file that hangs or blows up the
+    parser is killed and reported instead of holding a worker forever. One
+    thread per worker waits on it; everything else runs on the event loop
+    thread, so the state needs no locks.
+    """
+
+    def __init__(self, config: Dict, taxonomy: CompiledTaxonomy, workers: int = 2,
+                 cache: Optional[ParseCache] = None):
+        self.config = config
+        self.taxonomy = taxonomy
+        self.workers = workers
+        self.cache = cache
+        self.keyword_extractor = KeywordExtractor(taxonomy.skills_taxonomy, taxonomy.matcher)
+        self.jd_parser = JDParser()
+        self.scorer = Scorer(config['weights'])
+        # The service runs indefinitely: percentiles and slow files cover the latest files only
+        self.metrics = Metrics(max_samples=config.get('service', {}).get('metrics_window', 10_000))
+        # id -> {"id", "name", "skills", "experience_years", "email", "phone", "sources"}
+        self.candidates: Dict[str, Dict] = {}
+        # id -> {"id", "name", "text", "compiled", "table", "rows" (candidate id -> table row)}
+        self.jds: Dict[str, Dict] = {}
+        # Inbox path -> candidate id
+        self.inbox_files: Dict[str, str] = {}
+        self.pending = 0
+        # Workers start here, before the API listens, from a fork server
+        self._pool = extraction_pool(taxonomy.skills_taxonomy, workers, cache, config.get('parsing'),
+                                     config.get('limits'), taxonomy.matcher)
+        self._threads = ThreadPoolExecutor(max_workers=workers)
+        # One resume per worker at a time; the rest wait here
+        self._slots = asyncio.Semaphore(workers)
+
+    def close(self):
+        self._pool.close()
+        self._threads.shutdown(wait=False, cancel_futures=True)
+
+    async def add_resume(self, data: bytes, name: str, source: str = API_SOURCE) -> Dict:
+        """
+        Parses and scores a resume, returning the candidate with its score for
+        every JD, or `{"name", "error"}`. Resubmitting identical content
+        returns the existing candidate without parsing again.
+        """
+        candidate_id = content_hash(data)
+        candidate = self.candidates.get(candidate_id)
+        if candidate is None:
+            self.pending += 1
+            try:
+                async with self._slots:
+                    result = await self._extract(data, name)
+            finally:
+                self.pending -= 1
+            if "error" in result or "skipped" in result:
+                return {"name": name, "error": result.get("error") or f"skipped: {result['skipped']}"}
+            # Another submission of the same content may have finished first
+            candidate = self.candidates.get(candidate_id)
+            if candidate is None:
+                candidate = self._index(candidate_id, name, result)
+        candidate["sources"].add(source)
+        return self.candidate_summary(candidate)
+
+    async def _extract(self, data: bytes, name: str) -> Dict:
+        loop = asyncio.get_running_loop()
+        # A view, so the pool writes the upload to the worker's pipe without another copy
+        _, result = await loop.run_in_executor(self._threads, self._pool.run, (0, memoryview(data), name))
+        timings = result.pop("timings", None)
+        if timings is not None:
+            self.metrics.record_file(name, timings)
+        return result
+
+    def _index(self, candidate_id: str, name: str, result: Dict) -> Dict:
+        candidate = {
+            "id": candidate_id,
+            "name": name,
+            "skills": set(result['skills']),
+            "experience_years": result['experience_years'],
+            "email": result['email'],
+            "phone": result['phone'],
+            "sources": set(),
+        }
+        self.candidates[candidate_id] = candidate
+        with self.metrics.time("score"):
+            for jd in self.jds.values():
+                jd["rows"][candidate_id] = len(jd["table"])
+                jd["table"].append(name, candidate["skills"],
+                                   self.scorer.score(candidate["skills"], jd["compiled"], candidate["experience_years"]),
+                                   text_key=candidate_id, experience_years=candidate["experience_years"],
+                                   email=candidate["email"])
+        return candidate
+
+    def remove_candidate(self, candidate_id: str) -> bool:
+        if self.candidates.pop(candidate_id, None) is None:
+            return False
+        for jd in self.jds.values():
+            table, rows = jd["table"], jd["rows"]
+            i = rows.pop(candidate_id)
+            table.remove(i)
+            if i < len(table):
+                rows[table.text_keys[i]] = i  # the row moved into the gap
+        return True
+
+    def _release(self, candidate_id: str, source: str):
+        # Candidates stay while any inbox file or API submission still refers to them
+        candidate = self.candidates.get(candidate_id)
+        if candidate is not None:
+            candidate["sources"].discard(source)
+            if not candidate["sources"]:
+                self.remove_candidate(candidate_id)
+
+    def add_jd(self, jd_text: str, name: Optional[str] = None) -> Dict:
+        """Registers a JD and scores every indexed candidate against it in one batch."""
+        jd_id = content_hash(jd_text.strip().encode("utf-8"))[:16]
+        jd = self.jds.get(jd_id)
+        if jd is None:
+            compiled = self.scorer.compile_jd(self.jd_parser.parse(jd_text), self.keyword_extractor)
+            candidates = list(self.candidates.values())
+            with self.metrics.time("score"):
+                skill_matrix = self.keyword_extractor.skill_matrix(c["skills"] for c in candidates)
+                years = np.array([c["experience_years"] for c in candidates], dtype=np.float64)
+                batch = self.scorer.score_batch(skill_matrix, compiled, experience_years=years)
+                table = ResultTable.from_batch(
+                    compiled, [c["name"] for c in candidates], skill_matrix, batch,
+                    text_keys=[c["id"] for c in candidates], text_loader=self._load_text,
+                    experience_years=years, emails=[c["email"] for c in candidates],
+                )
+            jd = {"id": jd_id, "name": name or jd_id, "text": jd_text, "compiled": compiled, "table": table,
+                  "rows": {c["id"]: i for i, c in enumerate(candidates)}}
+            self.jds[jd_id] = jd
+        return self.jd_summary(jd)
+
+    def remove_jd(self, jd_id: str) -> bool:
+        return self.jds.pop(jd_id, None) is not None
+
+    def _load_text(self, candidate_id: str) -> Optional[str]:
+        return self.cache.get(candidate_id)[0] if self.cache else None
+
+    def ranking(self, jd_id: str, limit: Optional[int] = None, offset: int = 0) -> Optional[Dict]:
+        jd = self.jds.get(jd_id)
+        if jd is None:
+            return None
+        table = jd["table"]
+        order = table.order()
+        end = len(order) if limit is None else offset + limit
+        results = []
+        for rank, i in enumerate(order[offset:end], start=offset + 1):
+            row = table.row(i)
+            results.append({
+                "rank": rank,
+                "id": table.text_keys[i],
+                "name": table.names[i],
+                "total_score": row['total_score'],
+                "breakdown": row['breakdown'],
+                "experience_years": table.experience_years(i),
+                "email": table.emails[i],
+                **row['details'],
+            })
+        return {"jd": self.jd_summary(jd), "total": len(table), "offset": offset, "results": results}
+
+    def candidate_summary(self, candidate: Dict) -> Dict:
+        scores = {}
+        for jd_id, jd in self.jds.items():
+            scores[jd_id] = float(jd["table"].column("total_score")[jd["rows"][candidate["id"]]])
+        return {
+            "id": candidate["id"],
+            "name": candidate["name"],
+            "skills": sorted(candidate["skills"]),
+            "experience_years": candidate["experience_years"],
+            "email": candidate["email"],
+            "phone": candidate["phone"],
+            "scores": scores,
+        }
+
+    def jd_summary(self, jd: Dict) -> Dict:
+        return {
+            "id": jd["id"],
+            "name": jd["name"],
+            "required": jd["compiled"].required_skills(),
+            "preferred": jd["compiled"].preferred_skills(),
+            "min_years": jd["compiled"].min_years,
+            "candidates": len(jd["table"]),
+        }
+
+    def status(self) -> Dict:
+        return {"candidates": len(self.candidates), "jds": len(self.jds), "pending": self.pending,
+                "inbox_files": len(self.inbox_files)}
+
+    async def watch_inbox(self, inbox: str, poll_seconds: float = 2.0):
+        """
+        Polls `inbox` (recursively) and screens files as they appear. A file is
+        only picked up once its size and mtime are unchanged between two polls,
+        so half-copied uploads are not parsed. Changed files are re-screened and
+        deleted files drop out of the rankings.
+        """
+        loop = asyncio.get_running_loop()
+        seen: Dict[str, Tuple[float, int]] = {}
+        settling: Dict[str, Tuple[float, int]] = {}
+        tasks: Set[asyncio.Task] = set()
+        while True:
+            # Directory walks block; keep them off the event loop
+            current = await loop.run_in_executor(None, _scan_inbox, inbox)
+            for path in set(seen) - set(current):
+                del seen[path]
+                candidate_id = self.inbox_files.pop(path, None)
+                if candidate_id:
+                    self._release(candidate_id, path)
+            for path, signature in current.items():
+                if seen.get(path) == signature:
+                    continue
+                if settling.get(path) == signature:
+                    seen[path] = signature
+                    task = asyncio.create_task(self._add_inbox_file(path))
+                    tasks.add(task)
+                    task.add_done_callback(tasks.discard)
+                else:
+                    settling[path] = signature
+            settling = {path: sig for path, sig in settling.items() if path in current and seen.get(path) != sig}
+            await asyncio.sleep(poll_seconds)
+
+    async def _add_inbox_file(self, path: str):
+        loop = asyncio.get_running_loop()
+        try:
+            data = await loop.run_in_executor(None, Path(path).read_bytes)
+        except OSError as e:
+            print(f"Error reading {path}: {e}")
+            return
+        previous = self.inbox_files.get(path)
+        if previous == content_hash(data):
+            return  # touched, not changed
+        start = time.perf_counter()
+        summary = await self.add_resume(data, Path(path).name, source=path)
+        # The old version stays ranked until the new one is in (unless the watcher saw it deleted meanwhile)
+        if previous and self.inbox_files.get(path) == previous:
+            del self.inbox_files[path]
+            self._release(previous, path)
+        if "error" in summary:
+            print(f"Error processing {path}: {summary['error']}")
+            return
+        if not os.path.exists(path):
+            # Deleted while it was screened; the watcher has already dropped it, so registering it would leak
+            self._release(summary["id"], path)
+            return
+        self.inbox_files[path] = summary["id"]
+        print(f"Screened {path} in {(time.perf_counter() - start) * 1000:.0f} ms")
+
+
+def _scan_inbox(inbox: str) -> Dict[str, Tuple[float, int]]:
+    files = {}
+    for path in iter_resume_sources(inbox, archives=False):
+        try:
+            stat = os.stat(path)
+        except OSError:
+            continue  # removed while scanning
+        files[str(path)] = (stat.st_mtime, stat.st_size)
+    return files
@@ -0,0 +1,74 @@
+import os
+import tarfile
+import zipfile
+from pathlib import Path
+from typing import Iterable, Iterator, Tuple, Union
+
+from parsers.resume_parser import SUPPORTED_FORMATS
+
+# A resume on disk, or an archive member as (name, bytes)
+ResumeItem = Union[Path, Tuple[str, bytes]]
+
+ARCHIVE_SUFFIXES = ('.zip', '.tar', '.tar.gz', '.tgz', '.tar.bz2', '.tbz2', '.tar.xz', '.txz')
+
+
+def is_archive(path: Path) -> bool:
+    return path.name.lower().endswith(ARCHIVE_SUFFIXES)
+
+
+def _is_resume(name: str) -> bool:
+    return os.path.splitext(name)[1].lower() in SUPPORTED_FORMATS
+
+
+def iter_resume_sources(input_path, exclude: Iterable[Path] = (), archives: bool = True) -> Iterator[ResumeItem]:
+    """
+    Yields every resume under `input_path`: a directory (walked recursively
+    with `os.scandir`), a zip/tar archive, or a single file.
+
+    Files on disk are yielded as paths. Archive members are read one at a
+    time, in archive order, and yielded as `(name, bytes)` without being
+    extracted to disk; names look like "bundle.zip/cvs/jane.pdf". Tar
+    archives are read as a stream, so compressed bundles are decompressed
+    once, sequentially. Pass `archives=False` to skip archives entirely.
+    """
+    input_path = Path(input_path)
+    excluded = {Path(p).resolve() for p in exclude}
+    if input_path.is_dir():
+        yield from _iter_directory(input_path, excluded, archives)
+    elif archives and is_archive(input_path):
+        yield from iter_archive(input_path)
+    elif _is_resume(input_path.name) and input_path.resolve() not in excluded:
+        yield input_path
+
+
+def _iter_directory(directory: Path, excluded: set, archives: bool) -> Iterator[ResumeItem]:
+    with os.scandir(directory) as it:
+        # Sorted so runs (and ties in the ranking) are reproducible across filesystems
+        entries = sorted(it, key=lambda e: e.name)
+    for entry in entries:
+        path = Path(entry.path)
+        if entry.is_dir(follow_symlinks=False):
+            yield from _iter_directory(path, excluded, archives)
+        elif not entry.is_file() or path.resolve() in excluded:
+            continue
+        elif archives and is_archive(path):
+            yield from iter_archive(path)
+        elif _is_resume(entry.name):
+            yield path
+
+
+def iter_archive(path: Path) -> Iterator[Tuple[str, bytes]]:
+    """Streams `(name, bytes)` for every resume member of a zip or tar archive."""
+    if zipfile.is_zipfile(path):
+        with zipfile.ZipFile(path) as zf:
+            for info in zf.infolist():
+                if not info.is_dir() and _is_resume(info.filename):
+                    yield f"{path.name}/{info.filename}", zf.read(info)
+        return
+
+    # "r|*" reads the tar as a forward-only stream with transparent decompression
+    with tarfile.open(path, "r|*") as tf:
+        for member in tf:
+            if member.isfile() and _is_resume(member.name):
+                with tf.extractfile(member) as f:
+                    yield f"{path.name}/{member.name}", f.read()
@@ -0,0 +1,236 @@
+import datetime
+import hashlib
+import json
+import os
+import sqlite3
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple
+
+from extractors.resume_facts import extract_facts
+from matcher.compiled_jd import CompiledJD
+from matcher.scorer import Scorer
+from pipeline.cache import content_hash
+
+# Maps file paths to (path, resume_text, resume_skills) or (path, None, error message)
+ExtractFn = Callable[[Sequence[str]], Iterator[Tuple[str, Optional[str], object]]]
+# Part of every `jd_key`; bumped when the same JD text would resolve or score differently
+SCORING_VERSION = 2
+
+
+def jd_key(jd_text: str, weights: Dict[str, float], taxonomy_fp: str, as_of: Optional[str] = None) -> str:
+    """
+    Identifies a JD for stored scores; changing the text, weights or taxonomy yields a new key.
+
+    Pass the current month as `as_of` when the JD asks for years of experience:
+    "Jan 2018 - Present" grows every month, so those scores are only valid
+    for the month they were computed in (see `score_month`).
+    """
+    payload = json.dumps([jd_text.strip(), weights, taxonomy_fp, SCORING_VERSION] + ([as_of] if as_of else []),
+                         sort_keys=True)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def jd_family(jd_text: str) -> str:
+    """
+    Identifies a JD across its `jd_key`s (weights, taxonomy and month change
+    the key, not the family), so scores under superseded keys can be dropped.
+    """
+    return hashlib.sha256(jd_text.strip().encode("utf-8")).hexdigest()
+
+
+def score_month(compiled_jd: CompiledJD, today: Optional[datetime.date] = None) -> Optional[str]:
+    """The `as_of` for `jd_key`: "YYYY-MM" when scores depend on the date, else None."""
+    if compiled_jd.min_years is None:
+        return None
+    return (today or datetime.date.today()).strftime("%Y-%m")
+
+
+class CandidateStore:
+    """
+    Persistent SQLite store of screened candidates and their per-JD scores.
+
+    Candidates are keyed by file path and remember the mtime, size and
+    content hash they were extracted from, so `sync` only re-parses new or
+    changed files; candidates parsed with other parser options (page and
+    character caps) are re-parsed too. Scores are indexed by (JD, total score), so ranking a
+    pool for a JD is a single indexed query. Each JD key is registered with
+    its `jd_family` and taxonomy; scoring a key drops the scores of the
+    same JD under other keys (last month's, other weights) and of keys from
+    another taxonomy, so the store does not keep a stale copy per change.
+    """
+
+    def __init__(self, path: str, taxonomy_fp: str, parser_fp: str = ""):
+        self.path = path
+        self.taxonomy_fp = taxonomy_fp
+        self.parser_fp = parser_fp
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.conn = sqlite3.connect(path)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA foreign_keys=ON")
+        has_jds = self.conn.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'jds'").fetchone()
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS candidates (
+                path TEXT PRIMARY KEY,
+                name TEXT NOT NULL,
+                mtime REAL NOT NULL,
+                size INTEGER NOT NULL,
+                hash TEXT NOT NULL,
+                text TEXT NOT NULL,
+                skills TEXT NOT NULL,
+                taxonomy TEXT NOT NULL,
+                parser TEXT NOT NULL DEFAULT ''
+            );
+            CREATE TABLE IF NOT EXISTS scores (
+                jd TEXT NOT NULL,
+                path TEXT NOT NULL REFERENCES candidates(path) ON DELETE CASCADE,
+                total REAL NOT NULL,
+                required REAL NOT NULL,
+                preferred REAL NOT NULL,
+                experience REAL NOT NULL,
+                keywords REAL NOT NULL,
+                PRIMARY KEY (jd, path)
+            );
+            CREATE INDEX IF NOT EXISTS idx_scores_rank ON scores(jd, total DESC, path);
+            CREATE INDEX IF NOT EXISTS idx_scores_path ON scores(path);
+            CREATE TABLE IF NOT EXISTS jds (
+                jd TEXT PRIMARY KEY,
+                family TEXT NOT NULL,
+                taxonomy TEXT NOT NULL
+            );
+        """)
+        if not has_jds:
+            # Stores written before JD keys were registered: their scores can't be attributed
+            # to a JD to be pruned later, and rescoring from stored skills is cheap
+            self.conn.execute("DELETE FROM scores")
+        columns = {row[1] for row in self.conn.execute("PRAGMA table_info(candidates)")}
+        if "parser" not in columns:  # stores written before parser options were recorded
+            self.conn.execute("ALTER TABLE candidates ADD COLUMN parser TEXT NOT NULL DEFAULT ''")
+        self.conn.commit()
+
+    def sync(self, files: Iterable, extract: ExtractFn, keyword_extractor) -> Dict[str, object]:
+        """
+        Brings the store in line with `files`, the full current pool.
+
+        Unchanged files (same mtime and size) are skipped; files whose bytes
+        are unchanged only get their stat refreshed; new and changed files, and
+        files parsed with other parser options, are passed to `extract`. Candidates no longer in `files` are dropped along
+        with their scores. When the taxonomy changed, stored text is re-extracted
+        with `keyword_extractor` without re-parsing.
+        """
+        stats = {"added": 0, "updated": 0, "unchanged": 0, "removed": 0, "errors": []}
+        known = {
+            row[0]: row[1:]
+            for row in self.conn.execute("SELECT path, mtime, size, hash, parser FROM candidates")
+        }
+
+        current = set()
+        pending = {}
+        for file_path in files:
+            path = str(Path(file_path).resolve())
+            current.add(path)
+            st = os.stat(path)
+            previous = known.get(path)
+            reparse = previous is not None and previous[3] != self.parser_fp
+            if previous and not reparse and previous[0] == st.st_mtime and previous[1] == st.st_size:
+                stats["unchanged"] += 1
+                continue
+            with open(path, "rb") as f:
+                key = content_hash(f.read())
+            if previous and not reparse and previous[2] == key:
+                self.conn.execute(
+                    "UPDATE candidates SET mtime = ?, size = ? WHERE path = ?", (st.st_mtime, st.st_size, path)
+                )
+                stats["unchanged"] += 1
+                continue
+            pending[path] = (st.st_mtime, st.st_size, key, previous is not None)
+
+        removed = [(path,) for path in known if path not in current]
+        self.conn.executemany("DELETE FROM candidates WHERE path = ?", removed)
+        stats["removed"] = len(removed)
+
+        for path, resume_text, outcome in extract(list(pending)):
+            if resume_text is None:
+                stats["errors"].append((Path(path).name, outcome))
+                continue
+            mtime, size, key, existed = pending[path]
+            self._upsert(path, mtime, size, key, resume_text, outcome)
+            stats["updated" if existed else "added"] += 1
+
+        self._refresh_taxonomy(keyword_extractor)
+        self.conn.commit()
+        return stats
+
+    def _upsert(self, path: str, mtime: float, size: int, key: str, resume_text: str, resume_skills: Set[str]):
+        # Drop scores computed from the old contents
+        self.conn.execute("DELETE FROM scores WHERE path = ?", (path,))
+        self.conn.execute(
+            "INSERT OR REPLACE INTO candidates (path, name, mtime, size, hash, text, skills, taxonomy, parser) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (path, Path(path).name, mtime, size, key, resume_text,
+             json.dumps(sorted(resume_skills)), self.taxonomy_fp, self.parser_fp),
+        )
+
+    def _refresh_taxonomy(self, keyword_extractor):
+        stale = self.conn.execute(
+            "SELECT path, text FROM candidates WHERE taxonomy != ?", (self.taxonomy_fp,)
+        ).fetchall()
+        for path, resume_text in stale:
+            skills = keyword_extractor.extract_skills(resume_text)
+            self.conn.execute(
+                "UPDATE candidates SET skills = ?, taxonomy = ? WHERE path = ?",
+                (json.dumps(sorted(skills)), self.taxonomy_fp, path),
+            )
+
+    def score(self, jd: str, compiled_jd: CompiledJD, scorer: Scorer, family: Optional[str] = None) -> int:
+        """
+        Scores every candidate that has no score for `jd` yet; returns how many
+        were scored. `family` (see `jd_family`) lets scores of the same JD
+        under other keys be dropped.
+        """
+        self._prune(jd, family or jd)
+        rows = self.conn.execute(
+            "SELECT path, skills, text FROM candidates c "
+            "WHERE NOT EXISTS (SELECT 1 FROM scores s WHERE s.jd = ? AND s.path = c.path)", (jd,)
+        ).fetchall()
+        records = []
+        for path, skills, resume_text in rows:
+            # Experience is read from the stored text; it only costs a regex scan. It depends
+            # on today's date, so callers key these scores by month (`score_month`)
+            experience_years = extract_facts(resume_text)['experience_years'] if compiled_jd.min_years is not None else None
+            result = scorer.score(set(json.loads(skills)), compiled_jd, experience_years)
+            breakdown = result['breakdown']
+            records.append((
+                jd, path, result['total_score'], breakdown['required'], breakdown['preferred'],
+                breakdown['experience'], breakdown['keywords']
+            ))
+        self.conn.executemany("INSERT INTO scores VALUES (?, ?, ?, ?, ?, ?, ?)", records)
+        self.conn.commit()
+        return len(records)
+
+    def _prune(self, jd: str, family: str):
+        stale = self.conn.execute(
+            "SELECT jd FROM jds WHERE jd != ? AND (family = ? OR taxonomy != ?)", (jd, family, self.taxonomy_fp)
+        ).fetchall()
+        self.conn.executemany("DELETE FROM scores WHERE jd = ?", stale)
+        self.conn.executemany("DELETE FROM jds WHERE jd = ?", stale)
+        self.conn.execute("INSERT OR IGNORE INTO jds VALUES (?, ?, ?)", (jd, family, self.taxonomy_fp))
+
+    def ranking(self, jd: str, limit: Optional[int] = None) -> List[Dict]:
+        """Candidates ranked for `jd`, best first, straight from the score index."""
+        query = (
+            "SELECT c.name, c.path, s.total, c.skills FROM scores s JOIN candidates c ON c.path = s.path "
+            "WHERE s.jd = ? ORDER BY s.total DESC, s.path"
+        )
+        params = (jd,)
+        if limit is not None:
+            query += " LIMIT ?"
+            params = (jd, limit)
+        return [
+            {"name": name, "path": path, "score": total, "matched": json.loads(skills)}
+            for name, path, total, skills in self.conn.execute(query, params)
+        ]
+
+    def close(self):
+        self.conn.close()
@@ -0,0 +1,78 @@
+import hashlib
+import json
+import os
+import pickle
+from typing import Dict, Optional
+
+from extractors.skill_matcher import SkillMatcher
+from pipeline.cache import taxonomy_fingerprint
+
+# Bump when SkillMatcher's tables change shape; older artifacts are then rebuilt
+ARTIFACT_VERSION = 1
+
+
+class CompiledTaxonomy:
+    """The skills taxonomy together with its fingerprint and compiled `SkillMatcher`."""
+
+    def __init__(self, skills_taxonomy: Dict, fingerprint: str, matcher: SkillMatcher):
+        self.skills_taxonomy = skills_taxonomy
+        self.fingerprint = fingerprint
+        self.matcher = matcher
+
+
+def load_taxonomy(json_path: str, artifact_path: Optional[str] = None) -> CompiledTaxonomy:
+    """
+    Loads the taxonomy at `json_path`, compiled.
+
+    With an `artifact_path`, the compiled form (normalized variations,
+    automaton tables and fingerprint) is kept there as a versioned pickle
+    tagged with the SHA-256 of the JSON file's bytes. Startup then costs one
+    read of each file and a single `pickle.loads`; the artifact is rebuilt
+    automatically when the JSON changes, the version is bumped or the file
+    is unreadable.
+    """
+    with open(json_path, "rb") as f:
+        raw = f.read()
+    source_hash = hashlib.sha256(raw).hexdigest()
+
+    if artifact_path:
+        compiled = _read_artifact(artifact_path, source_hash)
+        if compiled is not None:
+            return compiled
+
+    skills_taxonomy = json.loads(raw)
+    compiled = CompiledTaxonomy(skills_taxonomy, taxonomy_fingerprint(skills_taxonomy),
+                                SkillMatcher(skills_taxonomy))
+    if artifact_path:
+        try:
+            _write_artifact(artifact_path, source_hash, compiled)
+        except OSError:
+            # e.g. a read-only deployment; compiling on every start still works
+            pass
+    return compiled
+
+
+def _read_artifact(path: str, source_hash: str) -> Optional[CompiledTaxonomy]:
+    try:
+        with open(path, "rb") as f:
+            artifact = pickle.load(f)
+    except Exception:
+        # A cache: whatever a missing, truncated or corrupt file raises, rebuild from the JSON
+        return None
+    if (not isinstance(artifact, dict) or artifact.get("version") != ARTIFACT_VERSION
+            or artifact.get("source_sha256") != source_hash
+            or not isinstance(artifact.get("compiled"), CompiledTaxonomy)):
+        return None
+    return artifact["compiled"]
+
+
+def _write_artifact(path: str, source_hash: str, compiled: CompiledTaxonomy):
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    artifact = {"version": ARTIFACT_VERSION, "source_sha256": source_hash, "compiled": compiled}
+    # Written aside and renamed, so concurrent starts never read half a file
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "wb") as f:
+        pickle.dump(artifact, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp_path, path)
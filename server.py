@@ -0,0 +1,69 @@
+import os
+import json
+import asyncio
+import argparse
+from pathlib import Path
+from pipeline.cache import ParseCache, parser_fingerprint
+from pipeline.http_api import ScreeningAPI
+from pipeline.service import ScreeningService
+from pipeline.taxonomy import load_taxonomy
+
+def main():
+    parser = argparse.ArgumentParser(description="Résumé Screening Service (HTTP API + inbox watcher)")
+    parser.add_argument("--host", type=str, help="Address to listen on (default: service.host)")
+    parser.add_argument("--port", type=int, help="Port to listen on (default: service.port)")
+    parser.add_argument("--inbox", type=str, help="Directory to watch; résumés dropped here are screened as they arrive")
+    parser.add_argument("--jd", type=str, nargs="*", default=[], help="JD files (txt) to register at start-up")
+    parser.add_argument("--workers", type=int, help="Worker processes for parsing (default: service.workers)")
+    parser.add_argument("--poll", type=float, help="Inbox polling interval in seconds")
+    parser.add_argument("--no-cache", action="store_true", help="Disable the parsed resume cache")
+    args = parser.parse_args()
+
+    try:
+        with open('data/config.json', 'r') as f:
+            config = json.load(f)
+        taxonomy = load_taxonomy('data/skills_taxonomy.json', config.get('taxonomy', {}).get('artifact_path'))
+    except FileNotFoundError as e:
+        print(f"Error loading configuration: {e}")
+        return
+
+    options = config.get('service', {})
+    cache = None
+    if not args.no_cache and 'cache' in config:
+        cache = ParseCache(
+            config['cache']['path'],
+            taxonomy.fingerprint,
+            config['cache']['max_size_mb'] * 1024 * 1024,
+            parser_fingerprint(config.get('parsing'))
+        )
+    try:
+        asyncio.run(serve(args, config, options, taxonomy, cache))
+    except KeyboardInterrupt:
+        print("Stopped.")
+
+async def serve(args, config, options, taxonomy, cache):
+    service = ScreeningService(config, taxonomy, args.workers or options.get('workers', 2), cache)
+    try:
+        for path in args.jd:
+            with open(path, 'r', encoding='utf-8') as f:
+                jd = service.add_jd(f.read(), Path(path).stem)
+            print(f"Loaded JD {jd['name']} ({jd['id']})")
+
+        api = ScreeningAPI(service, int(options.get('max_upload_mb', 20) * 1024 * 1024))
+        host = args.host or options.get('host', '127.0.0.1')
+        port = args.port or options.get('port', 8765)
+        server = await api.serve(host, port)
+        print(f"Listening on http://{host}:{port}")
+
+        tasks = [asyncio.create_task(server.serve_forever())]
+        if args.inbox:
+            os.makedirs(args.inbox, exist_ok=True)
+            poll = args.poll or options.get('inbox_poll_seconds', 2)
+            tasks.append(asyncio.create_task(service.watch_inbox(args.inbox, poll)))
+            print(f"Watching {args.inbox} for résumés")
+        await asyncio.gather(*tasks)
+    finally:
+        service.close()
+
+if __name__ == "__main__":
+    main()
@@ -1,16 +1,56 @@
 import firebase_admin
 from firebase_admin import credentials
 from firebase_admin import firestore
-import streamlit as st
+from google.api_core.exceptions import AlreadyExists
 import datetime
+import hashlib
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# Firestore accepts at most 500 writes per batch commit
+MAX_BATCH_WRITES = 500
+
+def invite_id(candidate_name: str, candidate_email: str, job_title: str) -> str:
+    """
+    Deterministic document ID for an invite, used as its idempotency key:
+    the same candidate is never invited twice to the same job, however
+    often a send is retried.
+    """
+    key = "\n".join([candidate_email.strip().lower(), candidate_name.strip(), job_title.strip()])
+    return hashlib.sha256(key.encode("utf-8")).hexdigest()
 
 class EmailClient:
-    def __init__(self, cred_path: str):
-        # Prevent re-initialization error in Streamlit
-        if not firebase_admin._apps:
-            cred = credentials.Certificate(cred_path)
-            firebase_admin.initialize_app(cred)
-        self.db = firestore.client()
+    def __init__(self, cred_path: Optional[str] = None, db=None, max_concurrency: int = 4, metrics=None):
+        """
+        `db` replaces the Firestore client built from `cred_path`, e.g. a client
+        connected to the Firestore emulator or an in-memory fake with the same
+        `collection`/`batch`/`get_all` interface. `max_concurrency` bounds the
+        batch commits in flight during `send_invites`. Each single invite and
+        batch commit is timed under the "email" stage of `metrics` (a
+        `pipeline.metrics.Metrics`) when given.
+        """
+        if db is None:
+            # Prevent re-initialization error in Streamlit
+            if not firebase_admin._apps:
+                cred = credentials.Certificate(cred_path)
+                firebase_admin.initialize_app(cred)
+            db = firestore.client()
+        self.db = db
+        self.max_concurrency = max_concurrency
+        self.metrics = metrics
+
+    def _email_data(self, candidate_name: str, candidate_email: str, job_title: str) -> Dict:
+        # Construct email payload for Firebase Extension
+        return {
+            "to": [candidate_email],
+            "message": {
+                "subject": f"Interview Invitation for {job_title}",
+                "text": f"Dear {candidate_name},\n\nWe were impressed by your profile and would like to invite you for an interview for the {job_title} position.\n\nBest regards,\nRecruitment Team",
+                "html": f"<p>Dear {candidate_name},</p><p>We were impressed by your profile and would like to invite you for an interview for the <strong>{job_title}</strong> position.</p><p>Best regards,<br>Recruitment Team</p>"
+            },
+            "timestamp": datetime.datetime.now()
+        }
 
     def send_invite(self, candidate_name: str, candidate_email: str, job_title: str):
         """
@@ -18,19 +58,92 @@ class EmailClient:
         Assumes 'Trigger Email' extension is installed.
         """
         try:
-            # Construct email payload for Firebase Extension
-            email_data = {
-                "to": [candidate_email],
-                "message": {
-                    "subject": f"Interview Invitation for {job_title}",
-                    "text": f"Dear {candidate_name},\n\nWe were impressed by your profile and would like to invite you for an interview for the {job_title} position.\n\nBest regards,\nRecruitment Team",
-                    "html": f"<p>Dear {candidate_name},</p><p>We were impressed by your profile and would like to invite you for an interview for the <strong>{job_title}</strong> position.</p><p>Best regards,<br>Recruitment Team</p>"
-                },
-                "timestamp": datetime.datetime.now()
-            }
-            
-            # Add to Firestore collection 'mail'
-            self.db.collection("mail").add(email_data)
-            return True, "Email queued successfully via Firebase!"
+            if self._create_invite(candidate_name, candidate_email, job_title):
+                return True, "Email queued successfully via Firebase!"
+            return True, "Invite was already queued for this candidate."
         except Exception as e:
             return False, f"Failed to queue email: {str(e)}"
+
+    def _create_invite(self, candidate_name: str, candidate_email: str, job_title: str) -> bool:
+        """Queues one invite under its idempotency key; False if it was already queued."""
+        start = time.perf_counter()
+        try:
+            self.db.collection("mail").document(invite_id(candidate_name, candidate_email, job_title)).create(
+                self._email_data(candidate_name, candidate_email, job_title)
+            )
+            return True
+        except AlreadyExists:
+            return False
+        finally:
+            self._record(start)
+
+    def _record(self, start: float):
+        if self.metrics is not None:
+            self.metrics.record("email", time.perf_counter() - start)
+
+    def send_invites(self, candidates: Iterable[Tuple[str, str]], job_title: str,
+                     batch_size: int = MAX_BATCH_WRITES) -> List[Dict]:
+        """
+        Queues invites for many `(candidate_name, candidate_email)` pairs in
+        Firestore batch commits of up to `batch_size` writes, with up to
+        `max_concurrency` commits in flight.
+
+        Returns one report per candidate, in input order:
+        `{"name", "email", "status": "queued" | "already_queued" | "failed", "error"?}`.
+        Invites queued by an earlier call are skipped, so a failed run can
+        simply be sent again.
+        """
+        batch_size = min(batch_size, MAX_BATCH_WRITES)
+        invites = []
+        reports = []
+        seen = set()
+        for candidate_name, candidate_email in candidates:
+            doc_id = invite_id(candidate_name, candidate_email, job_title)
+            report = {"name": candidate_name, "email": candidate_email}
+            reports.append(report)
+            if doc_id in seen:
+                report["status"] = "already_queued"
+                continue
+            seen.add(doc_id)
+            invites.append((doc_id, report))
+
+        chunks = [invites[i:i + batch_size] for i in range(0, len(invites), batch_size)]
+        with ThreadPoolExecutor(max_workers=max(1, self.max_concurrency)) as executor:
+            # Reports are filled in place; list() waits for every commit
+            list(executor.map(lambda chunk: self._send_batch(chunk, job_title), chunks))
+        return reports
+
+    def _send_batch(self, chunk: List[Tuple[str, Dict]], job_title: str):
+        mail = self.db.collection("mail")
+        refs = [mail.document(doc_id) for doc_id, _ in chunk]
+        start = time.perf_counter()
+        try:
+            existing = {snapshot.id for snapshot in self.db.get_all(refs) if snapshot.exists}
+            batch = self.db.batch()
+            pending = []
+            for ref, (doc_id, report) in zip(refs, chunk):
+                if doc_id in existing:
+                    report["status"] = "already_queued"
+                    continue
+                batch.create(ref, self._email_data(report["name"], report["email"], job_title))
+                pending.append(report)
+            if pending:
+                batch.commit()
+            self._record(start)
+            for report in pending:
+                report["status"] = "queued"
+        except AlreadyExists:
+            # Another sender queued one of these since the check; the commit is
+            # all-or-nothing, so create the remaining invites one at a time
+            for _, report in chunk:
+                if "status" in report:
+                    continue
+                try:
+                    created = self._create_invite(report["name"], report["email"], job_title)
+                    report["status"] = "queued" if created else "already_queued"
+                except Exception as e:
+                    report.update(status="failed", error=str(e))
+        except Exception as e:
+            for _, report in chunk:
+                if report.get("status") != "already_queued":
+                    report.update(status="failed", error=str(e))
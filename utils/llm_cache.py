@@ -0,0 +1,75 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, List, Optional
+
+
+def prompt_key(model: str, messages: List[Dict[str, str]]) -> str:
+    """
+    Hash of the model and the prompt messages. Whitespace is collapsed first,
+    so prompts that differ only in indentation or line breaks share an entry.
+    """
+    normalized = [(m["role"], " ".join(m["content"].split())) for m in messages]
+    canonical = json.dumps([model, normalized], separators=(",", ":"))
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class ResponseCache:
+    """
+    Persistent cache of LLM responses keyed by `prompt_key`.
+    Entries expire `ttl_seconds` after they were written; expired rows are
+    dropped when the cache is opened and when they are read.
+    """
+
+    def __init__(self, path: str, ttl_seconds: float = 7 * 24 * 3600):
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        # Bulk generation writes from several threads through one connection
+        self.conn = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        self._lock = threading.Lock()
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                response TEXT NOT NULL,
+                created REAL NOT NULL
+            )
+        """)
+        self.conn.execute("CREATE INDEX IF NOT EXISTS idx_responses_created ON responses(created)")
+        self.conn.commit()
+        self.purge_expired()
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT response, created FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            if row[1] < time.time() - self.ttl_seconds:
+                self.conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                self.conn.commit()
+                return None
+        return row[0]
+
+    def put(self, key: str, response: str):
+        with self._lock:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO responses (key, response, created) VALUES (?, ?, ?)",
+                (key, response, time.time()),
+            )
+            self.conn.commit()
+
+    def purge_expired(self):
+        with self._lock:
+            self.conn.execute("DELETE FROM responses WHERE created < ?", (time.time() - self.ttl_seconds,))
+            self.conn.commit()
+
+    def close(self):
+        self.conn.close()
@@ -1,61 +1,137 @@
-import os
-from openai import OpenAI
-import json
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from openai import OpenAI, APIConnectionError, APITimeoutError, InternalServerError, RateLimitError
+
+from utils.llm_cache import ResponseCache, prompt_key
+
+DEFAULT_BASE_URL = "https://openrouter.ai/api/v1"
+DEFAULT_MODEL = "google/gemini-flash-1.5" # Use a cost-effective model
+
+# Transient failures worth another attempt; other API errors are returned as-is
+_RETRYABLE = (APIConnectionError, APITimeoutError, InternalServerError, RateLimitError)
 
 class LLMClient:
-    def __init__(self, api_key: str):
+    def __init__(self, api_key: str, base_url: str = DEFAULT_BASE_URL, model: str = DEFAULT_MODEL,
+                 cache: Optional[ResponseCache] = None, max_concurrency: int = 4,
+                 max_retries: int = 3, backoff_seconds: float = 1.0, metrics=None):
+        """
+        `base_url` can point at any OpenAI-compatible chat-completions endpoint
+        (e.g. a local stub). Responses go through `cache` when given.
+        `max_concurrency` bounds the requests in flight during bulk generation;
+        failed requests are retried `max_retries` times with exponential backoff.
+        Requests that reach the API (not cache hits) are timed under the "llm"
+        stage of `metrics` (a `pipeline.metrics.Metrics`) when given.
+        """
         self.client = OpenAI(
-            base_url="https://openrouter.ai/api/v1",
+            base_url=base_url,
             api_key=api_key,
+            max_retries=0, # retries are handled in `_complete`
         )
+        self.model = model
+        self.cache = cache
+        self.max_concurrency = max_concurrency
+        self.max_retries = max_retries
+        self.backoff_seconds = backoff_seconds
+        self.metrics = metrics
+
+    def _complete(self, system: str, prompt: str) -> str:
+        messages = [
+            {"role": "system", "content": system},
+            {"role": "user", "content": prompt}
+        ]
+        key = prompt_key(self.model, messages)
+        if self.cache:
+            cached = self.cache.get(key)
+            if cached is not None:
+                return cached
+
+        start = time.perf_counter()
+        for attempt in range(self.max_retries + 1):
+            try:
+                response = self.client.chat.completions.create(model=self.model, messages=messages)
+                break
+            except _RETRYABLE as e:
+                if attempt == self.max_retries:
+                    raise
+                time.sleep(self._retry_delay(e, attempt))
+        if self.metrics is not None:
+            # Including retries and backoff: that is what the caller waited for
+            self.metrics.record("llm", time.perf_counter() - start)
+
+        content = response.choices[0].message.content
+        if self.cache and content:
+            self.cache.put(key, content)
+        return content
+
+    def _retry_delay(self, error: Exception, attempt: int) -> float:
+        # Exponential backoff with jitter, or longer if the server asks for it
+        delay = self.backoff_seconds * (2 ** attempt) * random.uniform(0.5, 1.0)
+        response = getattr(error, "response", None)
+        retry_after = response.headers.get("retry-after") if response is not None else None
+        try:
+            return max(delay, float(retry_after))
+        except (TypeError, ValueError):
+            return delay
 
-    def generate_interview_questions(self, candidate_name: str, missing_skills: list, jd_text: str) -> str:
+    def generate_interview_questions(self, missing_skills: list, jd_text: str) -> str:
+        # The prompt depends only on the (sorted) missing skills and the JD, not on
+        # the candidate, so candidates with the same gaps share one cached answer.
         if not missing_skills:
             return "No missing skills identified. Ready for general interview!"
-            
-        skills_str = ", ".join(missing_skills)
+
+        skills_str = ", ".join(sorted(set(missing_skills)))
         prompt = f"""
-        You are an expert technical recruiter. 
-        Candidate Name: {candidate_name}
+        You are an expert technical recruiter.
         Missing Skills: {skills_str}
-        
+
         Job Description:
         {jd_text[:1000]}... (truncated)
-        
+
         Task:
-        Generate 3 specific technical interview questions to test the candidate's knowledge on the missing skills. 
+        Generate 3 specific technical interview questions to test the candidate's knowledge on the missing skills.
         Focus on practical scenarios.
         Output format: Numbered list.
         """
-        
+
         try:
-            response = self.client.chat.completions.create(
-                model="google/gemini-flash-1.5", # Use a cost-effective model
-                messages=[
-                    {"role": "system", "content": "You are a helpful recruitment assistant."},
-                    {"role": "user", "content": prompt}
-                ]
-            )
-            return response.choices[0].message.content
+            return self._complete("You are a helpful recruitment assistant.", prompt)
         except Exception as e:
             return f"Error generating questions: {str(e)}"
 
+    def generate_interview_questions_bulk(self, shortlist: Iterable[Tuple[str, List[str]]],
+                                          jd_text: str) -> Dict[str, str]:
+        """
+        Generates questions for a whole shortlist of `(candidate_name, missing_skills)`
+        at once, returning them by candidate name. Each distinct set of missing
+        skills is requested once, with up to `max_concurrency` requests in flight.
+        """
+        by_skills: Dict[Tuple[str, ...], List[str]] = {}
+        for candidate_name, missing_skills in shortlist:
+            by_skills.setdefault(tuple(sorted(set(missing_skills))), []).append(candidate_name)
+
+        questions = {}
+        with ThreadPoolExecutor(max_workers=max(1, self.max_concurrency)) as executor:
+            futures = {
+                executor.submit(self.generate_interview_questions, list(skills), jd_text): skills
+                for skills in by_skills
+            }
+            for future in as_completed(futures):
+                for candidate_name in by_skills[futures[future]]:
+                    questions[candidate_name] = future.result()
+        return questions
+
     def suggest_improvements(self, resume_text: str, jd_text: str) -> str:
         prompt = f"""
         Analyze this resume against the JD.
         Resume: {resume_text[:2000]}
         JD: {jd_text[:1000]}
-        
+
         Provide 3 concrete bullet points on how the candidate can improve their resume to better match this job.
         """
         try:
-            response = self.client.chat.completions.create(
-                model="google/gemini-flash-1.5",
-                messages=[
-                    {"role": "system", "content": "You are a expert resume coach."},
-                    {"role": "user", "content": prompt}
-                ]
-            )
-            return response.choices[0].message.content
+            return self._complete("You are a expert resume coach.", prompt)
         except Exception as e:
             return f"Error gathering suggestions: {str(e)}"